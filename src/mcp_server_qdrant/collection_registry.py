@@ -0,0 +1,156 @@
+import logging
+import time
+
+import grpc
+from pydantic import BaseModel, Field
+from qdrant_client import AsyncQdrantClient, models
+from qdrant_client.http.exceptions import UnexpectedResponse
+
+logger = logging.getLogger(__name__)
+
+# Key used in `CollectionMetadata.vectors` for the single unnamed vector of a collection
+UNNAMED_VECTOR = ""
+
+
+def is_not_found_error(error: Exception) -> bool:
+    """
+    Check whether an error raised by the Qdrant client means that the collection does not exist.
+    Remote Qdrant answers with a 404 over REST and a `NOT_FOUND` status over gRPC, while the local
+    mode raises a `ValueError`.
+    """
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code == 404
+    if isinstance(error, grpc.RpcError):
+        # Only the errors of completed calls, like `grpc.aio.AioRpcError`, have a status code
+        code = getattr(error, "code", None)
+        return callable(code) and code() == grpc.StatusCode.NOT_FOUND
+    if isinstance(error, ValueError):
+        return "not found" in str(error).lower()
+    return False
+
+
+class CollectionMetadata(BaseModel):
+    """
+    Cached description of a Qdrant collection.
+    """
+
+    exists: bool
+    uses_unnamed_vectors: bool = False
+    vectors: dict[str, models.VectorParams] = Field(default_factory=dict)
+    sparse_vectors: dict[str, models.SparseVectorParams] = Field(default_factory=dict)
+    payload_indexes: dict[str, models.PayloadSchemaType | None] = Field(
+        default_factory=dict
+    )
+    # Name of the payload format, detected from one point on the first search, None until known
+    payload_format: str | None = None
+    fetched_at: float = Field(default_factory=lambda: time.monotonic())
+
+    def vector_params(self, vector_name: str) -> models.VectorParams | None:
+        """
+        Get the parameters of the vector used by the given vector name.
+        :param vector_name: The name of the vector, ignored for collections with an unnamed vector.
+        :return: The vector parameters, or None if the collection has no such vector.
+        """
+        if self.uses_unnamed_vectors:
+            return self.vectors.get(UNNAMED_VECTOR)
+        return self.vectors.get(vector_name)
+
+
+class CollectionRegistry:
+    """
+    Caches the vector configuration and payload indexes of existing collections, so that
+    the hot paths do not need extra round trips to Qdrant. Entries are refreshed after `ttl`
+    seconds, or explicitly with `invalidate` when an operation reports a missing collection.
+    Missing collections are not cached, so that a collection created by another process or
+    connector is seen by the next lookup.
+    :param client: The Qdrant client used to fetch collection information.
+    :param ttl: Time to live of the cached metadata in seconds. If not provided, entries never expire.
+    """
+
+    def __init__(self, client: AsyncQdrantClient, ttl: float | None = 60.0):
+        self._client = client
+        self._ttl = ttl
+        self._metadata: dict[str, CollectionMetadata] = {}
+
+    def _is_fresh(self, metadata: CollectionMetadata) -> bool:
+        return self._ttl is None or time.monotonic() - metadata.fetched_at < self._ttl
+
+    async def get(self, collection_name: str) -> CollectionMetadata:
+        """
+        Get the metadata of a collection, fetching it from Qdrant if it is not cached or expired.
+        :param collection_name: The name of the collection.
+        :return: The metadata of the collection.
+        """
+        metadata = self._metadata.get(collection_name)
+        if metadata is not None and self._is_fresh(metadata):
+            return metadata
+        return await self.refresh(collection_name)
+
+    async def refresh(self, collection_name: str) -> CollectionMetadata:
+        """
+        Fetch the metadata of a collection from Qdrant and cache it if the collection exists.
+        :param collection_name: The name of the collection.
+        :return: The metadata of the collection.
+        """
+        try:
+            info = await self._client.get_collection(collection_name)
+        except Exception as e:
+            if not is_not_found_error(e):
+                raise
+            self._metadata.pop(collection_name, None)
+            return CollectionMetadata(exists=False)
+        else:
+            metadata = self._from_info(info)
+            previous = self._metadata.get(collection_name)
+            if previous is not None and previous.exists:
+                # The format of the points is not part of the collection info, keep the detected one
+                metadata.payload_format = previous.payload_format
+            logger.info(
+                f"Collection '{collection_name}' uses "
+                f"{'unnamed' if metadata.uses_unnamed_vectors else 'named'} vectors"
+            )
+
+        self._metadata[collection_name] = metadata
+        return metadata
+
+    @staticmethod
+    def _from_info(info: models.CollectionInfo) -> CollectionMetadata:
+        vectors_config = info.config.params.vectors
+        # If vectors is a VectorParams object directly (not dict), it's unnamed
+        # If vectors is a dict, it has named vectors
+        if isinstance(vectors_config, dict):
+            uses_unnamed = False
+            vectors = dict(vectors_config)
+        else:
+            uses_unnamed = True
+            vectors = {UNNAMED_VECTOR: vectors_config} if vectors_config else {}
+
+        payload_indexes = {
+            field_name: index_info.data_type
+            for field_name, index_info in (info.payload_schema or {}).items()
+        }
+        return CollectionMetadata(
+            exists=True,
+            uses_unnamed_vectors=uses_unnamed,
+            vectors=vectors,
+            sparse_vectors=dict(info.config.params.sparse_vectors or {}),
+            payload_indexes=payload_indexes,
+        )
+
+    def register(self, collection_name: str, metadata: CollectionMetadata):
+        """
+        Cache the metadata of a collection known without asking Qdrant, e.g. one that was just created.
+        :param collection_name: The name of the collection.
+        :param metadata: The metadata of the collection.
+        """
+        self._metadata[collection_name] = metadata
+
+    def invalidate(self, collection_name: str | None = None):
+        """
+        Drop the cached metadata of a collection, or of all collections if no name is given.
+        :param collection_name: The name of the collection, optional.
+        """
+        if collection_name is None:
+            self._metadata.clear()
+        else:
+            self._metadata.pop(collection_name, None)
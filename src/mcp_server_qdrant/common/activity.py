@@ -0,0 +1,42 @@
+import asyncio
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class ForegroundActivity:
+    """
+    Counts the requests a user is waiting for, like searches, so that background work such as
+    re-indexing can hold back while they run. Only used from the event loop, so no locking is needed.
+    """
+
+    def __init__(self):
+        self.active = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Count a foreground request while the block runs."""
+        self.active += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self.active -= 1
+            if self.active == 0:
+                self._idle.set()
+
+    async def wait_idle(self, max_wait: float | None = None) -> bool:
+        """
+        Wait until no foreground request is running.
+        :param max_wait: The maximum time to wait in seconds, so that a steady stream of requests
+                         never starves the background work. If None, waits as long as needed.
+        :return: True if no request is running, False if the maximum time elapsed first.
+        """
+        if self.active == 0:
+            return True
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=max_wait)
+        except asyncio.TimeoutError:
+            return False
+        return True
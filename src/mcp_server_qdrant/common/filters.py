@@ -1,175 +1,156 @@
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable, Hashable
 
 from qdrant_client import models
 
-from mcp_server_qdrant.qdrant import ArbitraryFilter
+from mcp_server_qdrant.entry import ArbitraryFilter
 from mcp_server_qdrant.settings import METADATA_PATH, FilterableField
 
 
-def make_filter(
-    filterable_fields: dict[str, FilterableField], values: dict[str, Any]
-) -> ArbitraryFilter:
-    must_conditions = []
-    must_not_conditions = []
-
-    for raw_field_name, field_value in values.items():
-        if raw_field_name not in filterable_fields:
-            raise ValueError(f"Field {raw_field_name} is not a filterable field")
-
-        field = filterable_fields[raw_field_name]
-
-        if field_value is None:
-            if field.required:
-                raise ValueError(f"Field {raw_field_name} is required")
-            else:
+ConditionFactory = Callable[[str, Any], models.FieldCondition]
+# Builds the condition of a field from its value, and tells whether it goes into `must_not`
+FieldConditionBuilder = Callable[[Any], tuple[bool, models.FieldCondition]]
+
+
+def _match_value(key: str, value: Any) -> models.FieldCondition:
+    return models.FieldCondition(key=key, match=models.MatchValue(value=value))
+
+
+def _match_any(key: str, value: Any) -> models.FieldCondition:
+    return models.FieldCondition(key=key, match=models.MatchAny(any=value))
+
+
+def _match_except(key: str, value: Any) -> models.FieldCondition:
+    return models.FieldCondition(key=key, match=models.MatchExcept(**{"except": value}))
+
+
+def _range(bound: str) -> ConditionFactory:
+    def make_range(key: str, value: Any) -> models.FieldCondition:
+        return models.FieldCondition(key=key, range=models.Range(**{bound: value}))
+
+    return make_range
+
+
+# Condition factories and whether they are negated, per condition
+_CONDITIONS: dict[str, tuple[ConditionFactory, bool]] = {
+    "==": (_match_value, False),
+    "!=": (_match_value, True),
+    ">": (_range("gt"), False),
+    ">=": (_range("gte"), False),
+    "<": (_range("lt"), False),
+    "<=": (_range("lte"), False),
+    "any": (_match_any, False),
+    "except": (_match_except, False),
+}
+
+# Conditions supported by each field type
+_FIELD_TYPE_CONDITIONS: dict[str, set[str]] = {
+    "keyword": {"==", "!=", "any", "except"},
+    "integer": {"==", "!=", ">", ">=", "<", "<=", "any", "except"},
+    # For float values, we only support range comparisons
+    "float": {">", ">=", "<", "<="},
+    "boolean": {"==", "!="},
+}
+
+
+def compile_field(field: FilterableField) -> FieldConditionBuilder | None:
+    """
+    Resolve the type and condition of a filterable field once, into a function building its condition.
+    :param field: The filterable field.
+    :return: The condition builder, or None if the field has no condition.
+    """
+    field_name = f"{METADATA_PATH}.{field.name}"
+    if field.field_type not in _FIELD_TYPE_CONDITIONS:
+        raise ValueError(
+            f"Unsupported field type {field.field_type} for field {field_name}"
+        )
+    if field.condition is None:
+        return None
+    if field.condition not in _FIELD_TYPE_CONDITIONS[field.field_type]:
+        message = f"Invalid condition {field.condition} for {field.field_type} field {field_name}"
+        if field.field_type == "float":
+            message += ". Only range comparisons (>, >=, <, <=) are supported for float values."
+        raise ValueError(message)
+
+    factory, negated = _CONDITIONS[field.condition]
+
+    def build(value: Any) -> tuple[bool, models.FieldCondition]:
+        return negated, factory(field_name, value)
+
+    return build
+
+
+def _freeze(value: Any) -> Hashable:
+    return tuple(value) if isinstance(value, list) else value
+
+
+class FilterBuilder:
+    """
+    Builds Qdrant filters from the values of the filterable fields exposed by the tools.
+    The fields are compiled once, and the filters of recent value sets are memoized, so
+    repeated searches reuse the same filter object. Filters must not be modified.
+    :param filterable_fields: The filterable fields, by name.
+    :param cache_size: The number of memoized filters.
+    """
+
+    def __init__(self, filterable_fields: dict[str, FilterableField], cache_size: int = 256):
+        self._fields = filterable_fields
+        self._builders = {
+            name: compile_field(field) for name, field in filterable_fields.items()
+        }
+        self._build_cached = lru_cache(maxsize=cache_size)(self._build)
+
+    def build(self, values: dict[str, Any]) -> models.Filter | None:
+        """
+        Build the filter matching the given field values.
+        :param values: The values of the filterable fields. None values are ignored.
+        :return: The filter, or None if no value is set.
+        """
+        for name, value in values.items():
+            field = self._fields.get(name)
+            if field is None:
+                raise ValueError(f"Field {name} is not a filterable field")
+            if value is None and field.required:
+                raise ValueError(f"Field {name} is required")
+
+        key = tuple(
+            (name, _freeze(value)) for name, value in values.items() if value is not None
+        )
+        try:
+            return self._build_cached(key)
+        except TypeError:
+            # Unhashable values, e.g. nested lists, are not memoized
+            return self._build(key)
+
+    def _build(self, key: tuple[tuple[str, Any], ...]) -> models.Filter | None:
+        must = []
+        must_not = []
+        for name, value in key:
+            builder = self._builders[name]
+            if builder is None:
                 continue
+            negated, condition = builder(list(value) if isinstance(value, tuple) else value)
+            (must_not if negated else must).append(condition)
+        if not must and not must_not:
+            return None
+        return models.Filter(must=must, must_not=must_not)
 
-        field_name = f"{METADATA_PATH}.{raw_field_name}"
+    def cache_info(self):
+        """Get the hit and miss counters of the memoized filters."""
+        return self._build_cached.cache_info()
 
-        if field.field_type == "keyword":
-            if field.condition == "==":
-                must_conditions.append(
-                    models.FieldCondition(
-                        key=field_name, match=models.MatchValue(value=field_value)
-                    )
-                )
-            elif field.condition == "!=":
-                must_not_conditions.append(
-                    models.FieldCondition(
-                        key=field_name, match=models.MatchValue(value=field_value)
-                    )
-                )
-            elif field.condition == "any":
-                must_conditions.append(
-                    models.FieldCondition(
-                        key=field_name, match=models.MatchAny(any=field_value)
-                    )
-                )
-            elif field.condition == "except":
-                must_conditions.append(
-                    models.FieldCondition(
-                        key=field_name,
-                        match=models.MatchExcept(**{"except": field_value}),
-                    )
-                )
-            elif field.condition is not None:
-                raise ValueError(
-                    f"Invalid condition {field.condition} for keyword field {field_name}"
-                )
-
-        elif field.field_type == "integer":
-            if field.condition == "==":
-                must_conditions.append(
-                    models.FieldCondition(
-                        key=field_name, match=models.MatchValue(value=field_value)
-                    )
-                )
-            elif field.condition == "!=":
-                must_not_conditions.append(
-                    models.FieldCondition(
-                        key=field_name, match=models.MatchValue(value=field_value)
-                    )
-                )
-            elif field.condition == ">":
-                must_conditions.append(
-                    models.FieldCondition(
-                        key=field_name, range=models.Range(gt=field_value)
-                    )
-                )
-            elif field.condition == ">=":
-                must_conditions.append(
-                    models.FieldCondition(
-                        key=field_name, range=models.Range(gte=field_value)
-                    )
-                )
-            elif field.condition == "<":
-                must_conditions.append(
-                    models.FieldCondition(
-                        key=field_name, range=models.Range(lt=field_value)
-                    )
-                )
-            elif field.condition == "<=":
-                must_conditions.append(
-                    models.FieldCondition(
-                        key=field_name, range=models.Range(lte=field_value)
-                    )
-                )
-            elif field.condition == "any":
-                must_conditions.append(
-                    models.FieldCondition(
-                        key=field_name, match=models.MatchAny(any=field_value)
-                    )
-                )
-            elif field.condition == "except":
-                must_conditions.append(
-                    models.FieldCondition(
-                        key=field_name,
-                        match=models.MatchExcept(**{"except": field_value}),
-                    )
-                )
-            elif field.condition is not None:
-                raise ValueError(
-                    f"Invalid condition {field.condition} for integer field {field_name}"
-                )
-
-        elif field.field_type == "float":
-            # For float values, we only support range comparisons
-            if field.condition == ">":
-                must_conditions.append(
-                    models.FieldCondition(
-                        key=field_name, range=models.Range(gt=field_value)
-                    )
-                )
-            elif field.condition == ">=":
-                must_conditions.append(
-                    models.FieldCondition(
-                        key=field_name, range=models.Range(gte=field_value)
-                    )
-                )
-            elif field.condition == "<":
-                must_conditions.append(
-                    models.FieldCondition(
-                        key=field_name, range=models.Range(lt=field_value)
-                    )
-                )
-            elif field.condition == "<=":
-                must_conditions.append(
-                    models.FieldCondition(
-                        key=field_name, range=models.Range(lte=field_value)
-                    )
-                )
-            elif field.condition is not None:
-                raise ValueError(
-                    f"Invalid condition {field.condition} for float field {field_name}. "
-                    "Only range comparisons (>, >=, <, <=) are supported for float values."
-                )
 
-        elif field.field_type == "boolean":
-            if field.condition == "==":
-                must_conditions.append(
-                    models.FieldCondition(
-                        key=field_name, match=models.MatchValue(value=field_value)
-                    )
-                )
-            elif field.condition == "!=":
-                must_not_conditions.append(
-                    models.FieldCondition(
-                        key=field_name, match=models.MatchValue(value=field_value)
-                    )
-                )
-            elif field.condition is not None:
-                raise ValueError(
-                    f"Invalid condition {field.condition} for boolean field {field_name}"
-                )
-
-        else:
-            raise ValueError(
-                f"Unsupported field type {field.field_type} for field {field_name}"
-            )
-
-    return models.Filter(
-        must=must_conditions, must_not=must_not_conditions
-    ).model_dump()
+def make_filter(
+    filterable_fields: dict[str, FilterableField], values: dict[str, Any]
+) -> ArbitraryFilter:
+    """
+    Build the filter matching the given field values, as a dictionary. Prefer a `FilterBuilder`,
+    which compiles the fields once and returns `models.Filter` objects.
+    """
+    query_filter = FilterBuilder(filterable_fields, cache_size=0).build(values)
+    if query_filter is None:
+        return models.Filter(must=[], must_not=[]).model_dump()
+    return query_filter.model_dump()
 
 
 def make_indexes(
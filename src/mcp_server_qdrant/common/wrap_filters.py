@@ -4,16 +4,22 @@ from typing import Annotated, Callable, Optional
 
 from pydantic import Field
 
-from mcp_server_qdrant.common.filters import make_filter
+from mcp_server_qdrant.common.filters import FilterBuilder
 from mcp_server_qdrant.settings import FilterableField
 
 
 def wrap_filters(
-    original_func: Callable, filterable_fields: dict[str, FilterableField]
+    original_func: Callable,
+    filterable_fields: dict[str, FilterableField],
+    filter_builder: FilterBuilder | None = None,
 ) -> Callable:
     """
     Wraps the original_func function: replaces `filter` parameter with multiple parameters defined by `filterable_fields`.
+    The original function receives a `models.Filter`, or None if no filter value is set.
+    :param filter_builder: The builder of the filters, shared between wrapped functions. If not provided,
+                           the fields are compiled into a new builder.
     """
+    filter_builder = filter_builder or FilterBuilder(filterable_fields)
 
     sig = inspect.signature(original_func)
     is_async = inspect.iscoroutinefunction(original_func)
@@ -28,7 +34,7 @@ def wrap_filters(
                 if field_name in kwargs:
                     filter_values[field_name] = kwargs.pop(field_name)
 
-            query_filter = make_filter(filterable_fields, filter_values)
+            query_filter = filter_builder.build(filter_values)
 
             return await original_func(**kwargs, query_filter=query_filter)
         
@@ -43,7 +49,7 @@ def wrap_filters(
                 if field_name in kwargs:
                     filter_values[field_name] = kwargs.pop(field_name)
 
-            query_filter = make_filter(filterable_fields, filter_values)
+            query_filter = filter_builder.build(filter_values)
 
             return original_func(**kwargs, query_filter=query_filter)
         
@@ -1,4 +1,10 @@
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from qdrant_client import models
 
 
 class EmbeddingProvider(ABC):
@@ -14,6 +20,21 @@ class EmbeddingProvider(ABC):
         """Embed a query into a vector."""
         pass
 
+    async def embed_documents_array(self, documents: list[str]) -> np.ndarray:
+        """
+        Embed a list of documents into a contiguous float32 array of shape (len(documents), size).
+        Providers producing arrays natively should override it, to avoid materialising Python floats.
+        """
+        embeddings = await self.embed_documents(documents)
+        return np.asarray(embeddings, dtype=np.float32).reshape(len(documents), -1)
+
+    async def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """
+        Embed a list of queries into vectors. Providers able to embed several
+        queries in a single call should override it.
+        """
+        return [await self.embed_query(query) for query in queries]
+
     @abstractmethod
     def get_vector_name(self) -> str:
         """Get the name of the vector for the Qdrant collection."""
@@ -23,3 +44,32 @@ class EmbeddingProvider(ABC):
     def get_vector_size(self) -> int:
         """Get the size of the vector for the Qdrant collection."""
         pass
+
+
+class SparseEmbeddingProvider(ABC):
+    """
+    Abstract base class for sparse embedding providers, used alongside a dense provider
+    for hybrid search. Sparse vectors capture exact terms, like code identifiers.
+    """
+
+    @abstractmethod
+    async def embed_documents(self, documents: list[str]) -> list["models.SparseVector"]:
+        """Embed a list of documents into sparse vectors."""
+        pass
+
+    @abstractmethod
+    async def embed_queries(self, queries: list[str]) -> list["models.SparseVector"]:
+        """Embed a list of queries into sparse vectors."""
+        pass
+
+    @abstractmethod
+    def get_vector_name(self) -> str:
+        """Get the name of the sparse vector for the Qdrant collection."""
+        pass
+
+    def get_modifier(self) -> "models.Modifier | None":
+        """
+        Get the modifier Qdrant applies to the sparse vector, e.g. IDF for BM25 which
+        only stores term frequencies.
+        """
+        return None
@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable
+
+import numpy as np
+
+from mcp_server_qdrant.embeddings.base import EmbeddingProvider
+from mcp_server_qdrant.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class MicroBatcher:
+    """
+    Collects texts submitted concurrently and embeds them in a single call. A batch is sent
+    once it holds `max_batch_size` texts or `max_wait` seconds after its first text arrived,
+    whichever happens first. Each caller receives the vectors of its own texts.
+    :param embed: The function embedding a batch of texts.
+    :param max_batch_size: The number of texts that triggers an immediate flush.
+    :param max_wait: The maximum time in seconds a text waits for other texts to join its batch.
+    :param name: The name of the batcher, used in the names of its histograms.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[list[str]], Awaitable[list[list[float]]]],
+        max_batch_size: int,
+        max_wait: float,
+        name: str,
+    ):
+        self._embed = embed
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._pending: list[tuple[list[str], asyncio.Future, float]] = []
+        self._pending_count = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+        self.batch_size = Histogram(
+            f"{name}_batch_size", "Number of texts per embedding batch", BATCH_SIZE_BUCKETS
+        )
+        self.queue_latency = Histogram(
+            f"{name}_queue_seconds", "Time texts wait for their batch to be sent"
+        )
+        self.embed_latency = Histogram(
+            f"{name}_embed_seconds", "Time spent embedding a batch"
+        )
+
+    async def submit(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed the texts as part of the next batch.
+        :param texts: The texts to embed.
+        :return: The vectors of the texts, in the same order.
+        """
+        if not texts:
+            return []
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((texts, future, time.perf_counter()))
+        self._pending_count += len(texts)
+
+        if self._pending_count >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch = self._pending
+        self._pending = []
+        self._pending_count = 0
+        task = asyncio.create_task(self._run(batch))
+        # Keep a reference, so that the task is not garbage collected while running
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[list[str], asyncio.Future, float]]):
+        texts = [text for request_texts, _, _ in batch for text in request_texts]
+        started = time.perf_counter()
+        for _, _, submitted in batch:
+            self.queue_latency.observe(started - submitted)
+        self.batch_size.observe(len(texts))
+
+        try:
+            vectors = await self._embed(texts)
+        except asyncio.CancelledError:
+            # E.g. on shutdown, the callers would otherwise wait for the batch forever
+            for _, future, _ in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self.embed_latency.observe(time.perf_counter() - started)
+
+        offset = 0
+        for request_texts, future, _ in batch:
+            # The caller may have been cancelled while waiting
+            if not future.done():
+                future.set_result(vectors[offset : offset + len(request_texts)])
+            offset += len(request_texts)
+
+    def histograms(self) -> list[Histogram]:
+        return [self.batch_size, self.queue_latency, self.embed_latency]
+
+
+class BatchingEmbeddingProvider(EmbeddingProvider):
+    """
+    Wraps another embedding provider and merges concurrent embedding requests into batches,
+    which is much cheaper for both local ONNX inference and remote embedding APIs.
+    Queries and documents are batched separately, as models may embed them differently.
+    :param provider: The embedding provider to wrap.
+    :param max_batch_size: The number of texts that triggers an immediate flush of a batch.
+    :param max_wait_ms: The maximum time in milliseconds a text waits for other texts to join its batch.
+    """
+
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ):
+        if max_batch_size < 1:
+            raise ValueError(f"Batch size must be positive, got {max_batch_size}")
+        self.provider = provider
+        self.query_batcher = MicroBatcher(
+            provider.embed_queries,
+            max_batch_size,
+            max_wait_ms / 1000,
+            name="embedding_query",
+        )
+        self.document_batcher = MicroBatcher(
+            provider.embed_documents,
+            max_batch_size,
+            max_wait_ms / 1000,
+            name="embedding_document",
+        )
+
+    @property
+    def model_name(self) -> str:
+        """The name of the wrapped model."""
+        return getattr(self.provider, "model_name", type(self.provider).__name__)
+
+    async def embed_documents(self, documents: list[str]) -> list[list[float]]:
+        """Embed a list of documents into vectors, as part of a batch."""
+        return await self.document_batcher.submit(documents)
+
+    async def embed_documents_array(self, documents: list[str]) -> np.ndarray:
+        """
+        Embed a list of documents into a float32 array. Array requests come from bulk
+        operations that are batches already, so they skip the batcher.
+        """
+        return await self.provider.embed_documents_array(documents)
+
+    async def embed_query(self, query: str) -> list[float]:
+        """Embed a query into a vector, as part of a batch."""
+        embeddings = await self.query_batcher.submit([query])
+        return embeddings[0]
+
+    async def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """Embed a list of queries into vectors, as part of a batch."""
+        return await self.query_batcher.submit(queries)
+
+    def get_vector_name(self) -> str:
+        """Get the name of the vector for the Qdrant collection."""
+        return self.provider.get_vector_name()
+
+    def get_vector_size(self) -> int:
+        """Get the size of the vector for the Qdrant collection."""
+        return self.provider.get_vector_size()
+
+    def histograms(self) -> list[Histogram]:
+        """Get the batch size and latency histograms of both batchers."""
+        return self.query_batcher.histograms() + self.document_batcher.histograms()
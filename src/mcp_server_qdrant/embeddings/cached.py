@@ -0,0 +1,112 @@
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from mcp_server_qdrant.embeddings.base import EmbeddingProvider
+
+
+class CachedEmbeddingProvider(EmbeddingProvider):
+    """
+    Wraps another embedding provider and caches the query embeddings it returns.
+    The cache is bounded, evicts the least recently used queries first and
+    optionally expires entries after a given time.
+    :param provider: The embedding provider to wrap.
+    :param max_size: The maximum number of cached query embeddings.
+    :param ttl: Time to live of a cached embedding in seconds. If not provided, entries never expire.
+    """
+
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        max_size: int = 1024,
+        ttl: float | None = None,
+    ):
+        if max_size < 1:
+            raise ValueError(f"Cache size must be positive, got {max_size}")
+        self.provider = provider
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[tuple[str, str, str], tuple[float, list[float]]] = (
+            OrderedDict()
+        )
+
+    @property
+    def model_name(self) -> str:
+        """The name of the wrapped model."""
+        return getattr(self.provider, "model_name", type(self.provider).__name__)
+
+    def _cache_key(self, query: str) -> tuple[str, str, str]:
+        # Model and vector names are part of the key, so that swapping the wrapped
+        # model never returns vectors of another embedding space.
+        return self.model_name, self.provider.get_vector_name(), query
+
+    async def embed_documents(self, documents: list[str]) -> list[list[float]]:
+        """Embed a list of documents into vectors. Documents are not cached."""
+        return await self.provider.embed_documents(documents)
+
+    async def embed_documents_array(self, documents: list[str]) -> np.ndarray:
+        """Embed a list of documents into a float32 array. Documents are not cached."""
+        return await self.provider.embed_documents_array(documents)
+
+    def _lookup(self, key: tuple[str, str, str]) -> list[float] | None:
+        cached = self._cache.get(key)
+        if cached is not None:
+            created_at, embedding = cached
+            if self.ttl is None or time.monotonic() - created_at < self.ttl:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return embedding
+            del self._cache[key]
+        self.misses += 1
+        return None
+
+    def _remember(self, key: tuple[str, str, str], embedding: list[float]):
+        self._cache[key] = (time.monotonic(), embedding)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    async def embed_query(self, query: str) -> list[float]:
+        """Embed a query into a vector, reusing a cached vector if available."""
+        key = self._cache_key(query)
+        embedding = self._lookup(key)
+        if embedding is None:
+            embedding = await self.provider.embed_query(query)
+            self._remember(key, embedding)
+        return embedding
+
+    async def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """Embed a list of queries into vectors, only sending the uncached ones to the provider."""
+        keys = [self._cache_key(query) for query in queries]
+        embeddings = [self._lookup(key) for key in keys]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            computed = await self.provider.embed_queries([queries[i] for i in missing])
+            for i, embedding in zip(missing, computed):
+                embeddings[i] = embedding
+                self._remember(keys[i], embedding)
+        return embeddings  # type: ignore[return-value]
+
+    def get_vector_name(self) -> str:
+        """Get the name of the vector for the Qdrant collection."""
+        return self.provider.get_vector_name()
+
+    def get_vector_size(self) -> int:
+        """Get the size of the vector for the Qdrant collection."""
+        return self.provider.get_vector_size()
+
+    def cache_info(self) -> dict[str, int]:
+        """Get the hit and miss counters and the current size of the cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._cache),
+            "max_size": self.max_size,
+        }
+
+    def clear_cache(self):
+        """Drop all the cached embeddings."""
+        self._cache.clear()
@@ -0,0 +1,300 @@
+import argparse
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from mcp_server_qdrant.embeddings.base import EmbeddingProvider
+
+logger = logging.getLogger(__name__)
+
+# SQLite limits the number of host parameters in a single statement
+_MAX_QUERY_PARAMS = 500
+
+
+def content_hash(text: str) -> bytes:
+    """Hash the text of a document, used as the cache key together with the model name."""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class EmbeddingDiskCache:
+    """
+    Persistent store of document embeddings in a local SQLite database.
+    Vectors are stored as float32 blobs keyed by model name and content hash. When the
+    total size of the stored vectors exceeds `max_size_bytes`, the least recently used
+    vectors are evicted.
+    :param path: The path to the SQLite database file. Parent directories are created if needed.
+    :param max_size_bytes: The maximum total size of the stored vectors, in bytes.
+    """
+
+    def __init__(self, path: str, max_size_bytes: int = 1024 * 1024 * 1024):
+        self.path = path
+        self.max_size_bytes = max_size_bytes
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # Accessed from the executor threads, serialised by the lock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " model TEXT NOT NULL,"
+            " content_hash BLOB NOT NULL,"
+            " vector BLOB NOT NULL,"
+            " last_access REAL NOT NULL,"
+            " PRIMARY KEY (model, content_hash))"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS embeddings_last_access ON embeddings (last_access)"
+        )
+        self._connection.commit()
+        self._size_bytes = self._compute_size()
+
+    def _compute_size(self) -> int:
+        row = self._connection.execute(
+            "SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+        ).fetchone()
+        return int(row[0])
+
+    def get_many(self, model: str, hashes: list[bytes]) -> dict[bytes, np.ndarray]:
+        """
+        Get the cached vectors for the given content hashes.
+        :param model: The name of the model the vectors were produced with.
+        :param hashes: The content hashes to look up.
+        :return: A mapping from content hash to float32 vector, containing only the cache hits.
+        """
+        found: dict[bytes, np.ndarray] = {}
+        unique_hashes = list(dict.fromkeys(hashes))
+        with self._lock:
+            for start in range(0, len(unique_hashes), _MAX_QUERY_PARAMS):
+                chunk = unique_hashes[start : start + _MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT content_hash, vector FROM embeddings "
+                    f"WHERE model = ? AND content_hash IN ({placeholders})",
+                    [model, *chunk],
+                ).fetchall()
+                for key, blob in rows:
+                    found[bytes(key)] = np.frombuffer(blob, dtype=np.float32)
+
+            if found:
+                now = time.time()
+                self._connection.executemany(
+                    "UPDATE embeddings SET last_access = ? WHERE model = ? AND content_hash = ?",
+                    [(now, model, key) for key in found],
+                )
+                self._connection.commit()
+        return found
+
+    def put_many(self, model: str, items: dict[bytes, list[float] | np.ndarray]):
+        """
+        Store vectors in the cache and evict the least recently used ones if the cache is full.
+        :param model: The name of the model the vectors were produced with.
+        :param items: A mapping from content hash to vector.
+        """
+        if not items:
+            return
+        now = time.time()
+        rows = [
+            (model, key, np.asarray(vector, dtype=np.float32).tobytes(), now)
+            for key, vector in items.items()
+        ]
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, content_hash, vector, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._connection.commit()
+            # Only cache misses are stored, so replaced rows are rare and the running
+            # total may only overestimate the size until the next prune.
+            self._size_bytes += sum(len(row[2]) for row in rows)
+            if self._size_bytes > self.max_size_bytes:
+                self._evict(self.max_size_bytes)
+
+    def prune(self, max_size_bytes: int | None = None) -> int:
+        """
+        Evict the least recently used vectors until the cache fits in the given size.
+        :param max_size_bytes: The target size, in bytes. If not provided, the configured maximum is used.
+        :return: The number of evicted vectors.
+        """
+        with self._lock:
+            self._size_bytes = self._compute_size()
+            return self._evict(
+                self.max_size_bytes if max_size_bytes is None else max_size_bytes
+            )
+
+    def _evict(self, target_bytes: int) -> int:
+        excess = self._size_bytes - target_bytes
+        if excess <= 0:
+            return 0
+
+        evicted = []
+        freed = 0
+        cursor = self._connection.execute(
+            "SELECT rowid, LENGTH(vector) FROM embeddings ORDER BY last_access"
+        )
+        for rowid, size in cursor:
+            evicted.append((rowid,))
+            freed += size
+            if freed >= excess:
+                break
+        cursor.close()
+
+        self._connection.executemany("DELETE FROM embeddings WHERE rowid = ?", evicted)
+        self._connection.commit()
+        self._size_bytes -= freed
+        logger.info(f"Evicted {len(evicted)} vectors ({freed} bytes) from {self.path}")
+        return len(evicted)
+
+    def clear(self):
+        """Remove all the cached vectors."""
+        with self._lock:
+            self._connection.execute("DELETE FROM embeddings")
+            self._connection.commit()
+            self._connection.execute("VACUUM")
+            self._size_bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        """Get the number of cached vectors and their total size in bytes."""
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM embeddings"
+            ).fetchone()
+        return {
+            "count": int(count),
+            "size_bytes": self._size_bytes,
+            "max_size_bytes": self.max_size_bytes,
+        }
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+class DiskCachedEmbeddingProvider(EmbeddingProvider):
+    """
+    Wraps another embedding provider and persists the document embeddings it returns.
+    Only the documents missing from the cache are sent to the wrapped provider.
+    :param provider: The embedding provider to wrap.
+    :param cache: The on-disk cache to use.
+    """
+
+    def __init__(self, provider: EmbeddingProvider, cache: EmbeddingDiskCache):
+        self.provider = provider
+        self.cache = cache
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def model_name(self) -> str:
+        """The name of the wrapped model."""
+        return getattr(self.provider, "model_name", type(self.provider).__name__)
+
+    def _model_key(self) -> str:
+        return f"{self.model_name}:{self.provider.get_vector_name()}"
+
+    async def embed_documents(self, documents: list[str]) -> list[list[float]]:
+        """Embed a list of documents into vectors, reusing the cached vectors."""
+        embeddings = await self.embed_documents_array(documents)
+        return embeddings.tolist()
+
+    async def embed_documents_array(self, documents: list[str]) -> np.ndarray:
+        """Embed a list of documents into a float32 array, reusing the cached vectors."""
+        model = self._model_key()
+        hashes = [content_hash(document) for document in documents]
+        cached = await asyncio.to_thread(self.cache.get_many, model, hashes)
+
+        # Each distinct missing document is embedded only once
+        missing: dict[bytes, str] = {}
+        for key, document in zip(hashes, documents):
+            if key not in cached and key not in missing:
+                missing[key] = document
+
+        self.hits += len(documents) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            embeddings = await self.provider.embed_documents_array(list(missing.values()))
+            computed = dict(zip(missing.keys(), embeddings))
+            await asyncio.to_thread(self.cache.put_many, model, computed)
+            cached.update(computed)
+
+        result = np.empty((len(documents), self.get_vector_size()), dtype=np.float32)
+        for i, key in enumerate(hashes):
+            result[i] = cached[key]
+        return result
+
+    async def embed_query(self, query: str) -> list[float]:
+        """Embed a query into a vector. Queries are not persisted."""
+        return await self.provider.embed_query(query)
+
+    async def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """Embed a list of queries into vectors. Queries are not persisted."""
+        return await self.provider.embed_queries(queries)
+
+    def get_vector_name(self) -> str:
+        """Get the name of the vector for the Qdrant collection."""
+        return self.provider.get_vector_name()
+
+    def get_vector_size(self) -> int:
+        """Get the size of the vector for the Qdrant collection."""
+        return self.provider.get_vector_size()
+
+
+def main():
+    """
+    Maintenance entry point for the on-disk embedding cache, defined in pyproject.toml.
+    """
+    from mcp_server_qdrant.settings import EmbeddingProviderSettings
+
+    settings = EmbeddingProviderSettings()
+
+    parser = argparse.ArgumentParser(description="mcp-server-qdrant embedding cache")
+    parser.add_argument(
+        "--path",
+        default=settings.document_cache_path,
+        help="Path to the cache database (defaults to EMBEDDING_CACHE_PATH)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("stats", help="Show the number and size of cached vectors")
+    prune_parser = subparsers.add_parser(
+        "prune", help="Evict least recently used vectors down to a size"
+    )
+    prune_parser.add_argument(
+        "--max-size-mb",
+        type=float,
+        default=settings.document_cache_max_size_mb,
+        help="Target size in megabytes (defaults to EMBEDDING_CACHE_MAX_SIZE_MB)",
+    )
+    subparsers.add_parser("clear", help="Remove all cached vectors")
+    args = parser.parse_args()
+
+    if not args.path:
+        parser.error("No cache path given, set EMBEDDING_CACHE_PATH or pass --path")
+
+    cache = EmbeddingDiskCache(
+        args.path, max_size_bytes=int(settings.document_cache_max_size_mb * 1024 * 1024)
+    )
+    try:
+        if args.command == "prune":
+            evicted = cache.prune(int(args.max_size_mb * 1024 * 1024))
+            print(f"Evicted {evicted} vectors")
+        elif args.command == "clear":
+            cache.clear()
+            print("Cache cleared")
+        stats = cache.stats()
+        print(
+            f"{stats['count']} vectors, {stats['size_bytes'] / (1024 * 1024):.1f} MB "
+            f"in {args.path}"
+        )
+    finally:
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
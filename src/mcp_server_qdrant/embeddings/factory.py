@@ -1,18 +1,84 @@
-from mcp_server_qdrant.embeddings.base import EmbeddingProvider
+from mcp_server_qdrant.embeddings.base import EmbeddingProvider, SparseEmbeddingProvider
 from mcp_server_qdrant.embeddings.types import EmbeddingProviderType
 from mcp_server_qdrant.settings import EmbeddingProviderSettings
 
 
 def create_embedding_provider(settings: EmbeddingProviderSettings) -> EmbeddingProvider:
     """
-    Create an embedding provider based on the specified type.
+    Create an embedding provider based on the specified type. If the on-disk document
+    cache, micro-batching or the query cache are configured, the provider is wrapped
+    accordingly, with the query cache outermost so that its hits never wait for a batch.
     :param settings: The settings for the embedding provider.
     :return: An instance of the specified embedding provider.
     """
+    provider = _create_base_provider(settings)
+
+    if settings.document_cache_path:
+        from mcp_server_qdrant.embeddings.disk_cache import (
+            DiskCachedEmbeddingProvider,
+            EmbeddingDiskCache,
+        )
+
+        cache = EmbeddingDiskCache(
+            settings.document_cache_path,
+            max_size_bytes=int(settings.document_cache_max_size_mb * 1024 * 1024),
+        )
+        provider = DiskCachedEmbeddingProvider(provider, cache)
+
+    if settings.batch_max_size > 0:
+        from mcp_server_qdrant.embeddings.batching import BatchingEmbeddingProvider
+
+        provider = BatchingEmbeddingProvider(
+            provider,
+            max_batch_size=settings.batch_max_size,
+            max_wait_ms=settings.batch_max_wait_ms,
+        )
+
+    if settings.query_cache_size > 0:
+        from mcp_server_qdrant.embeddings.cached import CachedEmbeddingProvider
+
+        provider = CachedEmbeddingProvider(
+            provider,
+            max_size=settings.query_cache_size,
+            ttl=settings.query_cache_ttl,
+        )
+
+    return provider
+
+
+def create_sparse_embedding_provider(
+    settings: EmbeddingProviderSettings,
+) -> SparseEmbeddingProvider | None:
+    """
+    Create the sparse embedding provider used for hybrid search, if a sparse model is configured.
+    Sparse models always run locally with FastEmbed, whatever the dense provider is.
+    :param settings: The settings for the embedding provider.
+    :return: The sparse embedding provider, or None if hybrid search is disabled.
+    """
+    if not settings.sparse_model_name:
+        return None
+
+    from mcp_server_qdrant.embeddings.fastembed import FastEmbedSparseProvider
+
+    return FastEmbedSparseProvider(
+        settings.sparse_model_name, threads=settings.fastembed_threads
+    )
+
+
+def _create_base_provider(settings: EmbeddingProviderSettings) -> EmbeddingProvider:
+    """
+    Create the underlying embedding provider, without any wrappers.
+    """
     if settings.provider_type == EmbeddingProviderType.FASTEMBED:
         from mcp_server_qdrant.embeddings.fastembed import FastEmbedProvider
 
-        return FastEmbedProvider(settings.model_name)
+        return FastEmbedProvider(
+            settings.model_name,
+            threads=settings.fastembed_threads,
+            parallel=settings.fastembed_parallel,
+            executor_workers=settings.fastembed_executor_workers,
+            executor_type=settings.fastembed_executor,
+        )
     elif settings.provider_type == EmbeddingProviderType.OPENAI_COMPATIBLE:
         from mcp_server_qdrant.embeddings.openai_compatible import OpenAICompatibleProvider
         
@@ -21,7 +87,12 @@ def create_embedding_provider(settings: EmbeddingProviderSettings) -> EmbeddingP
             api_key=settings.openai_api_key,
             base_url=settings.openai_base_url or "https://api.openai.com/v1",
             vector_size=settings.openai_vector_size or 1536,
-            timeout=settings.openai_timeout
+            timeout=settings.openai_timeout,
+            base64_embeddings=settings.openai_base64_embeddings,
+            max_batch_size=settings.openai_max_batch_size,
+            max_batch_tokens=settings.openai_max_batch_tokens,
+            max_concurrency=settings.openai_max_concurrency,
+            max_retries=settings.openai_max_retries,
         )
     else:
         raise ValueError(f"Unsupported embedding provider: {settings.provider_type}")
@@ -1,50 +1,181 @@
 import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Literal
 
-from fastembed import TextEmbedding
+import numpy as np
+from fastembed import SparseTextEmbedding, TextEmbedding
 from fastembed.common.model_description import DenseModelDescription
+from qdrant_client import models
 
-from mcp_server_qdrant.embeddings.base import EmbeddingProvider
+from mcp_server_qdrant.embeddings.base import EmbeddingProvider, SparseEmbeddingProvider
+
+ExecutorType = Literal["thread", "process"]
+
+# Model instance owned by each worker of a process pool
+_worker_model: TextEmbedding | None = None
+
+
+def _init_worker(model_name: str, threads: int | None):
+    global _worker_model
+    _worker_model = TextEmbedding(model_name, threads=threads)
+
+
+def _worker_embed(kind: str, texts: list[str]) -> np.ndarray:
+    assert _worker_model is not None, "Worker was not initialized"
+    if kind == "query":
+        embeddings = _worker_model.query_embed(texts)
+    else:
+        embeddings = _worker_model.passage_embed(texts)
+    # A single contiguous array is much cheaper to send back than a list of arrays
+    return np.asarray(list(embeddings), dtype=np.float32).reshape(len(texts), -1)
 
 
 class FastEmbedProvider(EmbeddingProvider):
     """
     FastEmbed implementation of the embedding provider.
     :param model_name: The name of the FastEmbed model to use.
+    :param threads: The number of threads used by each ONNX session. If not provided, ONNX decides.
+    :param parallel: The number of data-parallel FastEmbed workers used to embed large document batches.
+                     If not provided, documents are embedded in the calling worker.
+    :param executor_workers: The number of workers of the executor running the inference.
+    :param executor_type: Whether the inference runs in a thread pool sharing one model, or in a process
+                          pool with one model per worker, which scales past the GIL at the cost of memory.
     """
 
-    def __init__(self, model_name: str):
+    def __init__(
+        self,
+        model_name: str,
+        threads: int | None = None,
+        parallel: int | None = None,
+        executor_workers: int = 2,
+        executor_type: ExecutorType = "thread",
+    ):
         self.model_name = model_name
-        self.embedding_model = TextEmbedding(model_name)
+        self.threads = threads
+        self.parallel = parallel
+        self.executor_type = executor_type
+
+        self.embedding_model: TextEmbedding | None
+        self._executor: Executor
+        if executor_type == "process":
+            # Each worker loads its own model, the main process never runs inference
+            self.embedding_model = None
+            self._executor = ProcessPoolExecutor(
+                max_workers=executor_workers,
+                initializer=_init_worker,
+                initargs=(model_name, threads),
+            )
+        elif executor_type == "thread":
+            self.embedding_model = TextEmbedding(model_name, threads=threads)
+            self._executor = ThreadPoolExecutor(
+                max_workers=executor_workers, thread_name_prefix="fastembed"
+            )
+        else:
+            raise ValueError(f"Unsupported executor type: {executor_type}")
+
+    def _embed_sync(self, kind: str, texts: list[str]) -> np.ndarray:
+        assert self.embedding_model is not None
+        if kind == "query":
+            embeddings = self.embedding_model.query_embed(texts)
+        else:
+            embeddings = self.embedding_model.passage_embed(texts, parallel=self.parallel)
+        return np.asarray(list(embeddings), dtype=np.float32).reshape(len(texts), -1)
+
+    async def _embed(self, kind: str, texts: list[str]) -> np.ndarray:
+        # Run in the provider's own pool since FastEmbed is synchronous
+        loop = asyncio.get_running_loop()
+        if self.executor_type == "process":
+            return await loop.run_in_executor(self._executor, _worker_embed, kind, texts)
+        return await loop.run_in_executor(self._executor, self._embed_sync, kind, texts)
 
     async def embed_documents(self, documents: list[str]) -> list[list[float]]:
         """Embed a list of documents into vectors."""
-        # Run in a thread pool since FastEmbed is synchronous
-        loop = asyncio.get_event_loop()
-        embeddings = await loop.run_in_executor(
-            None, lambda: list(self.embedding_model.passage_embed(documents))
-        )
-        return [embedding.tolist() for embedding in embeddings]
+        embeddings = await self._embed("passage", documents)
+        return embeddings.tolist()
+
+    async def embed_documents_array(self, documents: list[str]) -> np.ndarray:
+        """Embed a list of documents into a float32 array, without creating Python floats."""
+        return await self._embed("passage", documents)
 
     async def embed_query(self, query: str) -> list[float]:
         """Embed a query into a vector."""
-        # Run in a thread pool since FastEmbed is synchronous
-        loop = asyncio.get_event_loop()
-        embeddings = await loop.run_in_executor(
-            None, lambda: list(self.embedding_model.query_embed([query]))
-        )
+        embeddings = await self._embed("query", [query])
         return embeddings[0].tolist()
 
+    async def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """Embed a list of queries into vectors in a single model call."""
+        embeddings = await self._embed("query", queries)
+        return embeddings.tolist()
+
     def get_vector_name(self) -> str:
         """
         Return the name of the vector for the Qdrant collection.
         Important: This is compatible with the FastEmbed logic used before 0.6.0.
         """
-        model_name = self.embedding_model.model_name.split("/")[-1].lower()
+        model_name = self.model_name.split("/")[-1].lower()
         return f"fast-{model_name}"
 
     def get_vector_size(self) -> int:
         """Get the size of the vector for the Qdrant collection."""
         model_description: DenseModelDescription = (
-            self.embedding_model._get_model_description(self.model_name)
+            TextEmbedding._get_model_description(self.model_name)
         )
         return model_description.dim
+
+    def close(self):
+        """Shut down the inference executor."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class FastEmbedSparseProvider(SparseEmbeddingProvider):
+    """
+    FastEmbed implementation of the sparse embedding provider, e.g. with `Qdrant/bm25`
+    or a SPLADE model. The inference runs locally, in a dedicated thread.
+    :param model_name: The name of the FastEmbed sparse model to use.
+    :param threads: The number of threads used by the ONNX session. If not provided, ONNX decides.
+    """
+
+    def __init__(self, model_name: str, threads: int | None = None):
+        self.model_name = model_name
+        self.embedding_model = SparseTextEmbedding(model_name, threads=threads)
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="fastembed-sparse"
+        )
+
+    def _embed_sync(self, kind: str, texts: list[str]) -> list[models.SparseVector]:
+        if kind == "query":
+            embeddings = self.embedding_model.query_embed(texts)
+        else:
+            embeddings = self.embedding_model.passage_embed(texts)
+        return [
+            models.SparseVector(
+                indices=embedding.indices.tolist(), values=embedding.values.tolist()
+            )
+            for embedding in embeddings
+        ]
+
+    async def _embed(self, kind: str, texts: list[str]) -> list[models.SparseVector]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._embed_sync, kind, texts)
+
+    async def embed_documents(self, documents: list[str]) -> list[models.SparseVector]:
+        """Embed a list of documents into sparse vectors."""
+        return await self._embed("passage", documents)
+
+    async def embed_queries(self, queries: list[str]) -> list[models.SparseVector]:
+        """Embed a list of queries into sparse vectors."""
+        return await self._embed("query", queries)
+
+    def get_vector_name(self) -> str:
+        """Get the name of the sparse vector for the Qdrant collection."""
+        model_name = self.model_name.split("/")[-1].lower()
+        return f"fast-sparse-{model_name}"
+
+    def get_modifier(self) -> models.Modifier | None:
+        """Use IDF for models that only produce term frequencies, like BM25."""
+        model_description = SparseTextEmbedding._get_model_description(self.model_name)
+        return models.Modifier.IDF if model_description.requires_idf else None
+
+    def close(self):
+        """Shut down the inference executor."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,14 +1,62 @@
 import asyncio
-from typing import Optional
+import base64
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+
 import httpx
+import numpy as np
 
 from mcp_server_qdrant.embeddings.base import EmbeddingProvider
 
+logger = logging.getLogger(__name__)
+
+
+# Transient errors worth retrying: timeouts, rate limiting and server errors
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate the number of tokens of a text, at about 4 characters per token."""
+    return len(text) // 4 + 1
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a `Retry-After` header, given either in seconds or as an HTTP date.
+    :return: The number of seconds to wait, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
 
 class OpenAICompatibleProvider(EmbeddingProvider):
     """
     OpenAI API compatible embedding provider.
     Supports OpenAI, Azure OpenAI, Ollama, and other compatible services.
+    Large inputs are split into requests respecting the item and token limits of the service,
+    sent concurrently, and retried with exponential backoff on transient errors.
+    :param base64_embeddings: Request base64 encoded float32 embeddings for bulk document embedding,
+                              which avoids parsing large JSON float lists. Not all services support it.
+    :param max_batch_size: The maximum number of texts sent in a single request.
+    :param max_batch_tokens: The maximum number of tokens sent in a single request, estimated from the
+                             length of the texts. A longer text is sent alone.
+    :param max_concurrency: The maximum number of requests in flight at once.
+    :param max_retries: The number of retries of a request failing with a transient error.
+    :param retry_base_delay: The delay before the first retry in seconds, doubled on each retry, with
+                             full jitter. A `Retry-After` header sent by the service takes precedence.
+    :param retry_max_delay: The maximum delay before a retry in seconds, `Retry-After` included.
     """
     
     def __init__(
@@ -17,42 +65,151 @@ class OpenAICompatibleProvider(EmbeddingProvider):
         api_key: Optional[str] = None,
         base_url: str = "https://api.openai.com/v1",
         vector_size: int = 1536,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        base64_embeddings: bool = False,
+        max_batch_size: int = 2048,
+        max_batch_tokens: int = 300_000,
+        max_concurrency: int = 4,
+        max_retries: int = 5,
+        retry_base_delay: float = 0.5,
+        retry_max_delay: float = 30.0,
     ):
         self.model_name = model_name
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
         self.vector_size = vector_size
         self.timeout = timeout
+        self.base64_embeddings = base64_embeddings
+        self.max_batch_size = max_batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.retries = 0
         self.client = httpx.AsyncClient(timeout=timeout)
-        
-    async def embed_documents(self, documents: list[str]) -> list[list[float]]:
-        """Embed a list of documents into vectors."""
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    def _split(self, documents: list[str]) -> list[list[str]]:
+        """Split the documents into consecutive batches within the item and token limits."""
+        batches: list[list[str]] = []
+        batch: list[str] = []
+        batch_tokens = 0
+        for document in documents:
+            tokens = estimate_tokens(document)
+            if batch and (
+                len(batch) >= self.max_batch_size
+                or batch_tokens + tokens > self.max_batch_tokens
+            ):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(document)
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter, which spreads the retries of concurrent requests."""
+        return random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2**attempt))
+
+    async def _request_embeddings(
+        self, documents: list[str], encoding_format: str | None = None
+    ) -> list[Any]:
+        """Embed the documents in as many concurrent requests as needed, keeping their order."""
+        batches = self._split(documents)
+        if len(batches) == 1:
+            return await self._request_batch(batches[0], encoding_format)
+        results = await asyncio.gather(
+            *(self._request_batch(batch, encoding_format) for batch in batches)
+        )
+        return [embedding for embeddings in results for embedding in embeddings]
+
+    async def _request_batch(
+        self, documents: list[str], encoding_format: str | None = None
+    ) -> list[Any]:
+        """Send a single embeddings request, retrying transient errors, and return the embedding of each document."""
         headers = {"Content-Type": "application/json"}
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
             
-        payload = {
+        payload: dict[str, Any] = {
             "model": self.model_name,
             "input": documents
         }
-        
-        response = await self.client.post(
-            f"{self.base_url}/embeddings",
-            json=payload,
-            headers=headers
-        )
-        response.raise_for_status()
-        
-        data = response.json()
-        embeddings = [item["embedding"] for item in data["data"]]
-        return embeddings
+        if encoding_format:
+            payload["encoding_format"] = encoding_format
+
+        attempt = 0
+        while True:
+            retry_after = None
+            # Only requests in flight count towards the limit, not the ones waiting to retry
+            async with self._semaphore:
+                try:
+                    response = await self.client.post(
+                        f"{self.base_url}/embeddings",
+                        json=payload,
+                        headers=headers
+                    )
+                except httpx.TransportError as e:
+                    if attempt >= self.max_retries:
+                        raise
+                    logger.warning(f"Embeddings request failed: {e!r}, retrying")
+                else:
+                    if (
+                        response.status_code not in RETRYABLE_STATUS_CODES
+                        or attempt >= self.max_retries
+                    ):
+                        response.raise_for_status()
+                        return self._parse_embeddings(response, len(documents))
+                    logger.warning(
+                        f"Embeddings request failed with status {response.status_code}, retrying"
+                    )
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    if retry_after is not None:
+                        retry_after = min(retry_after, self.retry_max_delay)
+
+            self.retries += 1
+            await asyncio.sleep(retry_after if retry_after is not None else self._backoff(attempt))
+            attempt += 1
+
+    @staticmethod
+    def _parse_embeddings(response: httpx.Response, expected: int) -> list[Any]:
+        data = response.json()["data"]
+        if len(data) != expected:
+            raise ValueError(f"Expected {expected} embeddings, got {len(data)}")
+        # The order of the results is only guaranteed by their index
+        data = sorted(data, key=lambda item: item.get("index", 0))
+        return [item["embedding"] for item in data]
+
+    async def embed_documents(self, documents: list[str]) -> list[list[float]]:
+        """Embed a list of documents into vectors."""
+        return await self._request_embeddings(documents)
+
+    async def embed_documents_array(self, documents: list[str]) -> np.ndarray:
+        """Embed a list of documents into a float32 array."""
+        if not self.base64_embeddings:
+            embeddings = await self._request_embeddings(documents)
+            return np.asarray(embeddings, dtype=np.float32).reshape(len(documents), -1)
+
+        embeddings = await self._request_embeddings(documents, encoding_format="base64")
+        result = np.empty((len(documents), self.vector_size), dtype=np.float32)
+        for i, embedding in enumerate(embeddings):
+            if isinstance(embedding, str):
+                result[i] = np.frombuffer(base64.b64decode(embedding), dtype=np.float32)
+            else:
+                # Some compatible services ignore `encoding_format`
+                result[i] = embedding
+        return result
     
     async def embed_query(self, query: str) -> list[float]:
         """Embed a query into a vector."""
         embeddings = await self.embed_documents([query])
         return embeddings[0]
     
+    async def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """Embed a list of queries into vectors in a single request."""
+        return await self.embed_documents(queries)
+
     def get_vector_name(self) -> str:
         """Get the name of the vector for the Qdrant collection."""
         # Use a consistent naming pattern
@@ -0,0 +1,38 @@
+import json
+import uuid
+from typing import Any
+
+from pydantic import BaseModel
+
+Metadata = dict[str, Any]
+ArbitraryFilter = dict[str, Any]
+
+# Namespace of the content IDs, so that they never collide with other UUIDv5 schemes
+POINT_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "https://github.com/qdrant/mcp-server-qdrant")
+
+
+class Entry(BaseModel):
+    """
+    A single entry in the Qdrant collection.
+    """
+
+    content: str
+    metadata: Metadata | None = None
+    score: float | None = None
+    # The ID of the point, for entries read from Qdrant
+    id: str | int | None = None
+
+
+def content_point_id(entry: Entry, metadata_keys: list[str] | tuple[str, ...] = ()) -> str:
+    """
+    Derive a deterministic point ID from the content of an entry and some of its metadata,
+    so that storing the same entry again overwrites the point instead of duplicating it.
+    :param entry: The entry to identify.
+    :param metadata_keys: The metadata keys distinguishing entries with the same content,
+                          e.g. the path and line of a code chunk. Missing keys are ignored.
+    :return: The UUID of the point, as a string.
+    """
+    metadata = entry.metadata or {}
+    key = {name: metadata[name] for name in metadata_keys if name in metadata}
+    name = json.dumps([entry.content, key], sort_keys=True, default=str)
+    return str(uuid.uuid5(POINT_ID_NAMESPACE, name))
@@ -0,0 +1,805 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from pydantic import BaseModel
+from qdrant_client import AsyncQdrantClient, models
+
+from mcp_server_qdrant.common.activity import ForegroundActivity
+from mcp_server_qdrant.entry import Entry
+from mcp_server_qdrant.qdrant import QdrantConnector
+
+if TYPE_CHECKING:
+    from mcp_server_qdrant.embeddings.base import EmbeddingProvider, SparseEmbeddingProvider
+    from mcp_server_qdrant.metrics import MetricsRegistry
+    from mcp_server_qdrant.settings import IndexerSettings, QdrantSettings
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+DEFAULT_MANIFEST_NAME = ".mcp-server-qdrant-index.json"
+# Payload fields of indexed chunks, in the `codeChunk` payload format
+FILE_PATH_FIELD = "filePath"
+# Hash of the file content and of the chunking options, telling the current chunks of a file apart
+FILE_HASH_FIELD = "fileHash"
+# Files whose first bytes contain a NUL byte are considered binary
+BINARY_SNIFF_SIZE = 8192
+
+FileState = dict[str, Any]
+
+
+class IndexStats(BaseModel):
+    """
+    Summary of an indexing run.
+    """
+
+    files_scanned: int = 0
+    files_indexed: int = 0
+    files_unchanged: int = 0
+    files_removed: int = 0
+    files_failed: int = 0
+    # Chunks embedded and stored, without the unchanged chunks of changed files
+    chunks: int = 0
+    seconds: float = 0.0
+
+
+def walk_repository(
+    root: Path,
+    extensions: list[str] | None = None,
+    exclude_dirs: list[str] | None = None,
+    max_file_size: int | None = None,
+) -> list[str]:
+    """
+    List the files of a repository worth indexing. Hidden files and directories are skipped.
+    :param root: The directory to walk.
+    :param extensions: The extensions of the files to list, e.g. `.py`. If not provided, all files are listed.
+    :param exclude_dirs: The names of the directories never walked into, e.g. `node_modules`.
+    :param max_file_size: The size in bytes above which files are skipped.
+    :return: The paths of the files relative to the root, with forward slashes, sorted.
+    """
+    suffixes = {extension.lower() for extension in extensions} if extensions else None
+    excluded = set(exclude_dirs or ())
+    paths = []
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames[:] = [
+            name for name in dirnames if not name.startswith(".") and name not in excluded
+        ]
+        for filename in filenames:
+            if filename.startswith("."):
+                continue
+            if suffixes is not None and os.path.splitext(filename)[1].lower() not in suffixes:
+                continue
+            path = os.path.join(directory, filename)
+            if max_file_size is not None:
+                try:
+                    if os.path.getsize(path) > max_file_size:
+                        continue
+                except OSError:
+                    continue
+            paths.append(Path(path).relative_to(root).as_posix())
+    return sorted(paths)
+
+
+def is_indexable(
+    path: str, extensions: list[str] | None = None, exclude_dirs: list[str] | None = None
+) -> bool:
+    """
+    Check whether a file would be listed by `walk_repository`, apart from its size.
+    :param path: The path of the file relative to the root, with forward slashes.
+    :param extensions: The extensions of the indexed files. If not provided, all files are indexed.
+    :param exclude_dirs: The names of the directories never walked into.
+    :return: True if the file is indexed.
+    """
+    parts = path.split("/")
+    if any(part.startswith(".") for part in parts):
+        return False
+    if exclude_dirs and any(directory in exclude_dirs for directory in parts[:-1]):
+        return False
+    suffix = os.path.splitext(parts[-1])[1].lower()
+    return not extensions or suffix in {extension.lower() for extension in extensions}
+
+
+def chunk_lines(text: str, lines_per_chunk: int, overlap: int = 0) -> list[tuple[int, int, str]]:
+    """
+    Split a text into chunks of consecutive lines. Chunks made only of whitespace are dropped.
+    :param text: The text to split.
+    :param lines_per_chunk: The number of lines of each chunk.
+    :param overlap: The number of lines shared by consecutive chunks.
+    :return: The first and last line numbers of each chunk, starting at 1, and its text.
+    """
+    if overlap >= lines_per_chunk:
+        raise ValueError(f"Overlap {overlap} must be smaller than the chunk size {lines_per_chunk}")
+    lines = text.splitlines(keepends=True)
+    chunks = []
+    step = lines_per_chunk - overlap
+    for start in range(0, len(lines), step):
+        window = lines[start : start + lines_per_chunk]
+        content = "".join(window)
+        if content.strip():
+            chunks.append((start + 1, start + len(window), content))
+        if start + lines_per_chunk >= len(lines):
+            break
+    return chunks
+
+
+class IndexManifest:
+    """
+    Content hashes of the indexed files, saved as JSON so that the next run only indexes the changed
+    files. The options the chunks were built with are saved too: if they change, the manifest is
+    discarded and every file is indexed again.
+    :param path: The path of the JSON file.
+    :param options: The indexing options, e.g. the collection name and the chunk size.
+    """
+
+    def __init__(self, path: Path, options: dict[str, Any]):
+        self.path = path
+        self.options = options
+        self.files: dict[str, FileState] = {}
+        # Whether the files were read from a manifest written with the same options
+        self.loaded = False
+
+    @classmethod
+    def load(cls, path: Path, options: dict[str, Any]) -> "IndexManifest":
+        """
+        Load the manifest saved at a path, or start an empty one if it is missing or was built
+        with other options.
+        :param path: The path of the JSON file.
+        :param options: The current indexing options.
+        :return: The manifest.
+        """
+        manifest = cls(path, options)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return manifest
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable index manifest {path}: {e}")
+            return manifest
+        if data.get("version") != MANIFEST_VERSION or data.get("options") != options:
+            logger.info(f"Index options changed since {path} was written, indexing every file")
+            return manifest
+        manifest.files = data.get("files", {})
+        manifest.loaded = True
+        return manifest
+
+    def save(self):
+        """Write the manifest atomically, so that an interrupted run never leaves it corrupted."""
+        data = {"version": MANIFEST_VERSION, "options": self.options, "files": self.files}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        temporary.write_text(json.dumps(data, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(temporary, self.path)
+
+
+class PendingChanges:
+    """
+    Files reported changed by a watcher, waiting to be indexed. Repeated changes of a file are
+    coalesced. Beyond `max_size` files, e.g. after a checkout of another branch, the paths are
+    dropped and a single rescan of the repository is requested instead, which bounds memory and
+    lets the manifest find the changed files.
+    :param max_size: The maximum number of files kept.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.paths: set[str] = set()
+        self.rescan = False
+        self._changed = asyncio.Event()
+
+    def add(self, paths: Iterable[str]):
+        """Record changed files."""
+        if not self.rescan:
+            self.paths.update(paths)
+            if len(self.paths) > self.max_size:
+                logger.info(f"More than {self.max_size} files changed, rescanning the repository")
+                self.paths.clear()
+                self.rescan = True
+        self._changed.set()
+
+    def take(self, count: int) -> list[str]:
+        """Remove and return up to `count` changed files."""
+        taken = [self.paths.pop() for _ in range(min(count, len(self.paths)))]
+        return sorted(taken)
+
+    async def wait(self):
+        """Wait until changes are recorded."""
+        await self._changed.wait()
+        self._changed.clear()
+
+    def __bool__(self) -> bool:
+        return self.rescan or bool(self.paths)
+
+
+class CodebaseIndexer:
+    """
+    Incremental indexer of a repository. Files are split into line ranges stored as `codeChunk`
+    payloads with their `filePath`, `startLine` and `endLine`. A manifest of file hashes lets reruns
+    skip unchanged files, replace the chunks of changed ones and delete the chunks of removed ones.
+    :param connector: The connector storing the chunks. It should store payloads in the `codeChunk`
+                      format, and index the `filePath` and `fileHash` fields for fast deletes.
+    :param root: The directory to index.
+    :param collection_name: The name of the collection to index into, optional. If not provided,
+                            the default collection of the connector is used.
+    :param manifest_path: The path of the manifest. Defaults to a file in the indexed directory.
+    :param chunk_size: The number of lines of each chunk.
+    :param chunk_overlap: The number of lines shared by consecutive chunks of a file.
+    :param workers: The number of files read, embedded and upserted in parallel.
+    :param batch_size: The number of chunks a worker gathers from consecutive files before storing them.
+    :param extensions: The extensions of the indexed files. If not provided, all files are indexed.
+    :param exclude_dirs: The names of the directories never walked into.
+    :param max_file_size: The size in bytes above which files are not indexed.
+    """
+
+    def __init__(
+        self,
+        connector: QdrantConnector,
+        root: str | Path,
+        *,
+        collection_name: str | None = None,
+        manifest_path: str | Path | None = None,
+        chunk_size: int = 60,
+        chunk_overlap: int = 10,
+        workers: int = 4,
+        batch_size: int = 64,
+        extensions: list[str] | None = None,
+        exclude_dirs: list[str] | None = None,
+        max_file_size: int | None = None,
+    ):
+        if chunk_overlap >= chunk_size:
+            raise ValueError(f"Overlap {chunk_overlap} must be smaller than the chunk size {chunk_size}")
+        if workers < 1:
+            raise ValueError(f"Number of workers must be positive, got {workers}")
+        self._connector = connector
+        self.root = Path(root).resolve()
+        self._collection_name = collection_name
+        self.manifest_path = Path(manifest_path) if manifest_path else self.root / DEFAULT_MANIFEST_NAME
+        self._chunk_size = chunk_size
+        self._chunk_overlap = chunk_overlap
+        self._workers = workers
+        self._batch_size = batch_size
+        self._extensions = extensions
+        self._exclude_dirs = exclude_dirs
+        self._max_file_size = max_file_size
+        # Kept between runs by `sync` and `watch`
+        self._manifest: IndexManifest | None = None
+        # Chunks built with other options are then replaced even if the file did not change
+        self._hash_seed = json.dumps(self._options(), sort_keys=True).encode("utf-8")
+
+    def _options(self) -> dict[str, Any]:
+        return {
+            "collection": self._collection_name,
+            "chunk_size": self._chunk_size,
+            "chunk_overlap": self._chunk_overlap,
+        }
+
+    async def index(self, *, full: bool = False) -> IndexStats:
+        """
+        Index the files changed since the last run, and delete the chunks of the removed files.
+        Files which failed are left out of the manifest, so that the next run retries them.
+        :param full: Ignore the manifest and index every file again.
+        :return: The summary of the run.
+        """
+        start = time.perf_counter()
+        manifest = IndexManifest.load(self.manifest_path, self._options())
+        if full:
+            manifest.files = {}
+            manifest.loaded = False
+        # Files missing from a trusted manifest have no chunks yet, so deleting them is skipped.
+        # Deletes filter the whole collection, which is the slowest part of indexing new files.
+        replace_unknown = not manifest.loaded and await self._connector.collection_exists(
+            self._collection_name
+        )
+        stats = IndexStats()
+
+        paths = await asyncio.to_thread(
+            walk_repository, self.root, self._extensions, self._exclude_dirs, self._max_file_size
+        )
+        stats.files_scanned = len(paths)
+        try:
+            await self._index_files(paths, manifest, stats, replace_unknown)
+            removed = sorted(set(manifest.files) - set(paths))
+            await self._remove_files(removed, manifest)
+            stats.files_removed = len(removed)
+        finally:
+            # Keep the progress of an interrupted run
+            await asyncio.to_thread(manifest.save)
+
+        # Every indexed file is now in the manifest
+        manifest.loaded = True
+        self._manifest = manifest
+        stats.seconds = time.perf_counter() - start
+        self._log(stats)
+        return stats
+
+    async def sync(self, paths: Iterable[str]) -> IndexStats:
+        """
+        Index some files, e.g. the ones reported changed by a watcher, and delete the chunks of the
+        ones which were removed or are no longer indexed. The manifest is kept between calls.
+        :param paths: The paths of the files, relative to the root, with forward slashes.
+        :return: The summary of the run.
+        """
+        start = time.perf_counter()
+        if self._manifest is None:
+            self._manifest = IndexManifest.load(self.manifest_path, self._options())
+        manifest = self._manifest
+        replace_unknown = not manifest.loaded and await self._connector.collection_exists(
+            self._collection_name
+        )
+        stats = IndexStats()
+
+        existing, removed = await asyncio.to_thread(
+            self._classify, sorted(set(paths)), manifest, replace_unknown
+        )
+        stats.files_scanned = len(existing)
+        try:
+            await self._index_files(existing, manifest, stats, replace_unknown)
+            await self._remove_files(removed, manifest)
+            stats.files_removed = len(removed)
+        finally:
+            await asyncio.to_thread(manifest.save)
+
+        stats.seconds = time.perf_counter() - start
+        self._log(stats)
+        return stats
+
+    def _classify(
+        self, paths: list[str], manifest: IndexManifest, replace_unknown: bool
+    ) -> tuple[list[str], list[str]]:
+        """
+        Split files into the ones to index, and the ones whose chunks should be deleted.
+        """
+        existing, removed = [], []
+        for path in paths:
+            full_path = self.root / path
+            try:
+                indexed = (
+                    is_indexable(path, self._extensions, self._exclude_dirs)
+                    and full_path.is_file()
+                    and (self._max_file_size is None or full_path.stat().st_size <= self._max_file_size)
+                )
+            except OSError:
+                indexed = False
+            if indexed:
+                existing.append(path)
+            elif path in manifest.files or replace_unknown:
+                removed.append(path)
+        return existing, removed
+
+    async def _index_files(
+        self, paths: list[str], manifest: IndexManifest, stats: IndexStats, replace_unknown: bool
+    ):
+        """Index files with parallel workers."""
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        for path in paths:
+            queue.put_nowait(path)
+        await asyncio.gather(
+            *(self._work(queue, manifest, stats, replace_unknown) for _ in range(self._workers))
+        )
+
+    @staticmethod
+    def _log(stats: IndexStats):
+        logger.info(
+            f"Indexed {stats.files_indexed} files ({stats.chunks} chunks stored), "
+            f"{stats.files_unchanged} unchanged, {stats.files_removed} removed, "
+            f"{stats.files_failed} failed in {stats.seconds:.2f}s"
+        )
+
+    async def watch(
+        self,
+        *,
+        debounce_ms: int = 1600,
+        batch_files: int = 20,
+        max_pending: int = 2000,
+        pause: float = 0.05,
+        foreground: ForegroundActivity | None = None,
+        max_foreground_wait: float = 2.0,
+        stop_event: asyncio.Event | None = None,
+        on_sync: Callable[[IndexStats], None] | None = None,
+    ):
+        """
+        Index the repository, then keep the collection in sync with the changes of its files, reported
+        by the operating system through `watchfiles`, until the stop event is set. Changes are debounced
+        and coalesced, then indexed in small batches which give way to foreground requests, so that a
+        checkout touching thousands of files does not slow searches down.
+        :param debounce_ms: The maximum time in milliseconds changes are gathered before being reported.
+        :param batch_files: The maximum number of changed files indexed at once.
+        :param max_pending: The number of changed files beyond which the repository is rescanned instead.
+        :param pause: The time in seconds to wait between batches.
+        :param foreground: The foreground requests, like searches, waited for before each batch.
+        :param max_foreground_wait: The maximum time in seconds to wait for foreground requests.
+        :param stop_event: The event stopping the watch. If not provided, watches until cancelled.
+        :param on_sync: Called with the summary of every indexing run, e.g. to invalidate caches.
+        """
+        try:
+            import watchfiles
+        except ImportError as e:
+            raise ImportError(
+                "Watching a repository requires watchfiles: pip install 'mcp-server-qdrant[watch]'"
+            ) from e
+
+        pending = PendingChanges(max_pending)
+
+        def watch_filter(change: Any, path: str) -> bool:
+            try:
+                relative_path = self._relative_path(path)
+            except ValueError:
+                return False
+            if is_indexable(relative_path, self._extensions, self._exclude_dirs):
+                return True
+            # Directories are expanded into their files, as the files created along with a
+            # directory may be reported before the directory itself is watched
+            if change == watchfiles.Change.modified or not self._is_walked(relative_path):
+                return False
+            return change == watchfiles.Change.deleted or os.path.isdir(path)
+
+        async def collect():
+            async for changes in watchfiles.awatch(
+                self.root, watch_filter=watch_filter, debounce=debounce_ms, stop_event=stop_event
+            ):
+                paths = []
+                for change, path in changes:
+                    relative_path = self._relative_path(path)
+                    paths.append(relative_path)
+                    if change == watchfiles.Change.added and os.path.isdir(path):
+                        paths.extend(await asyncio.to_thread(self._walk_directory, relative_path))
+                    elif change == watchfiles.Change.deleted and self._manifest is not None:
+                        prefix = relative_path + "/"
+                        paths.extend(p for p in list(self._manifest.files) if p.startswith(prefix))
+                pending.add(paths)
+
+        # The watcher starts before the initial index, so that no change made meanwhile is missed
+        collector = asyncio.create_task(collect())
+        try:
+            stats = await self.index()
+            if on_sync is not None:
+                on_sync(stats)
+            logger.info(f"Watching {self.root} for changes")
+            while not collector.done():
+                waiter = asyncio.create_task(pending.wait())
+                await asyncio.wait({collector, waiter}, return_when=asyncio.FIRST_COMPLETED)
+                waiter.cancel()
+                while pending:
+                    if foreground is not None:
+                        await foreground.wait_idle(max_foreground_wait)
+                    if pending.rescan:
+                        pending.rescan = False
+                        stats = await self.index()
+                    else:
+                        stats = await self.sync(pending.take(batch_files))
+                    if on_sync is not None:
+                        on_sync(stats)
+                    await asyncio.sleep(pause)
+            # Raises the errors of the watcher, if any
+            await collector
+        finally:
+            collector.cancel()
+
+    def _relative_path(self, path: str) -> str:
+        return Path(path).relative_to(self.root).as_posix()
+
+    def _is_walked(self, directory: str) -> bool:
+        return not any(
+            part.startswith(".") or part in (self._exclude_dirs or ())
+            for part in directory.split("/")
+        )
+
+    def _walk_directory(self, directory: str) -> list[str]:
+        paths = walk_repository(
+            self.root / directory, self._extensions, self._exclude_dirs, self._max_file_size
+        )
+        return [f"{directory}/{path}" for path in paths]
+
+    async def _work(
+        self,
+        queue: asyncio.Queue[str],
+        manifest: IndexManifest,
+        stats: IndexStats,
+        replace_unknown: bool,
+    ):
+        """
+        Scan the queued files, gathering the chunks of consecutive changed files into batches.
+        :param replace_unknown: Whether files missing from the manifest may have chunks to delete.
+        """
+        pending: list[tuple[str, FileState, list[Entry], bool]] = []
+        pending_chunks = 0
+        while True:
+            try:
+                path = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            previous = manifest.files.get(path)
+            try:
+                state, entries = await asyncio.to_thread(self._scan_file, path, previous)
+            except OSError as e:
+                logger.warning(f"Could not read {path}: {e}")
+                stats.files_failed += 1
+                continue
+            if entries is None:
+                manifest.files[path] = state
+                stats.files_unchanged += 1
+                continue
+            pending.append((path, state, entries, previous is not None or replace_unknown))
+            pending_chunks += len(entries)
+            if pending_chunks >= self._batch_size:
+                await self._store_files(pending, manifest, stats)
+                pending, pending_chunks = [], 0
+        if pending:
+            await self._store_files(pending, manifest, stats)
+
+    def _scan_file(
+        self, path: str, previous: FileState | None
+    ) -> tuple[FileState, list[Entry] | None]:
+        """
+        Check whether a file changed since it was indexed, and chunk it if it did. The content is only
+        hashed if the size or modification time of the file differ from the manifest.
+        :param path: The path of the file, relative to the root.
+        :param previous: The state of the file in the manifest, if it was indexed.
+        :return: The current state of the file, and its chunks, or None if it did not change.
+        """
+        full_path = self.root / path
+        stat = full_path.stat()
+        if (
+            previous is not None
+            and previous["size"] == stat.st_size
+            and previous["mtime_ns"] == stat.st_mtime_ns
+        ):
+            return previous, None
+
+        data = full_path.read_bytes()
+        digest = hashlib.sha256(self._hash_seed + data).hexdigest()
+        state = {"sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        if previous is not None and previous["sha256"] == digest:
+            return state, None
+        if b"\0" in data[:BINARY_SNIFF_SIZE]:
+            # Binary files have no chunks, so that their former chunks are deleted
+            return state, []
+
+        text = data.decode("utf-8", errors="replace")
+        return state, [
+            Entry(
+                content=content,
+                metadata={
+                    FILE_PATH_FIELD: path,
+                    "startLine": start_line,
+                    "endLine": end_line,
+                    FILE_HASH_FIELD: digest,
+                },
+            )
+            for start_line, end_line, content in chunk_lines(
+                text, self._chunk_size, self._chunk_overlap
+            )
+        ]
+
+    async def _store_files(
+        self,
+        files: list[tuple[str, FileState, list[Entry], bool]],
+        manifest: IndexManifest,
+        stats: IndexStats,
+    ):
+        """
+        Store the chunks of changed files, then delete their chunks from former versions. The new
+        chunks are stored first, so that searches never miss a file while it is being replaced.
+        """
+        entries = [entry for _, _, file_entries, _ in files for entry in file_entries]
+        stale = [
+            models.Filter(
+                must=[_match(FILE_PATH_FIELD, path)],
+                must_not=[_match(FILE_HASH_FIELD, state["sha256"])],
+            )
+            for path, state, _, replaces in files
+            if replaces
+        ]
+        try:
+            stored = 0
+            if entries:
+                stored = await self._connector.store_many(
+                    entries, collection_name=self._collection_name
+                )
+            if stale:
+                await self._connector.delete(
+                    models.Filter(should=stale), collection_name=self._collection_name
+                )
+        except Exception as e:
+            logger.error(f"Failed to index {len(files)} files: {e}", exc_info=True)
+            stats.files_failed += len(files)
+            return
+
+        for path, state, _, _ in files:
+            manifest.files[path] = state
+        stats.files_indexed += len(files)
+        stats.chunks += stored
+
+    async def _remove_files(self, paths: list[str], manifest: IndexManifest, batch_size: int = 256):
+        """
+        Delete the chunks of files which no longer exist.
+        """
+        for start in range(0, len(paths), batch_size):
+            batch = paths[start : start + batch_size]
+            await self._connector.delete(
+                models.Filter(
+                    must=[models.FieldCondition(key=FILE_PATH_FIELD, match=models.MatchAny(any=batch))]
+                ),
+                collection_name=self._collection_name,
+            )
+            for path in batch:
+                manifest.files.pop(path, None)
+
+
+def _match(key: str, value: str) -> models.FieldCondition:
+    return models.FieldCondition(key=key, match=models.MatchValue(value=value))
+
+
+def create_index_connector(
+    collection_name: str | None = None,
+    *,
+    qdrant_settings: "QdrantSettings | None" = None,
+    embedding_provider: "EmbeddingProvider | None" = None,
+    sparse_embedding_provider: "SparseEmbeddingProvider | None" = None,
+    metrics: "MetricsRegistry | None" = None,
+    client: AsyncQdrantClient | None = None,
+) -> QdrantConnector:
+    """
+    Create a connector storing code chunks, configured from the environment like the server.
+    Points get content IDs, so that unchanged chunks of changed files are not embedded again.
+    :param collection_name: The name of the collection to index into. Defaults to `COLLECTION_NAME`.
+    :param qdrant_settings: The Qdrant settings. If not provided, they are read from the environment.
+    :param embedding_provider: The embedding provider, e.g. the one of a running server. If not
+                               provided, the providers are created from the environment.
+    :param sparse_embedding_provider: The sparse embedding provider used with `embedding_provider`.
+    :param metrics: The registry recording the latencies of the connector.
+    :param client: The Qdrant client to share, e.g. the one of a running server.
+    :return: The connector.
+    """
+    from mcp_server_qdrant.payload_formats import CODE_CHUNK_FORMAT
+    from mcp_server_qdrant.settings import QdrantSettings
+
+    qdrant_settings = qdrant_settings or QdrantSettings()
+    if embedding_provider is None:
+        from mcp_server_qdrant.embeddings.factory import (
+            create_embedding_provider,
+            create_sparse_embedding_provider,
+        )
+        from mcp_server_qdrant.settings import EmbeddingProviderSettings
+
+        embedding_settings = EmbeddingProviderSettings()
+        embedding_provider = create_embedding_provider(embedding_settings)
+        sparse_embedding_provider = create_sparse_embedding_provider(embedding_settings)
+    return QdrantConnector(
+        qdrant_settings.location,
+        qdrant_settings.api_key,
+        collection_name or qdrant_settings.collection_name,
+        embedding_provider,
+        qdrant_settings.local_path,
+        {
+            FILE_PATH_FIELD: models.PayloadSchemaType.KEYWORD,
+            FILE_HASH_FIELD: models.PayloadSchemaType.KEYWORD,
+        },
+        store_batch_size=qdrant_settings.store_batch_size,
+        client_options=qdrant_settings.client_options(),
+        sparse_embedding_provider=sparse_embedding_provider,
+        hybrid_fusion=qdrant_settings.hybrid_fusion,
+        hybrid_prefetch_limit=qdrant_settings.hybrid_prefetch_limit,
+        vector_options=qdrant_settings.vector_options(),
+        store_payload_format=CODE_CHUNK_FORMAT,
+        point_id_mode="content",
+        point_id_metadata_keys=[FILE_PATH_FIELD, "startLine"],
+        skip_existing=True,
+        metrics=metrics,
+        client=client,
+    )
+
+
+def create_indexer(
+    connector: QdrantConnector,
+    root: str | Path,
+    settings: "IndexerSettings",
+    *,
+    collection_name: str | None = None,
+    manifest_path: str | None = None,
+    workers: int | None = None,
+) -> CodebaseIndexer:
+    """
+    Create an indexer configured by the indexer settings.
+    :param connector: The connector storing the chunks, see `create_index_connector`.
+    :param root: The directory to index.
+    :param settings: The indexer settings.
+    :param collection_name: The name of the collection to index into, optional.
+    :param manifest_path: The path of the manifest, overriding the settings.
+    :param workers: The number of parallel workers, overriding the settings.
+    :return: The indexer.
+    """
+    return CodebaseIndexer(
+        connector,
+        root,
+        collection_name=collection_name,
+        manifest_path=manifest_path or settings.manifest_path,
+        chunk_size=settings.chunk_lines,
+        chunk_overlap=settings.chunk_overlap,
+        workers=workers or settings.workers,
+        batch_size=settings.batch_size,
+        extensions=settings.extensions,
+        exclude_dirs=settings.exclude_dirs,
+        max_file_size=settings.max_file_size_kb * 1024,
+    )
+
+
+def main():
+    """
+    Entry point of the mcp-server-qdrant-index script defined in pyproject.toml. It indexes
+    a repository into the configured collection, and optionally keeps it in sync afterwards.
+    """
+    from mcp_server_qdrant.settings import IndexerSettings, LoggingSettings, QdrantSettings
+
+    logging.basicConfig(
+        level=getattr(logging, LoggingSettings().log_level.upper(), logging.INFO),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        stream=sys.stderr,
+    )
+    settings = IndexerSettings()
+
+    parser = argparse.ArgumentParser(description="mcp-server-qdrant codebase indexer")
+    parser.add_argument("path", nargs="?", default=".", help="Directory to index")
+    parser.add_argument(
+        "--collection", help="Collection to index into (defaults to COLLECTION_NAME)"
+    )
+    parser.add_argument(
+        "--manifest",
+        default=settings.manifest_path,
+        help="Path of the manifest of file hashes (defaults to INDEX_MANIFEST_PATH)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.workers,
+        help="Files indexed in parallel (defaults to INDEX_WORKERS)",
+    )
+    parser.add_argument(
+        "--full", action="store_true", help="Ignore the manifest and index every file again"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep the collection in sync with the changes of the files until interrupted",
+    )
+    args = parser.parse_args()
+
+    # Resolved here, so that the manifest notices a change of the collection
+    collection_name = args.collection or QdrantSettings().collection_name
+    if not collection_name:
+        parser.error("No collection given, set COLLECTION_NAME or pass --collection")
+
+    connector = create_index_connector(collection_name)
+    indexer = create_indexer(
+        connector,
+        args.path,
+        settings,
+        collection_name=collection_name,
+        manifest_path=args.manifest,
+        workers=args.workers,
+    )
+    if args.watch:
+        try:
+            asyncio.run(indexer.watch(**settings.watch_options()))
+        except KeyboardInterrupt:
+            pass
+        return
+
+    stats = asyncio.run(indexer.index(full=args.full))
+    print(
+        f"{stats.files_indexed} files indexed ({stats.chunks} chunks stored), "
+        f"{stats.files_unchanged} unchanged, {stats.files_removed} removed, "
+        f"{stats.files_failed} failed in {stats.seconds:.1f}s"
+    )
+    if stats.files_failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,37 @@
+import asyncio
 import json
 import logging
-from typing import Annotated, Any, Optional
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, Annotated, Any, Iterator, Optional
 
 from fastmcp import Context, FastMCP
 from mcp.types import TextContent
 from pydantic import Field
-from qdrant_client import models
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
 
-from mcp_server_qdrant.common.filters import make_indexes
+from mcp_server_qdrant.common.activity import ForegroundActivity
 from mcp_server_qdrant.common.func_tools import make_partial_function
-from mcp_server_qdrant.common.wrap_filters import wrap_filters
-from mcp_server_qdrant.embeddings.base import EmbeddingProvider
-from mcp_server_qdrant.embeddings.factory import create_embedding_provider
-from mcp_server_qdrant.qdrant import ArbitraryFilter, Entry, Metadata, QdrantConnector
+from mcp_server_qdrant.embeddings.base import EmbeddingProvider, SparseEmbeddingProvider
+from mcp_server_qdrant.embeddings.factory import (
+    create_embedding_provider,
+    create_sparse_embedding_provider,
+)
+from mcp_server_qdrant.entry import ArbitraryFilter, Entry, Metadata
+from mcp_server_qdrant.metrics import Counter, Metric, MetricsRegistry
 from mcp_server_qdrant.settings import (
     EmbeddingProviderSettings,
+    IndexerSettings,
     QdrantSettings,
     ToolSettings,
 )
 
+if TYPE_CHECKING:
+    from mcp_server_qdrant.qdrant import QdrantConnector
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,14 +40,30 @@ logger = logging.getLogger(__name__)
 class QdrantMCPServer(FastMCP):
     """
     A MCP server for Qdrant.
+    With `lazy_startup`, the embedding provider and the Qdrant connector are created in a
+    background thread, so that the server answers the MCP handshake immediately. The Qdrant
+    client, FastEmbed and the embedding model are only imported and loaded there, and tool
+    calls wait until they are ready.
+    With `warmup`, dummy embeddings and trivial Qdrant requests are run in the background
+    once the server starts, so that the first tool call does not pay for model initialization
+    and connection setup.
+    With the `watch_path` of the indexer settings, the directory is indexed into the default
+    collection once the server starts, then kept in sync with the changes of its files. Changes
+    are indexed in the background, giving way to running searches.
     """
 
+    qdrant_connector: "QdrantConnector"
+
     def __init__(
         self,
         tool_settings: ToolSettings,
         qdrant_settings: QdrantSettings,
         embedding_provider_settings: Optional[EmbeddingProviderSettings] = None,
         embedding_provider: Optional[EmbeddingProvider] = None,
+        sparse_embedding_provider: Optional[SparseEmbeddingProvider] = None,
+        lazy_startup: bool = False,
+        warmup: bool = False,
+        indexer_settings: Optional[IndexerSettings] = None,
         name: str = "mcp-server-qdrant",
         instructions: str | None = None,
         **settings: Any,
@@ -42,6 +71,9 @@ class QdrantMCPServer(FastMCP):
         logger.info("Initializing QdrantMCPServer...")
         self.tool_settings = tool_settings
         self.qdrant_settings = qdrant_settings
+        self.indexer_settings = indexer_settings
+        # Searches in progress, which the watcher gives way to
+        self.foreground = ForegroundActivity()
 
         if embedding_provider_settings and embedding_provider:
             raise ValueError(
@@ -53,23 +85,78 @@ class QdrantMCPServer(FastMCP):
                 "Must provide either embedding_provider_settings or embedding_provider"
             )
 
-        self.embedding_provider_settings: Optional[EmbeddingProviderSettings] = None
-        self.embedding_provider: Optional[EmbeddingProvider] = None
+        self.embedding_provider_settings: Optional[EmbeddingProviderSettings] = (
+            embedding_provider_settings
+        )
+        self.embedding_provider: Optional[EmbeddingProvider] = embedding_provider
+        self.sparse_embedding_provider = sparse_embedding_provider
+
+        self.metrics = MetricsRegistry()
+        self._format_latency = self.metrics.histogram(
+            "stage_duration_seconds",
+            "Time spent in each stage of handling a request",
+            stage="format",
+        )
+
+        # Resolved once the embedding provider and the Qdrant connector are created
+        self._ready: Future = Future()
+        if lazy_startup:
+            logger.info("Loading the embedding provider and Qdrant connector in the background")
+            threading.Thread(
+                target=self._initialize_in_background,
+                name="mcp-server-qdrant-startup",
+                daemon=True,
+            ).start()
+        else:
+            self._initialize_backend()
+            self._ready.set_result(None)
+
+        if warmup:
+            settings["lifespan"] = self._warmup_lifespan(settings.get("lifespan"))
+        if indexer_settings is not None and indexer_settings.watch_path:
+            settings["lifespan"] = self._watch_lifespan(settings.get("lifespan"))
+
+        logger.info("Initializing FastMCP parent class...")
+        super().__init__(name=name, instructions=instructions, **settings)
 
-        if embedding_provider_settings:
-            logger.info(f"Creating embedding provider: {embedding_provider_settings.provider_type}")
-            self.embedding_provider_settings = embedding_provider_settings
+        logger.info("Setting up tools...")
+        self.setup_tools()
+        # Only served by the SSE and streamable HTTP transports
+        self.custom_route("/metrics", methods=["GET"])(self.metrics_endpoint)
+        logger.info("QdrantMCPServer initialization complete")
+
+    def _initialize_backend(self):
+        """
+        Create the embedding providers and the Qdrant connector. This loads the embedding
+        models, which may be downloaded first.
+        """
+        from mcp_server_qdrant.common.filters import make_indexes
+        from mcp_server_qdrant.qdrant import QdrantConnector
+
+        qdrant_settings = self.qdrant_settings
+        if self.embedding_provider_settings:
+            logger.info(
+                f"Creating embedding provider: {self.embedding_provider_settings.provider_type}"
+            )
             self.embedding_provider = create_embedding_provider(
-                embedding_provider_settings
+                self.embedding_provider_settings
+            )
+            self.sparse_embedding_provider = (
+                self.sparse_embedding_provider
+                or create_sparse_embedding_provider(self.embedding_provider_settings)
             )
         else:
             logger.info("Using provided embedding provider")
-            self.embedding_provider_settings = None
-            self.embedding_provider = embedding_provider
 
         assert self.embedding_provider is not None, "Embedding provider is required"
+        self._register_embedding_metrics(self.embedding_provider)
 
-        logger.info(f"Initializing Qdrant connector - Location: {qdrant_settings.location}, Collection: {qdrant_settings.collection_name}")
+        logger.info(
+            f"Initializing Qdrant connector - Location: {qdrant_settings.location}, "
+            f"Collection: {qdrant_settings.collection_name}, "
+            f"Transport: {'gRPC' if qdrant_settings.prefer_grpc else 'REST'}, "
+            f"Hybrid search: {self.sparse_embedding_provider is not None}"
+        )
         self.qdrant_connector = QdrantConnector(
             qdrant_settings.location,
             qdrant_settings.api_key,
@@ -78,20 +165,257 @@ class QdrantMCPServer(FastMCP):
             qdrant_settings.local_path,
             make_indexes(qdrant_settings.filterable_fields_dict()),
             qdrant_settings.score_threshold,
+            qdrant_settings.store_batch_size,
+            qdrant_settings.collection_cache_ttl,
+            qdrant_settings.client_options(),
+            sparse_embedding_provider=self.sparse_embedding_provider,
+            hybrid_fusion=qdrant_settings.hybrid_fusion,
+            hybrid_prefetch_limit=qdrant_settings.hybrid_prefetch_limit,
+            vector_options=qdrant_settings.vector_options(),
+            search_params=qdrant_settings.search_params(),
+            payload_include=qdrant_settings.payload_include,
+            payload_exclude=qdrant_settings.payload_exclude,
+            point_id_mode=qdrant_settings.point_id_mode,
+            point_id_metadata_keys=qdrant_settings.point_id_metadata_keys,
+            skip_existing=qdrant_settings.skip_existing,
+            mmr_lambda=qdrant_settings.mmr_lambda,
+            mmr_candidates_factor=qdrant_settings.mmr_candidates_factor,
+            mmr_method=qdrant_settings.mmr_method,
+            search_cache_size=qdrant_settings.search_cache_size,
+            search_cache_ttl=qdrant_settings.search_cache_ttl,
+            metrics=self.metrics,
         )
 
-        logger.info("Initializing FastMCP parent class...")
-        super().__init__(name=name, instructions=instructions, **settings)
+    def _initialize_in_background(self):
+        try:
+            self._initialize_backend()
+        except BaseException as e:
+            logger.error(f"Failed to initialize the server: {e}", exc_info=True)
+            self._ready.set_exception(e)
+        else:
+            logger.info("Embedding provider and Qdrant connector are ready")
+            self._ready.set_result(None)
 
-        logger.info("Setting up tools...")
-        self.setup_tools()
-        logger.info("QdrantMCPServer initialization complete")
+    @property
+    def ready(self) -> bool:
+        """Whether the embedding provider and the Qdrant connector were created successfully."""
+        return self._ready.done() and self._ready.exception() is None
+
+    async def wait_until_ready(self, ctx: Context | None = None):
+        """
+        Wait for the embedding provider and the Qdrant connector to be created.
+        :param ctx: The context of the tool call waiting, notified when it has to wait.
+        :raises Exception: The error raised while creating them, if any.
+        """
+        if not self._ready.done() and ctx is not None:
+            await ctx.info("Waiting for the embedding model and the Qdrant client to load")
+        await asyncio.wrap_future(self._ready)
+
+    def _warmup_lifespan(self, lifespan):
+        """
+        Wrap the lifespan of the server, to run the warm-up in the background while it runs.
+        """
+
+        @asynccontextmanager
+        async def warmup_lifespan(server: FastMCP):
+            # Not awaited, so that the server answers the handshake meanwhile
+            task = asyncio.create_task(self.warm_up())
+            try:
+                if lifespan is None:
+                    yield {}
+                else:
+                    async with lifespan(server) as result:
+                        yield result
+            finally:
+                task.cancel()
+
+        return warmup_lifespan
+
+    def _watch_lifespan(self, lifespan):
+        """
+        Wrap the lifespan of the server, to watch the indexed directory while it runs.
+        """
+
+        @asynccontextmanager
+        async def watch_lifespan(server: FastMCP):
+            stop_event = asyncio.Event()
+            task = asyncio.create_task(self.watch(stop_event))
+            try:
+                if lifespan is None:
+                    yield {}
+                else:
+                    async with lifespan(server) as result:
+                        yield result
+            finally:
+                stop_event.set()
+                task.cancel()
+
+        return watch_lifespan
+
+    async def watch(self, stop_event: asyncio.Event | None = None):
+        """
+        Index the directory of the indexer settings into the default collection, then keep it in
+        sync with the changes of its files. Failures are logged, and never raised.
+        :param stop_event: The event stopping the watch. If not provided, watches until cancelled.
+        """
+        from mcp_server_qdrant.indexer import create_index_connector, create_indexer
+
+        settings = self.indexer_settings
+        assert settings is not None and settings.watch_path is not None
+        collection_name = self.qdrant_settings.collection_name
+        if collection_name is None:
+            logger.error("Watching a directory requires COLLECTION_NAME to be set")
+            return
+        try:
+            await self.wait_until_ready()
+        except Exception:
+            # Already reported by the startup
+            return
+
+        connector = create_index_connector(
+            collection_name,
+            qdrant_settings=self.qdrant_settings,
+            embedding_provider=self.embedding_provider,
+            sparse_embedding_provider=self.sparse_embedding_provider,
+            # Not the server registry, the stage latencies only describe the tool calls
+            client=self.qdrant_connector.client,
+        )
+        indexer = create_indexer(
+            connector, settings.watch_path, settings, collection_name=collection_name
+        )
+        try:
+            await indexer.watch(
+                **settings.watch_options(),
+                foreground=self.foreground,
+                stop_event=stop_event,
+                # The watcher writes through its own connector: this server would otherwise
+                # keep the former chunks and the collection metadata from before the sync
+                on_sync=lambda stats: self.qdrant_connector.invalidate_collection(
+                    collection_name
+                ),
+            )
+        except Exception as e:
+            logger.error(f"Watching {settings.watch_path} failed: {e}", exc_info=True)
+
+    async def warm_up(self) -> dict[str, float]:
+        """
+        Run dummy embeddings and trivial Qdrant requests, which initialize the embedding models
+        and open the connections. Each step is timed in the logs and in the
+        `warmup_duration_seconds` metric. Failures are logged, and never raised.
+        :return: The duration of each successful step, in seconds.
+        """
+        try:
+            await self.wait_until_ready()
+        except Exception:
+            # Already reported by the startup
+            return {}
+
+        assert self.embedding_provider is not None
+        # The innermost providers, so that the dummy texts are neither cached, nor counted
+        # in the batching and cache metrics
+        provider = self._innermost_provider(self.embedding_provider)
+        sparse_provider = self._innermost_provider(self.sparse_embedding_provider)
+        steps = {
+            "embed_query": lambda: provider.embed_query("warm up"),
+            "embed_documents": lambda: provider.embed_documents(["warm up"]),
+            "qdrant": self.qdrant_connector.warm_up,
+        }
+        if sparse_provider is not None:
+            steps["embed_sparse"] = lambda: sparse_provider.embed_queries(["warm up"])
+
+        timings = {}
+        for step, run in steps.items():
+            started = time.perf_counter()
+            try:
+                await run()
+            except Exception as e:
+                logger.warning(f"Warm-up step {step} failed: {e}")
+                continue
+            timings[step] = time.perf_counter() - started
+            self.metrics.histogram(
+                "warmup_duration_seconds",
+                "Time spent in each step of the warm-up at server start",
+                step=step,
+            ).observe(timings[step])
+            logger.info(f"Warm-up step {step} took {timings[step] * 1000:.1f} ms")
+        return timings
+
+    @staticmethod
+    def _innermost_provider(
+        provider: EmbeddingProvider | SparseEmbeddingProvider | None,
+    ) -> Any:
+        """Get the provider wrapped by caching and batching wrappers, which expose it as `.provider`."""
+        while getattr(provider, "provider", None) is not None:
+            provider = provider.provider
+        return provider
+
+    def _register_embedding_metrics(self, provider: EmbeddingProvider):
+        """
+        Export the statistics of the embedding provider and of each wrapper around it.
+        """
+        # Wrappers expose the provider they wrap as `.provider`
+        while provider is not None:
+            if hasattr(provider, "histograms"):
+                for histogram in provider.histograms():
+                    self.metrics.register(histogram)
+            if hasattr(provider, "hits") and hasattr(provider, "misses"):
+                self.metrics.add_collector(self._cache_counters(provider))
+            provider = getattr(provider, "provider", None)
+
+    @staticmethod
+    def _cache_counters(provider: EmbeddingProvider):
+        cache = type(provider).__name__
+
+        def collect() -> list[Metric]:
+            return [
+                Counter(
+                    "embedding_cache_hits_total",
+                    "Number of embeddings served from a cache",
+                    {"cache": cache},
+                    provider.hits,  # type: ignore[attr-defined]
+                ),
+                Counter(
+                    "embedding_cache_misses_total",
+                    "Number of embeddings that had to be computed",
+                    {"cache": cache},
+                    provider.misses,  # type: ignore[attr-defined]
+                ),
+            ]
+
+        return collect
+
+    @contextmanager
+    def _track_tool(self, tool: str) -> Iterator[None]:
+        """
+        Record the duration of a tool call, and count it as an error if it raises.
+        """
+        try:
+            with self.metrics.histogram(
+                "tool_duration_seconds", "Time spent handling tool calls", tool=tool
+            ).time():
+                yield
+        except Exception:
+            self.metrics.counter(
+                "tool_errors_total", "Number of tool calls that failed", tool=tool
+            ).inc()
+            raise
+
+    async def metrics_endpoint(self, request: Request) -> PlainTextResponse:
+        """
+        Serve the metrics in the Prometheus text exposition format.
+        """
+        return PlainTextResponse(
+            self.metrics.render(),
+            media_type="text/plain; version=0.0.4; charset=utf-8",
+        )
 
     def format_entry(self, entry: Entry) -> str:
         """
         Feel free to override this method in your subclass to customize the format of the entry.
         """
         lines = []
+        if entry.id is not None:
+            lines.append(f"ID: {entry.id}")
         
         # Extract file path and line numbers from metadata
         if entry.metadata:
@@ -119,6 +443,56 @@ class QdrantMCPServer(FastMCP):
         
         return "\n".join(lines)
 
+    def format_results(self, query: str, entries: list[Entry]) -> TextContent:
+        """
+        Format the entries found for a query, with a header naming the query.
+        """
+        if not entries:
+            return TextContent(type="text", text=f"No results found for the query '{query}'.")
+
+        # Format results with a clean header
+        result_text = f"Results for the query '{query}':\n\n"
+        formatted_entries = []
+        with self._format_latency.time():
+            for entry in entries:
+                formatted_entries.append(self.format_entry(entry))
+        result_text += "\n\n".join(formatted_entries)
+
+        return TextContent(type="text", text=result_text)
+
+    async def format_results_separately(
+        self, ctx: Context, query: str, entries: list[Entry]
+    ) -> list[TextContent]:
+        """
+        Format the entries found for a query as a header followed by one item per entry, so that
+        clients can display each entry without parsing one large text. Progress is reported
+        after each entry, which lets clients of streaming transports follow long formatting.
+        """
+        if not entries:
+            return [self.format_results(query, entries)]
+
+        contents = [TextContent(type="text", text=f"Results for the query '{query}':")]
+        for i, entry in enumerate(entries):
+            with self._format_latency.time():
+                text = self.format_entry(entry)
+            contents.append(TextContent(type="text", text=text))
+            await ctx.report_progress(i + 1, len(entries))
+        return contents
+
+    def format_update(self, status: Any, verb: str, collection_name: str | None) -> str:
+        """
+        Describe the outcome of a deletion or an update of entries.
+        :param status: The status of the operation, or None if the collection does not exist.
+        :param verb: The past participle of the operation, e.g. "Deleted".
+        :param collection_name: The name of the collection, if not the default one.
+        """
+        collection = f" in collection {collection_name}" if collection_name else ""
+        if status is None:
+            return f"No entries{collection}: the collection does not exist"
+        if status == "acknowledged":
+            return f"{verb} the selected entries{collection} in the background"
+        return f"{verb} the selected entries{collection}"
+
     def setup_tools(self):
         """
         Register the tools in the server.
@@ -149,14 +523,64 @@ class QdrantMCPServer(FastMCP):
                                     the default collection is used.
             :return: A message indicating that the information was stored.
             """
-            await ctx.debug(f"Storing information {information} in Qdrant")
+            with self._track_tool("qdrant-store"):
+                await self.wait_until_ready(ctx)
+                await ctx.debug(f"Storing information {information} in Qdrant")
 
-            entry = Entry(content=information, metadata=metadata)
+                entry = Entry(content=information, metadata=metadata)
 
-            await self.qdrant_connector.store(entry, collection_name=collection_name)
-            if collection_name:
-                return f"Remembered: {information} in collection {collection_name}"
-            return f"Remembered: {information}"
+                await self.qdrant_connector.store(entry, collection_name=collection_name)
+                if collection_name:
+                    return f"Remembered: {information} in collection {collection_name}"
+                return f"Remembered: {information}"
+
+        async def store_batch(
+            ctx: Context,
+            information: Annotated[
+                list[str], Field(description="Texts to store, one entry per item")
+            ],
+            collection_name: Annotated[
+                str, Field(description="The collection to store the information in")
+            ],
+            metadata: Annotated[
+                list[Metadata | None] | None,
+                Field(
+                    description="Extra metadata for each text, in the same order as `information`. "
+                    "Any json is accepted."
+                ),
+            ] = None,
+        ) -> str:
+            """
+            Store many pieces of information in Qdrant at once.
+            :param ctx: The context for the request.
+            :param information: The texts to store.
+            :param metadata: JSON metadata for each text, optional. Must have the same length as `information`.
+            :param collection_name: The name of the collection to store the information in, optional. If not provided,
+                                    the default collection is used.
+            :return: A message indicating how many entries were stored.
+            """
+            with self._track_tool("qdrant-store-batch"):
+                await self.wait_until_ready(ctx)
+                if metadata is not None and len(metadata) != len(information):
+                    raise ValueError(
+                        f"Got {len(metadata)} metadata items for {len(information)} texts"
+                    )
+
+                await ctx.debug(f"Storing {len(information)} entries in Qdrant")
+
+                entries = [
+                    Entry(content=content, metadata=metadata[i] if metadata else None)
+                    for i, content in enumerate(information)
+                ]
+                stored = await self.qdrant_connector.store_many(
+                    entries, collection_name=collection_name
+                )
+                message = f"Remembered {stored} entries"
+                if collection_name:
+                    message += f" in collection {collection_name}"
+                if stored < len(entries):
+                    message += f" ({len(entries) - stored} unchanged or duplicate entries skipped)"
+                return message
 
         async def find(
             ctx: Context,
@@ -164,6 +588,13 @@ class QdrantMCPServer(FastMCP):
             collection_name: Annotated[
                 str, Field(description="The collection to search in")
             ],
+            offset: Annotated[
+                int,
+                Field(
+                    ge=0,
+                    description="Number of results to skip, to get the next page of results",
+                ),
+            ] = 0,
             query_filter: ArbitraryFilter | None = None,
         ) -> list[TextContent]:
             """
@@ -172,60 +603,258 @@ class QdrantMCPServer(FastMCP):
             :param query: The query to use for the search.
             :param collection_name: The name of the collection to search in, optional. If not provided,
                                     the default collection is used.
+            :param offset: The number of results to skip. The response tells the offset of the next page.
             :param query_filter: The filter to apply to the query.
             :return: A list of TextContent entries found, or a message indicating no results were found.
             """
+            with self._track_tool("qdrant-find"), self.foreground.track():
+                await self.wait_until_ready(ctx)
+                # Log query_filter
+                await ctx.debug(f"Query filter: {query_filter}")
 
-            # Log query_filter
-            await ctx.debug(f"Query filter: {query_filter}")
+                # Arbitrary filters come as dictionaries, filterable fields as built filters
+                if isinstance(query_filter, dict):
+                    from qdrant_client import models
 
-            query_filter = models.Filter(**query_filter) if query_filter else None
+                    query_filter = models.Filter(**query_filter) if query_filter else None
 
-            await ctx.debug(f"Finding results for query {query}")
+                await ctx.debug(f"Finding results for query {query}")
 
-            entries = await self.qdrant_connector.search(
-                query,
-                collection_name=collection_name,
-                limit=self.qdrant_settings.search_limit,
-                query_filter=query_filter,
-            )
-            if not entries:
-                return [TextContent(type="text", text=f"No results found for the query '{query}'.")]
-            
-            # Format results with a clean header
-            result_text = f"Results for the query '{query}':\n\n"
-            formatted_entries = []
-            for entry in entries:
-                formatted_entries.append(self.format_entry(entry))
-            result_text += "\n\n".join(formatted_entries)
-            
-            return [TextContent(type="text", text=result_text)]
+                # One extra entry tells whether there is a next page
+                page_size = self.qdrant_settings.search_limit
+                entries = await self.qdrant_connector.search(
+                    query,
+                    collection_name=collection_name,
+                    limit=page_size + 1,
+                    offset=offset,
+                    query_filter=query_filter,
+                )
+                has_more = len(entries) > page_size
+                entries = entries[:page_size]
+
+                if self.tool_settings.find_separate_entries:
+                    contents = await self.format_results_separately(ctx, query, entries)
+                else:
+                    contents = [self.format_results(query, entries)]
+                if has_more:
+                    contents.append(
+                        TextContent(
+                            type="text",
+                            text=f"More results are available: call again with offset={offset + page_size}.",
+                        )
+                    )
+                return contents
+
+        async def find_many(
+            ctx: Context,
+            queries: Annotated[
+                list[str], Field(description="What to search for, one item per query")
+            ],
+            collection_name: Annotated[
+                str, Field(description="The collection to search in")
+            ],
+            deduplicate: Annotated[
+                bool,
+                Field(
+                    description="Only return each result for the first query that found it"
+                ),
+            ] = False,
+            query_filter: ArbitraryFilter | None = None,
+        ) -> list[TextContent]:
+            """
+            Find memories in Qdrant for several queries in a single round trip.
+            :param ctx: The context for the request.
+            :param queries: The queries to use for the search.
+            :param collection_name: The name of the collection to search in, optional. If not provided,
+                                    the default collection is used.
+            :param deduplicate: If True, results already returned for a previous query are skipped.
+            :param query_filter: The filter to apply to all the queries.
+            :return: A TextContent with the results of each query, in the order of the queries.
+            """
+            with self._track_tool("qdrant-find-many"), self.foreground.track():
+                await self.wait_until_ready(ctx)
+                await ctx.debug(f"Query filter: {query_filter}")
+
+                # Arbitrary filters come as dictionaries, filterable fields as built filters
+                if isinstance(query_filter, dict):
+                    from qdrant_client import models
+
+                    query_filter = models.Filter(**query_filter) if query_filter else None
+
+                await ctx.debug(f"Finding results for {len(queries)} queries")
+
+                results = await self.qdrant_connector.search_many(
+                    queries,
+                    collection_name=collection_name,
+                    limit=self.qdrant_settings.search_limit,
+                    query_filters=[query_filter] * len(queries),
+                    deduplicate=deduplicate,
+                )
+                return [
+                    self.format_results(query, entries)
+                    for query, entries in zip(queries, results)
+                ]
+
+        async def delete(
+            ctx: Context,
+            collection_name: Annotated[
+                str, Field(description="The collection to delete from")
+            ],
+            point_ids: Annotated[
+                list[str | int] | None,
+                Field(description="IDs of the entries to delete, as shown by the find tool"),
+            ] = None,
+            wait: Annotated[
+                bool,
+                Field(
+                    description="Wait for the entries to be deleted. Set to false to return "
+                    "immediately when deleting many entries"
+                ),
+            ] = True,
+            query_filter: ArbitraryFilter | None = None,
+        ) -> str:
+            """
+            Delete entries from Qdrant, selected by their IDs, a filter, or both.
+            :param ctx: The context for the request.
+            :param collection_name: The name of the collection to delete from, optional. If not provided,
+                                    the default collection is used.
+            :param point_ids: The IDs of the entries to delete, optional.
+            :param wait: If False, the deletion is only acknowledged by Qdrant.
+            :param query_filter: The filter selecting the entries to delete, optional.
+            :return: A message indicating whether the entries were deleted.
+            """
+            with self._track_tool("qdrant-delete"):
+                await self.wait_until_ready(ctx)
+                await ctx.debug(f"Deleting entries {point_ids} matching {query_filter}")
+
+                if isinstance(query_filter, dict):
+                    from qdrant_client import models
+
+                    query_filter = models.Filter(**query_filter) if query_filter else None
+
+                status = await self.qdrant_connector.delete(
+                    query_filter,
+                    point_ids=point_ids,
+                    collection_name=collection_name,
+                    wait=wait,
+                )
+                return self.format_update(status, "Deleted", collection_name)
+
+        async def update_metadata(
+            ctx: Context,
+            metadata: Annotated[
+                Metadata,
+                Field(description="Metadata fields to set. Fields not listed are kept."),
+            ],
+            collection_name: Annotated[
+                str, Field(description="The collection to update")
+            ],
+            point_ids: Annotated[
+                list[str | int] | None,
+                Field(description="IDs of the entries to update, as shown by the find tool"),
+            ] = None,
+            wait: Annotated[
+                bool,
+                Field(
+                    description="Wait for the entries to be updated. Set to false to return "
+                    "immediately when updating many entries"
+                ),
+            ] = True,
+            query_filter: ArbitraryFilter | None = None,
+        ) -> str:
+            """
+            Set metadata fields of entries in Qdrant, selected by their IDs, a filter, or both.
+            :param ctx: The context for the request.
+            :param metadata: The metadata fields to set.
+            :param collection_name: The name of the collection to update, optional. If not provided,
+                                    the default collection is used.
+            :param point_ids: The IDs of the entries to update, optional.
+            :param wait: If False, the update is only acknowledged by Qdrant.
+            :param query_filter: The filter selecting the entries to update, optional.
+            :return: A message indicating whether the entries were updated.
+            """
+            with self._track_tool("qdrant-update-metadata"):
+                await self.wait_until_ready(ctx)
+                await ctx.debug(f"Setting {metadata} on entries {point_ids} matching {query_filter}")
+
+                if isinstance(query_filter, dict):
+                    from qdrant_client import models
+
+                    query_filter = models.Filter(**query_filter) if query_filter else None
+
+                status = await self.qdrant_connector.update_metadata(
+                    metadata,
+                    query_filter,
+                    point_ids=point_ids,
+                    collection_name=collection_name,
+                    wait=wait,
+                )
+                return self.format_update(status, "Updated", collection_name)
 
         find_foo = find
+        find_many_foo = find_many
         store_foo = store
+        store_batch_foo = store_batch
+        delete_foo = delete
+        update_metadata_foo = update_metadata
 
         filterable_conditions = (
             self.qdrant_settings.filterable_fields_dict_with_conditions()
         )
 
         if len(filterable_conditions) > 0:
-            find_foo = wrap_filters(find_foo, filterable_conditions)
+            from mcp_server_qdrant.common.filters import FilterBuilder
+            from mcp_server_qdrant.common.wrap_filters import wrap_filters
+
+            # Compiled once and shared, so that both tools reuse the memoized filters
+            filter_builder = FilterBuilder(filterable_conditions)
+            find_foo = wrap_filters(find_foo, filterable_conditions, filter_builder)
+            find_many_foo = wrap_filters(find_many_foo, filterable_conditions, filter_builder)
+            delete_foo = wrap_filters(delete_foo, filterable_conditions, filter_builder)
+            update_metadata_foo = wrap_filters(
+                update_metadata_foo, filterable_conditions, filter_builder
+            )
         elif not self.qdrant_settings.allow_arbitrary_filter:
             find_foo = make_partial_function(find_foo, {"query_filter": None})
+            find_many_foo = make_partial_function(find_many_foo, {"query_filter": None})
+            # Entries are then only selected by their IDs
+            delete_foo = make_partial_function(delete_foo, {"query_filter": None})
+            update_metadata_foo = make_partial_function(
+                update_metadata_foo, {"query_filter": None}
+            )
 
         if self.qdrant_settings.collection_name:
             find_foo = make_partial_function(
                 find_foo, {"collection_name": self.qdrant_settings.collection_name}
             )
+            find_many_foo = make_partial_function(
+                find_many_foo, {"collection_name": self.qdrant_settings.collection_name}
+            )
             store_foo = make_partial_function(
                 store_foo, {"collection_name": self.qdrant_settings.collection_name}
             )
+            store_batch_foo = make_partial_function(
+                store_batch_foo,
+                {"collection_name": self.qdrant_settings.collection_name},
+            )
+            delete_foo = make_partial_function(
+                delete_foo, {"collection_name": self.qdrant_settings.collection_name}
+            )
+            update_metadata_foo = make_partial_function(
+                update_metadata_foo,
+                {"collection_name": self.qdrant_settings.collection_name},
+            )
 
         self.tool(
             find_foo,
             name="qdrant-find",
             description=self.tool_settings.tool_find_description,
         )
+        self.tool(
+            find_many_foo,
+            name="qdrant-find-many",
+            description=self.tool_settings.tool_find_many_description,
+        )
 
         if not self.qdrant_settings.read_only:
             # Those methods can modify the database
@@ -234,3 +863,18 @@ class QdrantMCPServer(FastMCP):
                 name="qdrant-store",
                 description=self.tool_settings.tool_store_description,
             )
+            self.tool(
+                store_batch_foo,
+                name="qdrant-store-batch",
+                description=self.tool_settings.tool_store_batch_description,
+            )
+            self.tool(
+                delete_foo,
+                name="qdrant-delete",
+                description=self.tool_settings.tool_delete_description,
+            )
+            self.tool(
+                update_metadata_foo,
+                name="qdrant-update-metadata",
+                description=self.tool_settings.tool_update_metadata_description,
+            )
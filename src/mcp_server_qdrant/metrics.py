@@ -0,0 +1,225 @@
+import bisect
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, Sequence, Union
+
+# Upper bounds in seconds, suited for embedding and Qdrant call latencies
+DEFAULT_LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Histogram:
+    """
+    Cumulative histogram of observed values, in the style of Prometheus histograms.
+    Observations are expected to come from the event loop thread.
+    :param name: The name of the histogram.
+    :param description: A human readable description of what is observed.
+    :param buckets: The sorted upper bounds of the buckets. An implicit `+Inf` bucket is added.
+    :param labels: The labels distinguishing this histogram from others with the same name.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        labels: dict[str, str] | None = None,
+    ):
+        self.name = name
+        self.description = description
+        self.labels = labels or {}
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        """Record a single observation."""
+        self._counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the duration of the wrapped block in seconds, even if it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+    def cumulative_counts(self) -> list[tuple[float, int]]:
+        """Get the number of observations less than or equal to each bucket bound."""
+        result = []
+        total = 0
+        for bound, count in zip((*self.buckets, float("inf")), self._counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def snapshot(self) -> dict:
+        """Get the current state of the histogram as a plain dictionary."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": {str(bound): count for bound, count in self.cumulative_counts()},
+        }
+
+
+class Counter:
+    """
+    Monotonically increasing counter, in the style of Prometheus counters.
+    :param name: The name of the counter, conventionally ending with `_total`.
+    :param description: A human readable description of what is counted.
+    :param labels: The labels distinguishing this counter from others with the same name.
+    :param value: The initial value, used to export counters maintained elsewhere.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: dict[str, str] | None = None,
+        value: float = 0,
+    ):
+        self.name = name
+        self.description = description
+        self.labels = labels or {}
+        self.value = value
+
+    def inc(self, amount: float = 1):
+        """Increase the counter."""
+        self.value += amount
+
+
+Metric = Union[Counter, Histogram]
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = []
+    for key, value in sorted(labels.items()):
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{key}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsRegistry:
+    """
+    Holds the metrics of a server and renders them in the Prometheus text exposition format.
+    Metrics are plain Python objects updated in place, so recording an observation costs
+    a few attribute updates and no locking. Values maintained by other components, like
+    cache hit counters, are read only when the metrics are rendered, through collectors.
+    :param namespace: The prefix added to the name of every exported metric.
+    """
+
+    def __init__(self, namespace: str = "mcp_qdrant"):
+        self.namespace = namespace
+        self._metrics: dict[tuple[str, tuple[tuple[str, str], ...]], Metric] = {}
+        self._collectors: list[Callable[[], Iterable[Metric]]] = []
+
+    def _get_or_create(self, metric_type: type, name: str, labels: dict[str, str], create):
+        key = (name, tuple(sorted(labels.items())))
+        metric = self._metrics.get(key)
+        if metric is None:
+            metric = self._metrics[key] = create()
+        elif not isinstance(metric, metric_type):
+            raise ValueError(f"Metric {name} is already registered as a {type(metric).__name__}")
+        return metric
+
+    def counter(self, name: str, description: str, **labels: str) -> Counter:
+        """
+        Get the counter with the given name and labels, creating it if needed.
+        :param name: The name of the counter, without the namespace.
+        :param description: A human readable description of what is counted.
+        :param labels: The labels of the counter.
+        :return: The counter.
+        """
+        return self._get_or_create(
+            Counter, name, labels, lambda: Counter(name, description, labels)
+        )
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        **labels: str,
+    ) -> Histogram:
+        """
+        Get the histogram with the given name and labels, creating it if needed.
+        :param name: The name of the histogram, without the namespace.
+        :param description: A human readable description of what is observed.
+        :param buckets: The upper bounds of the buckets, used if the histogram is created.
+        :param labels: The labels of the histogram.
+        :return: The histogram.
+        """
+        return self._get_or_create(
+            Histogram, name, labels, lambda: Histogram(name, description, buckets, labels)
+        )
+
+    def register(self, metric: Metric):
+        """
+        Export a metric created elsewhere, e.g. the histograms of an embedding batcher.
+        :param metric: The metric to export.
+        """
+        self._metrics[(metric.name, tuple(sorted(metric.labels.items())))] = metric
+
+    def add_collector(self, collector: Callable[[], Iterable[Metric]]):
+        """
+        Export metrics computed on demand. The collector is called on every render.
+        :param collector: A function returning the metrics to export.
+        """
+        self._collectors.append(collector)
+
+    def collect(self) -> list[Metric]:
+        """Get all the registered and collected metrics."""
+        metrics = list(self._metrics.values())
+        for collector in self._collectors:
+            metrics.extend(collector())
+        return metrics
+
+    def render(self) -> str:
+        """Render all the metrics in the Prometheus text exposition format."""
+        families: dict[str, list[Metric]] = {}
+        for metric in self.collect():
+            families.setdefault(metric.name, []).append(metric)
+
+        lines = []
+        for name, metrics in sorted(families.items()):
+            full_name = f"{self.namespace}_{name}" if self.namespace else name
+            metric_type = "histogram" if isinstance(metrics[0], Histogram) else "counter"
+            lines.append(f"# HELP {full_name} {metrics[0].description}")
+            lines.append(f"# TYPE {full_name} {metric_type}")
+            for metric in metrics:
+                if isinstance(metric, Histogram):
+                    for bound, count in metric.cumulative_counts():
+                        labels = _format_labels({**metric.labels, "le": _format_value(bound)})
+                        lines.append(f"{full_name}_bucket{labels} {count}")
+                    labels = _format_labels(metric.labels)
+                    lines.append(f"{full_name}_sum{labels} {_format_value(metric.sum)}")
+                    lines.append(f"{full_name}_count{labels} {metric.count}")
+                else:
+                    labels = _format_labels(metric.labels)
+                    lines.append(f"{full_name}{labels} {_format_value(metric.value)}")
+        return "\n".join(lines) + "\n"
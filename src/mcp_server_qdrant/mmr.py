@@ -0,0 +1,43 @@
+from typing import Sequence
+
+import numpy as np
+
+
+def mmr_select(
+    query_vector: Sequence[float] | np.ndarray,
+    vectors: Sequence[Sequence[float]] | np.ndarray,
+    limit: int,
+    lambda_mult: float = 0.5,
+) -> list[int]:
+    """
+    Select a relevant but diverse subset of candidates with Maximal Marginal Relevance: each step
+    picks the candidate maximizing `lambda_mult * sim(query, c) - (1 - lambda_mult) * max sim(c, s)`
+    over the already selected candidates `s`. Similarities are cosine similarities.
+    The similarity of each candidate to the selected ones is updated with one matrix-vector product
+    per step, so the selection costs O(limit * candidates * dim) without any pairwise matrix.
+    :param query_vector: The vector of the query.
+    :param vectors: The vectors of the candidates, usually in their relevance order.
+    :param limit: The number of candidates to select.
+    :param lambda_mult: The trade-off between relevance (1) and diversity (0).
+    :return: The indices of the selected candidates, in their selection order.
+    """
+    candidates = np.asarray(vectors, dtype=np.float32)
+    count = min(limit, len(candidates))
+    if count <= 0:
+        return []
+    candidates = candidates / np.maximum(np.linalg.norm(candidates, axis=1, keepdims=True), 1e-12)
+    query = np.asarray(query_vector, dtype=np.float32)
+    query = query / max(float(np.linalg.norm(query)), 1e-12)
+
+    relevance = candidates @ query
+    # The first candidate is the most relevant one, as nothing is selected yet
+    scores = relevance.copy()
+    redundancy = np.full(len(candidates), -np.inf, dtype=np.float32)
+    selected: list[int] = []
+    for _ in range(count):
+        best = int(np.argmax(scores))
+        selected.append(best)
+        np.maximum(redundancy, candidates @ candidates[best], out=redundancy)
+        scores = lambda_mult * relevance - (1 - lambda_mult) * redundancy
+        scores[selected] = -np.inf
+    return selected
@@ -0,0 +1,167 @@
+from typing import Any, Callable
+
+from mcp_server_qdrant.settings import METADATA_PATH
+
+Payload = dict[str, Any]
+Metadata = dict[str, Any]
+Extractor = Callable[[Payload], tuple[str, Metadata | None]]
+
+
+class PayloadFormat:
+    """
+    Adapter reading entries from the payloads written by a given tool, e.g. this server or a
+    code indexer. The extractor is built once, so parsing a point costs no format probing.
+    :param name: The unique name of the format, cached in the metadata of collections.
+    :param content_field: The payload field holding the content of entries. If not provided,
+                          the format matches any payload and the whole payload is the content.
+    :param metadata_field: The payload field holding the metadata of entries. If not provided,
+                           all the other fields of the payload are the metadata.
+    :param fields: The payload fields displayed for this format, the only ones fetched by searches.
+                   If not provided, the whole payload is fetched.
+    :param extractor: A custom function converting a payload into a content and its metadata,
+                      replacing the one built from the fields above.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        content_field: str | None,
+        metadata_field: str | None = None,
+        fields: list[str] | None = None,
+        extractor: Extractor | None = None,
+    ):
+        self.name = name
+        self.content_field = content_field
+        self.metadata_field = metadata_field
+        self.fields = fields
+        self.extract: Extractor = extractor or self._compile()
+
+    def matches(self, payload: Payload) -> bool:
+        """Check whether a payload is in this format."""
+        return self.content_field is None or self.content_field in payload
+
+    def make_payload(self, content: str, metadata: Metadata | None) -> Payload:
+        """
+        Build the payload storing an entry in this format, the inverse of `extract`.
+        :param content: The content of the entry.
+        :param metadata: The metadata of the entry.
+        :return: The payload of the point.
+        """
+        if self.content_field is None:
+            raise ValueError(f"Entries cannot be stored in the {self.name!r} payload format")
+        if self.metadata_field is not None:
+            return {self.content_field: content, self.metadata_field: metadata}
+        return {**(metadata or {}), self.content_field: content}
+
+    def _compile(self) -> Extractor:
+        content_field = self.content_field
+        metadata_field = self.metadata_field
+
+        if content_field is None:
+
+            def extract_raw(payload: Payload) -> tuple[str, Metadata | None]:
+                return str(payload), None
+
+            return extract_raw
+
+        if metadata_field is not None:
+
+            def extract_field(payload: Payload) -> tuple[str, Metadata | None]:
+                return _as_text(payload[content_field]), payload.get(metadata_field)
+
+            return extract_field
+
+        def extract_rest(payload: Payload) -> tuple[str, Metadata | None]:
+            metadata = dict(payload)
+            return _as_text(metadata.pop(content_field)), metadata
+
+        return extract_rest
+
+    def __repr__(self) -> str:
+        return f"PayloadFormat({self.name!r})"
+
+
+def _as_text(value: Any) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+# Formats of the entries stored by this server and by code indexers
+DOCUMENT_FORMAT = PayloadFormat(
+    "document",
+    content_field="document",
+    metadata_field=METADATA_PATH,
+    fields=["document", METADATA_PATH],
+)
+CODE_CHUNK_FORMAT = PayloadFormat(
+    "codeChunk",
+    content_field="codeChunk",
+    fields=["codeChunk", "filePath", "startLine", "endLine"],
+)
+# Generic formats, holding their content in a common text field
+TEXT_FIELD_FORMATS = [
+    PayloadFormat(field, content_field=field)
+    for field in ("text", "content", "body", "description")
+]
+# Fallback for payloads without any known text field
+RAW_FORMAT = PayloadFormat("raw", content_field=None)
+
+
+class PayloadFormatRegistry:
+    """
+    Known payload formats, in the order they are tried when detecting the format of a payload.
+    Payloads matching none of them are displayed as a whole, with the `raw` format.
+    :param formats: The known formats. If not provided, the formats of this server, of code
+                    indexers and of generic text payloads are known.
+    """
+
+    def __init__(self, formats: list[PayloadFormat] | None = None):
+        if formats is None:
+            formats = [DOCUMENT_FORMAT, CODE_CHUNK_FORMAT, *TEXT_FIELD_FORMATS]
+        self._formats: dict[str, PayloadFormat] = {}
+        for payload_format in formats:
+            self._formats[payload_format.name] = payload_format
+
+    def register(self, payload_format: PayloadFormat):
+        """
+        Add the format of another indexer. Registered formats are tried before the known ones,
+        and replace any known format with the same name.
+        :param payload_format: The format to add.
+        """
+        self._formats.pop(payload_format.name, None)
+        self._formats = {payload_format.name: payload_format, **self._formats}
+
+    def get(self, name: str | None) -> PayloadFormat | None:
+        """
+        Get a format by name.
+        :param name: The name of the format.
+        :return: The format, or None if it is not known.
+        """
+        if name == RAW_FORMAT.name:
+            return RAW_FORMAT
+        return self._formats.get(name) if name is not None else None
+
+    def projected_fields(self) -> list[str]:
+        """
+        Get the payload fields displayed by any known format, so that a search in a collection
+        mixing several formats fetches what each of its points needs. Formats displaying their
+        whole payload contribute their content field.
+        :return: The fields, in the order of the formats.
+        """
+        fields: dict[str, None] = {}
+        for payload_format in self._formats.values():
+            if payload_format.fields is not None:
+                fields.update(dict.fromkeys(payload_format.fields))
+            elif payload_format.content_field is not None:
+                fields[payload_format.content_field] = None
+        return list(fields)
+
+    def detect(self, payload: Payload) -> PayloadFormat:
+        """
+        Detect the format of a payload.
+        :param payload: The payload of a point.
+        :return: The first format matching the payload, or the `raw` format.
+        """
+        for payload_format in self._formats.values():
+            if payload_format.matches(payload):
+                return payload_format
+        return RAW_FORMAT
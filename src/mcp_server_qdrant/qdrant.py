@@ -1,27 +1,41 @@
+import asyncio
 import logging
 import uuid
-from typing import Any
+from typing import Any, Awaitable, TypeVar
 
-from pydantic import BaseModel
+import numpy as np
+from pydantic import TypeAdapter
 from qdrant_client import AsyncQdrantClient, models
 
-from mcp_server_qdrant.embeddings.base import EmbeddingProvider
-from mcp_server_qdrant.settings import METADATA_PATH
+from mcp_server_qdrant.collection_registry import (
+    UNNAMED_VECTOR,
+    CollectionMetadata,
+    CollectionRegistry,
+    is_not_found_error,
+)
+from mcp_server_qdrant.embeddings.base import EmbeddingProvider, SparseEmbeddingProvider
 
-logger = logging.getLogger(__name__)
+# Metadata and ArbitraryFilter are re-exported for backwards compatibility
+from mcp_server_qdrant.entry import (  # noqa: F401
+    ArbitraryFilter,
+    Entry,
+    Metadata,
+    content_point_id,
+)
+from mcp_server_qdrant.metrics import Counter, MetricsRegistry
+from mcp_server_qdrant.mmr import mmr_select
+from mcp_server_qdrant.payload_formats import (
+    DOCUMENT_FORMAT,
+    PayloadFormat,
+    PayloadFormatRegistry,
+)
+from mcp_server_qdrant.search_cache import SearchResultCache
 
-Metadata = dict[str, Any]
-ArbitraryFilter = dict[str, Any]
+logger = logging.getLogger(__name__)
 
+_ENTRY_LIST = TypeAdapter(list[Entry])
 
-class Entry(BaseModel):
-    """
-    A single entry in the Qdrant collection.
-    """
-
-    content: str
-    metadata: Metadata | None = None
-    score: float | None = None
+T = TypeVar("T")
 
 
 class QdrantConnector:
@@ -33,6 +47,45 @@ class QdrantConnector:
                             the collection name to be provided.
     :param embedding_provider: The embedding provider to use.
     :param qdrant_local_path: The path to the storage directory for the Qdrant client, if local mode is used.
+    :param store_batch_size: The number of entries embedded and upserted together by `store_many`.
+    :param collection_cache_ttl: Time to live in seconds of the cached collection metadata. If None, the
+                                 metadata is only refreshed when Qdrant reports a missing collection.
+    :param client_options: Extra transport options of the Qdrant client, e.g. `prefer_grpc` or `timeout`.
+    :param sparse_embedding_provider: The sparse embedding provider enabling hybrid search, optional. New
+                                      collections get a sparse vector, and collections having it are
+                                      searched with both vectors, fused by Qdrant.
+    :param hybrid_fusion: The fusion of dense and sparse results, "rrf" or "dbsf".
+    :param hybrid_prefetch_limit: The number of candidates fetched by each vector before fusion.
+    :param vector_options: Extra `VectorParams` options of the dense vector of new collections, e.g.
+                           `on_disk`, `hnsw_config` or `quantization_config`.
+    :param search_params: The search parameters of dense searches, e.g. `hnsw_ef` or quantization rescoring.
+    :param payload_include: The payload fields fetched by searches. If not provided, only the fields
+                            displayed for the detected payload format are fetched.
+    :param payload_exclude: The payload fields never fetched by searches, used if `payload_include` is not set.
+    :param payload_formats: The payload formats searched collections may use. If not provided, the formats
+                            of this server, of code indexers and of generic text payloads are known.
+    :param store_payload_format: The payload format of stored entries. If not provided, entries are stored
+                                 as a `document` and its `metadata`, like this server always did.
+    :param point_id_mode: "random" to give stored points random IDs, or "content" to derive them from
+                          their content and `point_id_metadata_keys`, so that storing an entry
+                          again overwrites its point.
+    :param point_id_metadata_keys: The metadata keys distinguishing entries with the same content in
+                                   the content ID mode, e.g. `filePath` and `startLine`.
+    :param skip_existing: Retrieve the content IDs before embedding, and skip the entries already
+                          stored. Changed metadata is still written, without embedding.
+    :param mmr_lambda: The trade-off between relevance (1) and diversity (0) of search results, re-ranked
+                       with Maximal Marginal Relevance so that near-duplicate entries, like overlapping
+                       code chunks, do not fill the results. If None, results are not re-ranked.
+    :param mmr_candidates_factor: The number of candidates fetched per returned entry for re-ranking.
+    :param mmr_method: "numpy" to re-rank the candidates in this process, or "qdrant" to use the MMR
+                       query of Qdrant 1.15+. Hybrid searches are always re-ranked in this process.
+    :param search_cache_size: The maximum number of searches whose results are cached. 0 disables the cache.
+    :param search_cache_ttl: Time to live of cached search results in seconds, bounding how long writes
+                             made outside of this connector stay unnoticed. If None, entries never expire.
+    :param metrics: The registry recording stage latencies, result counts and errors. If not provided,
+                    the connector keeps its own registry.
+    :param client: The client of another connector to share, e.g. because local storage can only be
+                   opened once. If provided, the connection settings above are ignored.
     """
 
     def __init__(
@@ -44,17 +97,129 @@ class QdrantConnector:
         qdrant_local_path: str | None = None,
         field_indexes: dict[str, models.PayloadSchemaType] | None = None,
         score_threshold: float | None = None,
+        store_batch_size: int = 64,
+        collection_cache_ttl: float | None = 60.0,
+        client_options: dict[str, Any] | None = None,
+        sparse_embedding_provider: SparseEmbeddingProvider | None = None,
+        hybrid_fusion: str = "rrf",
+        hybrid_prefetch_limit: int = 20,
+        vector_options: dict[str, Any] | None = None,
+        search_params: models.SearchParams | None = None,
+        payload_include: list[str] | None = None,
+        payload_exclude: list[str] | None = None,
+        payload_formats: PayloadFormatRegistry | None = None,
+        store_payload_format: PayloadFormat | None = None,
+        point_id_mode: str = "random",
+        point_id_metadata_keys: list[str] | None = None,
+        skip_existing: bool = False,
+        mmr_lambda: float | None = None,
+        mmr_candidates_factor: int = 4,
+        mmr_method: str = "numpy",
+        search_cache_size: int = 0,
+        search_cache_ttl: float | None = 30.0,
+        metrics: MetricsRegistry | None = None,
+        client: AsyncQdrantClient | None = None,
     ):
         self._qdrant_url = qdrant_url.rstrip("/") if qdrant_url else None
         self._qdrant_api_key = qdrant_api_key
         self._default_collection_name = collection_name
         self._embedding_provider = embedding_provider
-        self._client = AsyncQdrantClient(
-            location=qdrant_url, api_key=qdrant_api_key, path=qdrant_local_path
+        self._sparse_embedding_provider = sparse_embedding_provider
+        self._hybrid_fusion = models.Fusion(hybrid_fusion)
+        self._hybrid_prefetch_limit = hybrid_prefetch_limit
+        self._vector_options = vector_options or {}
+        self._search_params = search_params
+        self._payload_include = payload_include
+        self._payload_exclude = payload_exclude
+        self.payload_formats = payload_formats or PayloadFormatRegistry()
+        self._store_payload_format = store_payload_format or DOCUMENT_FORMAT
+        if self.payload_formats.get(self._store_payload_format.name) is None:
+            self.payload_formats.register(self._store_payload_format)
+        if point_id_mode not in ("random", "content"):
+            raise ValueError(f"Unknown point ID mode: {point_id_mode}")
+        if skip_existing and point_id_mode != "content":
+            raise ValueError("Skipping existing entries requires the content point ID mode")
+        self._point_id_mode = point_id_mode
+        self._point_id_metadata_keys = tuple(point_id_metadata_keys or ())
+        self._skip_existing = skip_existing
+        if mmr_method not in ("numpy", "qdrant"):
+            raise ValueError(f"Unknown MMR method: {mmr_method}")
+        self._mmr_lambda = mmr_lambda
+        self._mmr_candidates_factor = mmr_candidates_factor
+        self._mmr_method = mmr_method
+        self._client = client or AsyncQdrantClient(
+            location=qdrant_url,
+            api_key=qdrant_api_key,
+            path=qdrant_local_path,
+            **(client_options or {}),
         )
         self._field_indexes = field_indexes
         self._score_threshold = score_threshold
-        self._collection_vector_config_cache: dict[str, Any] = {}
+        self._store_batch_size = store_batch_size
+        self._collections = CollectionRegistry(self._client, ttl=collection_cache_ttl)
+
+        self.metrics = metrics or MetricsRegistry()
+        self._stage_latency = {
+            stage: self.metrics.histogram(
+                "stage_duration_seconds",
+                "Time spent in each stage of handling a request",
+                stage=stage,
+            )
+            for stage in ("embed", "query_points", "rerank", "parse", "upsert", "update")
+        }
+        self._search_results = self.metrics.counter(
+            "search_results_total", "Number of entries returned by searches"
+        )
+        self._skipped_entries = self.metrics.counter(
+            "store_skipped_total", "Number of stored entries found unchanged and not embedded"
+        )
+
+        self._search_cache: SearchResultCache | None = None
+        if search_cache_size > 0:
+            self._search_cache = SearchResultCache(search_cache_size, ttl=search_cache_ttl)
+            self.metrics.add_collector(self._search_cache_counters)
+
+    def _search_cache_counters(self) -> list[Counter]:
+        assert self._search_cache is not None
+        return [
+            Counter(
+                "search_cache_hits_total",
+                "Number of searches answered from the result cache",
+                value=self._search_cache.hits,
+            ),
+            Counter(
+                "search_cache_misses_total",
+                "Number of searches sent to Qdrant",
+                value=self._search_cache.misses,
+            ),
+        ]
+
+    @property
+    def client(self) -> AsyncQdrantClient:
+        """The Qdrant client, which other connectors may share."""
+        return self._client
+
+    def invalidate_search_cache(self, collection_name: str):
+        """
+        Forget the cached searches of a collection, e.g. after another connector wrote to it.
+        :param collection_name: The name of the collection.
+        """
+        if self._search_cache is not None:
+            self._search_cache.invalidate(collection_name)
+
+    def invalidate_collection(self, collection_name: str):
+        """
+        Forget the cached metadata and searches of a collection, e.g. after another connector
+        created it or wrote to it.
+        :param collection_name: The name of the collection.
+        """
+        self._collections.invalidate(collection_name)
+        self.invalidate_search_cache(collection_name)
+
+    def _record_error(self, operation: str):
+        self.metrics.counter(
+            "qdrant_errors_total", "Number of failed Qdrant requests", operation=operation
+        ).inc()
 
     async def get_collection_names(self) -> list[str]:
         """
@@ -64,32 +229,40 @@ class QdrantConnector:
         response = await self._client.get_collections()
         return [collection.name for collection in response.collections]
 
+    async def collection_exists(self, collection_name: str | None = None) -> bool:
+        """
+        Check whether a collection exists, using the cached collection metadata.
+        :param collection_name: The name of the collection, optional. If not provided,
+                                the default collection is checked.
+        :return: True if the collection exists.
+        """
+        collection_name = collection_name or self._default_collection_name
+        assert collection_name is not None
+        metadata = await self._collections.get(collection_name)
+        return metadata.exists
+
+    async def warm_up(self):
+        """
+        Send trivial requests to Qdrant, so that the first search does not pay for opening
+        connections. The metadata and payload format of the default collection get cached.
+        """
+        collection_name = self._default_collection_name
+        if collection_name is None:
+            await self._client.get_collections()
+            return
+        metadata = await self._collections.refresh(collection_name)
+        if metadata.exists:
+            await self._payload_format(collection_name, metadata)
+
     async def _uses_unnamed_vectors(self, collection_name: str) -> bool:
         """
         Check if a collection uses unnamed vectors (simple list) or named vectors (dict).
         :param collection_name: The name of the collection to check.
         :return: True if collection uses unnamed vectors, False if it uses named vectors.
+                 Collections that do not exist yet will be created with named vectors.
         """
-        if collection_name in self._collection_vector_config_cache:
-            return self._collection_vector_config_cache[collection_name]
-        
-        collection_exists = await self._client.collection_exists(collection_name)
-        if not collection_exists:
-            # New collection will be created - use named vectors by default
-            self._collection_vector_config_cache[collection_name] = False
-            return False
-        
-        # Get collection info to check vector configuration
-        info = await self._client.get_collection(collection_name)
-        vectors_config = info.config.params.vectors
-        
-        # If vectors is a VectorParams object directly (not dict), it's unnamed
-        # If vectors is a dict, it has named vectors
-        is_unnamed = not isinstance(vectors_config, dict)
-        self._collection_vector_config_cache[collection_name] = is_unnamed
-        
-        logger.info(f"Collection '{collection_name}' uses {'unnamed' if is_unnamed else 'named'} vectors")
-        return is_unnamed
+        metadata = await self._collections.get(collection_name)
+        return metadata.uses_unnamed_vectors
 
     async def store(self, entry: Entry, *, collection_name: str | None = None):
         """
@@ -102,34 +275,366 @@ class QdrantConnector:
         assert collection_name is not None
         await self._ensure_collection_exists(collection_name)
 
+        entries, ids = await self._new_entries(collection_name, [entry])
+        if not entries:
+            return
+
         # Embed the document
         # ToDo: instead of embedding text explicitly, use `models.Document`,
         # it should unlock usage of server-side inference.
-        embeddings = await self._embedding_provider.embed_documents([entry.content])
+        with self._stage_latency["embed"].time():
+            embeddings = await self._embedding_provider.embed_documents([entry.content])
 
-        # Determine vector format based on collection configuration
-        uses_unnamed = await self._uses_unnamed_vectors(collection_name)
-        
-        if uses_unnamed:
+        # Add to Qdrant
+        await self._upsert_entries(collection_name, entries, embeddings, ids)
+
+    def _point_ids(self, entries: list[Entry]) -> list[str]:
+        """
+        Get the IDs of the points storing the given entries, random or derived from their content.
+        :param entries: The entries to store.
+        :return: The IDs of the points, in the same order.
+        """
+        if self._point_id_mode == "content":
+            return [content_point_id(entry, self._point_id_metadata_keys) for entry in entries]
+        return [uuid.uuid4().hex for _ in entries]
+
+    async def _new_entries(
+        self, collection_name: str, entries: list[Entry]
+    ) -> tuple[list[Entry], list[str]]:
+        """
+        Get the entries which need to be embedded, along with their point IDs. With content IDs, the
+        same point is only upserted once per batch, with its last entry. If existing entries are
+        skipped, the points already stored are retrieved, and only their changed payloads are written.
+        :param collection_name: The name of the collection to store the entries in.
+        :param entries: The entries to store.
+        :return: The entries to embed and upsert, and their point IDs.
+        """
+        ids = self._point_ids(entries)
+        if self._point_id_mode != "content":
+            return entries, ids
+
+        unique = dict(zip(ids, entries))
+        if not self._skip_existing:
+            return list(unique.values()), list(unique.keys())
+
+        try:
+            records = await self._client.retrieve(
+                collection_name=collection_name,
+                ids=list(unique.keys()),
+                with_payload=True,
+                with_vectors=False,
+            )
+        except Exception as e:
+            self._record_error("retrieve")
+            if not is_not_found_error(e):
+                raise
+            self._collections.invalidate(collection_name)
+            records = []
+
+        updates = []
+        for record in records:
+            point_id = str(record.id)
+            entry = unique.pop(point_id, None)
+            if entry is None:
+                continue
+            payload = self._payload(entry)
+            if record.payload != payload:
+                updates.append(
+                    models.OverwritePayloadOperation(
+                        overwrite_payload=models.SetPayload(payload=payload, points=[point_id])
+                    )
+                )
+        self._skipped_entries.inc(len(entries) - len(unique))
+
+        if updates:
+            try:
+                with self._stage_latency["upsert"].time():
+                    await self._client.batch_update_points(
+                        collection_name=collection_name, update_operations=updates
+                    )
+            finally:
+                self.invalidate_search_cache(collection_name)
+        return list(unique.values()), list(unique.keys())
+
+    def _payload(self, entry: Entry) -> dict[str, Any]:
+        return self._store_payload_format.make_payload(entry.content, entry.metadata)
+
+    @staticmethod
+    def _points_selector(
+        query_filter: models.Filter | None, point_ids: list[str | int] | None
+    ) -> models.PointsSelector:
+        """
+        Select the points matching both a filter and a list of IDs. Selecting every point is refused,
+        so that an empty filter never wipes a collection.
+        :param query_filter: The filter selecting the points, optional.
+        :param point_ids: The IDs of the points, optional.
+        :return: The selector of the points.
+        """
+        if point_ids:
+            # Integer IDs often come back as text, e.g. from tool arguments
+            point_ids = [
+                int(point_id) if isinstance(point_id, str) and point_id.isdigit() else point_id
+                for point_id in point_ids
+            ]
+        if query_filter is not None and not any(
+            (query_filter.must, query_filter.should, query_filter.must_not, query_filter.min_should)
+        ):
+            query_filter = None
+        if query_filter is None:
+            if not point_ids:
+                raise ValueError("Selecting points requires their IDs or a non-empty filter")
+            return models.PointIdsList(points=point_ids)
+        if point_ids:
+            must = query_filter.must or []
+            must = must if isinstance(must, list) else [must]
+            # Copied, since filters may be memoized by the filter builder
+            query_filter = query_filter.model_copy(
+                update={"must": [*must, models.HasIdCondition(has_id=point_ids)]}
+            )
+        return models.FilterSelector(filter=query_filter)
+
+    async def delete(
+        self,
+        query_filter: models.Filter | None = None,
+        *,
+        point_ids: list[str | int] | None = None,
+        collection_name: str | None = None,
+        wait: bool = True,
+    ) -> models.UpdateStatus | None:
+        """
+        Delete the points matching a filter, or having the given IDs, or both. Nothing happens if the
+        collection does not exist.
+        :param query_filter: The filter selecting the points to delete, optional.
+        :param point_ids: The IDs of the points to delete, optional.
+        :param collection_name: The name of the collection to delete from, optional. If not provided,
+                                the default collection is used.
+        :param wait: Whether to wait for the points to be deleted. If False, Qdrant only acknowledges
+                     the request, which is faster for large deletions.
+        :return: The status of the operation, or None if the collection does not exist.
+        """
+        collection_name = collection_name or self._default_collection_name
+        assert collection_name is not None
+        selector = self._points_selector(query_filter, point_ids)
+        try:
+            with self._stage_latency["update"].time():
+                result = await self._client.delete(
+                    collection_name=collection_name, points_selector=selector, wait=wait
+                )
+        except Exception as e:
+            self._record_error("delete")
+            if not is_not_found_error(e):
+                raise
+            self._collections.invalidate(collection_name)
+            return None
+        finally:
+            self.invalidate_search_cache(collection_name)
+        return result.status
+
+    async def update_metadata(
+        self,
+        metadata: Metadata,
+        query_filter: models.Filter | None = None,
+        *,
+        point_ids: list[str | int] | None = None,
+        collection_name: str | None = None,
+        wait: bool = True,
+    ) -> models.UpdateStatus | None:
+        """
+        Set metadata fields of the points matching a filter, or having the given IDs, or both, without
+        embedding them again. Their other fields are kept. The fields are written where the payload
+        format of the collection keeps metadata, e.g. under `metadata` for the entries of this server.
+        :param metadata: The metadata fields to set.
+        :param query_filter: The filter selecting the points to update, optional.
+        :param point_ids: The IDs of the points to update, optional.
+        :param collection_name: The name of the collection to update, optional. If not provided,
+                                the default collection is used.
+        :param wait: Whether to wait for the points to be updated. If False, Qdrant only acknowledges
+                     the request.
+        :return: The status of the operation, or None if the collection does not exist.
+        """
+        collection_name = collection_name or self._default_collection_name
+        assert collection_name is not None
+        selector = self._points_selector(query_filter, point_ids)
+        collection = await self._collections.get(collection_name)
+        if not collection.exists:
+            return None
+        payload_format = (
+            await self._payload_format(collection_name, collection) or self._store_payload_format
+        )
+        content_field = payload_format.content_field
+        if payload_format.metadata_field is None and content_field in metadata:
+            # The vectors would no longer match the content
+            raise ValueError(f"The content field {content_field!r} cannot be updated")
+        try:
+            with self._stage_latency["update"].time():
+                result = await self._client.set_payload(
+                    collection_name=collection_name,
+                    payload=metadata,
+                    points=selector,
+                    key=payload_format.metadata_field,
+                    wait=wait,
+                )
+        except Exception as e:
+            self._record_error("set_payload")
+            if not is_not_found_error(e):
+                raise
+            self._collections.invalidate(collection_name)
+            return None
+        finally:
+            self.invalidate_search_cache(collection_name)
+        return result.status
+
+    async def _upsert_entries(
+        self,
+        collection_name: str,
+        entries: list[Entry],
+        embeddings: list[list[float]] | np.ndarray,
+        ids: list[str] | None = None,
+    ):
+        """
+        Upsert embedded entries, using the vector format of the collection. If the collection was
+        removed since its metadata was cached, it is created again and the upsert is retried once.
+        :param collection_name: The name of the collection to upsert into.
+        :param entries: The entries to upsert.
+        :param embeddings: The embeddings of the entries, in the same order. A 2D array is only
+                           converted to Python floats here, one batch at a time.
+        :param ids: The IDs of the points, in the same order. If not provided, the IDs are
+                    generated with the point ID mode of the connector.
+        """
+        if ids is None:
+            ids = self._point_ids(entries)
+        metadata = await self._ensure_collection_exists(collection_name)
+        vectors = embeddings.tolist() if isinstance(embeddings, np.ndarray) else embeddings
+        sparse_vectors = None
+        if self._sparse_vector_name(metadata) is not None:
+            assert self._sparse_embedding_provider is not None
+            with self._stage_latency["embed"].time():
+                sparse_vectors = await self._sparse_embedding_provider.embed_documents(
+                    [entry.content for entry in entries]
+                )
+        try:
+            with self._stage_latency["upsert"].time():
+                await self._client.upsert(
+                    collection_name=collection_name,
+                    points=self._make_batch(entries, ids, vectors, metadata, sparse_vectors),
+                )
+        except Exception as e:
+            self._record_error("upsert")
+            if not is_not_found_error(e):
+                raise
+            logger.info(f"Collection '{collection_name}' disappeared, recreating it")
+            self._collections.invalidate(collection_name)
+            metadata = await self._ensure_collection_exists(collection_name)
+            await self._client.upsert(
+                collection_name=collection_name,
+                points=self._make_batch(entries, ids, vectors, metadata, sparse_vectors),
+            )
+        finally:
+            # Even a failed upsert may have written some of the points
+            self.invalidate_search_cache(collection_name)
+
+    def _make_batch(
+        self,
+        entries: list[Entry],
+        ids: list[str],
+        vectors: list[list[float]],
+        metadata: CollectionMetadata,
+        sparse_vectors: list[models.SparseVector] | None = None,
+    ) -> models.Batch:
+        """
+        Build a columnar batch of points for the given entries, using the vector format of the collection.
+        :param entries: The entries to convert.
+        :param ids: The IDs of the points, in the same order.
+        :param vectors: The embeddings of the entries, in the same order.
+        :param metadata: The metadata of the target collection.
+        :param sparse_vectors: The sparse embeddings of the entries, stored if the collection has a sparse vector.
+        :return: The batch to upsert.
+        """
+        batch_vectors: models.BatchVectorStruct
+        sparse_name = self._sparse_vector_name(metadata)
+        if sparse_vectors is not None and sparse_name is not None:
+            dense_name = (
+                UNNAMED_VECTOR
+                if metadata.uses_unnamed_vectors
+                else self._embedding_provider.get_vector_name()
+            )
+            batch_vectors = {dense_name: vectors, sparse_name: sparse_vectors}  # type: ignore[dict-item]
+        elif metadata.uses_unnamed_vectors:
             # Use unnamed vector format (simple list)
-            vector = embeddings[0]
+            batch_vectors = vectors
         else:
             # Use named vector format (dictionary)
-            vector_name = self._embedding_provider.get_vector_name()
-            vector = {vector_name: embeddings[0]}
-        
-        # Add to Qdrant
-        payload = {"document": entry.content, METADATA_PATH: entry.metadata}
-        await self._client.upsert(
-            collection_name=collection_name,
-            points=[
-                models.PointStruct(
-                    id=uuid.uuid4().hex,
-                    vector=vector,
-                    payload=payload,
+            batch_vectors = {self._embedding_provider.get_vector_name(): vectors}
+
+        return models.Batch(
+            ids=ids,  # type: ignore[arg-type]
+            vectors=batch_vectors,
+            payloads=[self._payload(entry) for entry in entries],
+        )
+
+    async def store_many(
+        self,
+        entries: list[Entry],
+        *,
+        collection_name: str | None = None,
+        batch_size: int | None = None,
+    ) -> int:
+        """
+        Store many entries in the Qdrant collection. Entries are embedded in batches, and embedding of
+        the next batch overlaps with the upsert of the previous one.
+        :param entries: The entries to store in the Qdrant collection.
+        :param collection_name: The name of the collection to store the information in, optional. If not provided,
+                                the default collection is used.
+        :param batch_size: The number of entries embedded and upserted together. If not provided, the
+                           connector's default batch size is used.
+        :return: The number of entries embedded and upserted. Entries skipped because they are already
+                 stored, and duplicates of the same content ID within a batch, are not counted.
+        """
+        collection_name = collection_name or self._default_collection_name
+        assert collection_name is not None
+        batch_size = batch_size or self._store_batch_size
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be positive, got {batch_size}")
+        if not entries:
+            return 0
+
+        await self._ensure_collection_exists(collection_name)
+
+        pending_upsert: asyncio.Task | None = None
+        stored = 0
+        try:
+            for start in range(0, len(entries), batch_size):
+                batch, ids = await self._new_entries(
+                    collection_name, entries[start : start + batch_size]
                 )
-            ],
+                if not batch:
+                    continue
+                # A contiguous float32 array is much lighter than nested lists of Python floats
+                with self._stage_latency["embed"].time():
+                    embeddings = await self._embedding_provider.embed_documents_array(
+                        [entry.content for entry in batch]
+                    )
+
+                # Only a single upsert is in flight, so memory stays bounded by two batches
+                if pending_upsert is not None:
+                    await pending_upsert
+                pending_upsert = asyncio.create_task(
+                    self._upsert_entries(collection_name, batch, embeddings, ids)
+                )
+                stored += len(batch)
+
+            if pending_upsert is not None:
+                await pending_upsert
+                pending_upsert = None
+        finally:
+            if pending_upsert is not None and not pending_upsert.done():
+                pending_upsert.cancel()
+
+        logger.info(
+            f"Stored {stored} of {len(entries)} entries in collection '{collection_name}' "
+            f"in batches of {batch_size}"
         )
+        return stored
 
     async def search(
         self,
@@ -137,8 +642,11 @@ class QdrantConnector:
         *,
         collection_name: str | None = None,
         limit: int = 10,
+        offset: int = 0,
         query_filter: models.Filter | None = None,
         score_threshold: float | None = None,
+        search_params: models.SearchParams | None = None,
+        mmr_lambda: float | None = None,
     ) -> list[Entry]:
         """
         Find points in the Qdrant collection. If there are no entries found, an empty list is returned.
@@ -146,122 +654,493 @@ class QdrantConnector:
         :param collection_name: The name of the collection to search in, optional. If not provided,
                                 the default collection is used.
         :param limit: The maximum number of entries to return.
+        :param offset: The number of best entries to skip, to get the following pages of results.
         :param query_filter: The filter to apply to the query, if any.
         :param score_threshold: Minimum similarity score threshold. If not provided, uses the connector's
                                 default threshold (if set). Results with scores below this threshold are filtered out.
+        :param search_params: The search parameters, e.g. `hnsw_ef` or quantization rescoring. If not
+                              provided, uses the connector's default parameters (if set).
+        :param mmr_lambda: The trade-off between relevance (1) and diversity (0) of the results. If not
+                           provided, uses the connector's default (if set). 1 disables re-ranking.
 
         :return: A list of entries found.
         """
         collection_name = collection_name or self._default_collection_name
-        collection_exists = await self._client.collection_exists(collection_name)
-        if not collection_exists:
+        # Use provided score_threshold or fall back to connector's default
+        effective_threshold = score_threshold if score_threshold is not None else self._score_threshold
+        search_params = search_params or self._search_params
+        mmr_lambda = self._effective_mmr_lambda(mmr_lambda)
+        cache_key = None
+        if self._search_cache is not None:
+            # The key is built before searching, so that a concurrent write invalidates it
+            cache_key = self._search_cache.make_key(
+                collection_name,
+                query,
+                limit=limit,
+                offset=offset,
+                query_filter=query_filter,
+                score_threshold=effective_threshold,
+                search_params=search_params,
+                mmr_lambda=mmr_lambda,
+            )
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        metadata = await self._collections.get(collection_name)
+        if not metadata.exists:
             return []
 
         # Embed the query
         # ToDo: instead of embedding text explicitly, use `models.Document`,
         # it should unlock usage of server-side inference.
 
-        query_vector = await self._embedding_provider.embed_query(query)
-        
-        # Use provided score_threshold or fall back to connector's default
-        effective_threshold = score_threshold if score_threshold is not None else self._score_threshold
+        # The format is detected meanwhile, outside of the embedding stage
+        (query_vector, sparse_vectors), payload_format = await asyncio.gather(
+            self._timed(
+                "embed",
+                asyncio.gather(
+                    self._embedding_provider.embed_query(query),
+                    self._embed_sparse_queries(metadata, [query]),
+                ),
+            ),
+            self._payload_format(collection_name, metadata),
+        )
         
-        # Determine if we need to specify a vector name
-        uses_unnamed = await self._uses_unnamed_vectors(collection_name)
+        request = self._make_query(
+            metadata,
+            query_vector,
+            sparse_vectors[0],
+            limit=limit,
+            offset=offset,
+            query_filter=query_filter,
+            score_threshold=effective_threshold,
+            search_params=search_params,
+            with_payload=self._payload_selector(payload_format),
+            mmr_lambda=mmr_lambda,
+        )
         
         # Search in Qdrant
-        if uses_unnamed:
-            # For unnamed vectors, don't specify 'using' parameter
-            search_results = await self._client.query_points(
-                collection_name=collection_name,
-                query=query_vector,
+        try:
+            with self._stage_latency["query_points"].time():
+                search_results = await self._client.query_points(
+                    collection_name=collection_name,
+                    query=request.query,
+                    using=request.using,
+                    prefetch=request.prefetch,
+                    limit=request.limit,
+                    offset=request.offset,
+                    query_filter=request.filter,
+                    score_threshold=request.score_threshold,
+                    search_params=request.params,
+                    with_payload=request.with_payload,
+                    with_vectors=request.with_vector,
+                )
+        except Exception as e:
+            self._record_error("query_points")
+            if not is_not_found_error(e):
+                raise
+            # The collection was removed since its metadata was cached
+            self._collections.invalidate(collection_name)
+            return []
+
+        points = search_results.points
+        if mmr_lambda is not None:
+            points = self._rerank(
+                points,
+                metadata,
+                query_vector,
+                sparse_vectors[0],
                 limit=limit,
-                query_filter=query_filter,
+                offset=offset,
+                mmr_lambda=mmr_lambda,
+            )
+        with self._stage_latency["parse"].time():
+            entries = self._parse_points(points, payload_format)
+        self._search_results.inc(len(entries))
+        if cache_key is not None:
+            self._search_cache.put(cache_key, entries)  # type: ignore[union-attr]
+        return entries
+
+    async def search_many(
+        self,
+        queries: list[str],
+        *,
+        collection_name: str | None = None,
+        limit: int = 10,
+        query_filters: list[models.Filter | None] | None = None,
+        score_threshold: float | None = None,
+        search_params: models.SearchParams | None = None,
+        deduplicate: bool = False,
+        mmr_lambda: float | None = None,
+    ) -> list[list[Entry]]:
+        """
+        Find points for several queries at once. All the queries are embedded in a single call
+        and sent to Qdrant in a single batch request.
+        :param queries: The queries to use for the search.
+        :param collection_name: The name of the collection to search in, optional. If not provided,
+                                the default collection is used.
+        :param limit: The maximum number of entries to return for each query.
+        :param query_filters: The filter to apply to each query, if any. Must have the same length as `queries`.
+        :param score_threshold: Minimum similarity score threshold. If not provided, uses the connector's
+                                default threshold (if set).
+        :param search_params: The search parameters, e.g. `hnsw_ef` or quantization rescoring. If not
+                              provided, uses the connector's default parameters (if set).
+        :param deduplicate: If True, a point is only returned for the first query that found it.
+        :param mmr_lambda: The trade-off between relevance (1) and diversity (0) of the results of
+                           each query. If not provided, uses the connector's default (if set).
+
+        :return: The list of entries found for each query, in the order of the queries.
+        """
+        if query_filters is not None and len(query_filters) != len(queries):
+            raise ValueError(
+                f"Got {len(query_filters)} filters for {len(queries)} queries"
+            )
+        collection_name = collection_name or self._default_collection_name
+        metadata = await self._collections.get(collection_name)
+        if not metadata.exists or not queries:
+            return [[] for _ in queries]
+
+        (query_vectors, sparse_vectors), payload_format = await asyncio.gather(
+            self._timed(
+                "embed",
+                asyncio.gather(
+                    self._embedding_provider.embed_queries(queries),
+                    self._embed_sparse_queries(metadata, queries),
+                ),
+            ),
+            self._payload_format(collection_name, metadata),
+        )
+        with_payload = self._payload_selector(payload_format)
+        effective_threshold = score_threshold if score_threshold is not None else self._score_threshold
+        mmr_lambda = self._effective_mmr_lambda(mmr_lambda)
+        requests = [
+            self._make_query(
+                metadata,
+                query_vector,
+                sparse_vectors[i],
+                limit=limit,
+                query_filter=query_filters[i] if query_filters else None,
                 score_threshold=effective_threshold,
+                search_params=search_params or self._search_params,
+                with_payload=with_payload,
+                mmr_lambda=mmr_lambda,
             )
-        else:
-            # For named vectors, specify which vector to use
-            vector_name = self._embedding_provider.get_vector_name()
-            search_results = await self._client.query_points(
-                collection_name=collection_name,
+            for i, query_vector in enumerate(query_vectors)
+        ]
+
+        try:
+            with self._stage_latency["query_points"].time():
+                responses = await self._client.query_batch_points(
+                    collection_name=collection_name, requests=requests
+                )
+        except Exception as e:
+            self._record_error("query_batch_points")
+            if not is_not_found_error(e):
+                raise
+            self._collections.invalidate(collection_name)
+            return [[] for _ in queries]
+
+        results = []
+        seen_ids: set = set()
+        points_per_query = [response.points for response in responses]
+        if mmr_lambda is not None:
+            points_per_query = [
+                self._rerank(
+                    points,
+                    metadata,
+                    query_vectors[i],
+                    sparse_vectors[i],
+                    limit=limit,
+                    mmr_lambda=mmr_lambda,
+                )
+                for i, points in enumerate(points_per_query)
+            ]
+        with self._stage_latency["parse"].time():
+            for points in points_per_query:
+                if deduplicate:
+                    points = [point for point in points if point.id not in seen_ids]
+                    seen_ids.update(point.id for point in points)
+                results.append(self._parse_points(points, payload_format))
+        self._search_results.inc(sum(len(entries) for entries in results))
+        return results
+
+    def _effective_mmr_lambda(self, mmr_lambda: float | None) -> float | None:
+        """
+        Get the MMR trade-off of a search, or None if its results are not re-ranked.
+        """
+        mmr_lambda = mmr_lambda if mmr_lambda is not None else self._mmr_lambda
+        # Only relevance counts, which is the order of Qdrant
+        return None if mmr_lambda is None or mmr_lambda >= 1 else mmr_lambda
+
+    def _uses_qdrant_mmr(self, sparse_vector: models.SparseVector | None) -> bool:
+        """Check whether Qdrant re-ranks a search itself, which it only does for dense searches."""
+        return sparse_vector is None and self._mmr_method == "qdrant"
+
+    def _rerank(
+        self,
+        points: list[models.ScoredPoint],
+        metadata: CollectionMetadata,
+        query_vector: list[float],
+        sparse_vector: models.SparseVector | None,
+        *,
+        limit: int,
+        mmr_lambda: float,
+        offset: int = 0,
+    ) -> list[models.ScoredPoint]:
+        """
+        Cut the page of a search out of the MMR ordering of its candidates, computed here from their
+        dense vectors unless Qdrant returned them in that order. Each step of MMR depends on the
+        previous picks, so every page is cut from the same ordering. The vectors are dropped, so
+        that they are not cached.
+        """
+        if self._uses_qdrant_mmr(sparse_vector):
+            return points[offset : offset + limit]
+        vector_name = self._query_vector_name(metadata)
+        vectors = [
+            point.vector[vector_name] if isinstance(point.vector, dict) else point.vector  # type: ignore[index]
+            for point in points
+        ]
+        with self._stage_latency["rerank"].time():
+            selected = mmr_select(query_vector, vectors, offset + limit, mmr_lambda)[offset:]
+        return [points[i].model_copy(update={"vector": None}) for i in selected]
+
+    def _query_vector_name(self, metadata: CollectionMetadata) -> str | None:
+        # For unnamed vectors, don't specify 'using' parameter
+        # For named vectors, specify which vector to use
+        if metadata.uses_unnamed_vectors:
+            return None
+        return self._embedding_provider.get_vector_name()
+
+    def _sparse_vector_name(self, metadata: CollectionMetadata) -> str | None:
+        """
+        Get the name of the sparse vector used for hybrid search, or None if hybrid search
+        is disabled or the collection was created without the sparse vector.
+        """
+        if self._sparse_embedding_provider is None:
+            return None
+        sparse_name = self._sparse_embedding_provider.get_vector_name()
+        return sparse_name if sparse_name in metadata.sparse_vectors else None
+
+    async def _embed_sparse_queries(
+        self, metadata: CollectionMetadata, queries: list[str]
+    ) -> list[models.SparseVector | None]:
+        if self._sparse_vector_name(metadata) is None:
+            return [None] * len(queries)
+        assert self._sparse_embedding_provider is not None
+        return await self._sparse_embedding_provider.embed_queries(queries)  # type: ignore[return-value]
+
+    def _make_query(
+        self,
+        metadata: CollectionMetadata,
+        query_vector: list[float],
+        sparse_vector: models.SparseVector | None,
+        *,
+        limit: int,
+        query_filter: models.Filter | None,
+        score_threshold: float | None,
+        search_params: models.SearchParams | None,
+        offset: int = 0,
+        with_payload: models.WithPayloadInterface = True,
+        mmr_lambda: float | None = None,
+    ) -> models.QueryRequest:
+        """
+        Build the query of a search. With a sparse vector, the dense and sparse candidates are
+        prefetched and fused by Qdrant in the same request. The score threshold then only applies
+        to the dense candidates, as fused scores are not similarities.
+        With an MMR trade-off, more candidates are fetched along with their dense vectors, to be
+        re-ranked by `_rerank`, unless Qdrant re-ranks dense searches itself. Either way, the pages
+        are cut from the MMR ordering of `limit * mmr_candidates_factor` candidates, whatever the
+        offset, so the results of a query end with its last candidate.
+        """
+        vector_name = self._query_vector_name(metadata)
+        with_vector: models.WithVector = False
+        if mmr_lambda is not None:
+            # A pool depending on the offset would change the earlier picks, so pages would overlap
+            candidates = limit * self._mmr_candidates_factor
+            if self._uses_qdrant_mmr(sparse_vector):
+                return models.QueryRequest(
+                    query=models.NearestQuery(
+                        nearest=query_vector,
+                        mmr=models.Mmr(diversity=1 - mmr_lambda, candidates_limit=candidates),
+                    ),
+                    using=vector_name,
+                    limit=min(offset + limit, candidates),
+                    filter=query_filter,
+                    score_threshold=score_threshold,
+                    params=search_params,
+                    with_payload=with_payload,
+                )
+            with_vector = [vector_name] if vector_name is not None else True
+            limit, offset = candidates, 0
+
+        if sparse_vector is None:
+            return models.QueryRequest(
                 query=query_vector,
                 using=vector_name,
                 limit=limit,
-                query_filter=query_filter,
-                score_threshold=effective_threshold,
+                offset=offset or None,
+                filter=query_filter,
+                score_threshold=score_threshold,
+                params=search_params,
+                with_payload=with_payload,
+                with_vector=with_vector,
             )
 
-        # Parse results - handle both MCP format and other formats
-        entries = []
-        for result in search_results.points:
-            # Extract score (available in query_points results)
-            score = getattr(result, 'score', None)
-            
-            # Try MCP format first (document + metadata)
-            if "document" in result.payload:
-                entries.append(
-                    Entry(
-                        content=result.payload["document"],
-                        metadata=result.payload.get(METADATA_PATH),
-                        score=score,
-                    )
+        # Each page is cut from the fused candidates, so they must cover all the previous pages
+        prefetch_limit = max(self._hybrid_prefetch_limit, offset + limit)
+        return models.QueryRequest(
+            prefetch=[
+                models.Prefetch(
+                    query=query_vector,
+                    using=vector_name,
+                    limit=prefetch_limit,
+                    filter=query_filter,
+                    score_threshold=score_threshold,
+                    params=search_params,
+                ),
+                models.Prefetch(
+                    query=sparse_vector,
+                    using=self._sparse_vector_name(metadata),
+                    limit=prefetch_limit,
+                    filter=query_filter,
+                ),
+            ],
+            query=models.FusionQuery(fusion=self._hybrid_fusion),
+            limit=limit,
+            offset=offset or None,
+            with_payload=with_payload,
+            with_vector=with_vector,
+        )
+
+    async def _timed(self, stage: str, awaitable: Awaitable[T]) -> T:
+        """Await the given awaitable, recording its duration as the latency of the given stage."""
+        with self._stage_latency[stage].time():
+            return await awaitable
+
+    async def _payload_format(
+        self, collection_name: str, metadata: CollectionMetadata
+    ) -> PayloadFormat | None:
+        """
+        Get the payload format of a collection, detecting it from one of its points if unknown.
+        :return: The format, or None if the collection is empty or missing.
+        """
+        if metadata.payload_format is None:
+            # Detected once, then cached along with the rest of the collection metadata
+            try:
+                records, _ = await self._client.scroll(
+                    collection_name, limit=1, with_payload=True, with_vectors=False
                 )
-            # Handle code chunk format (codeChunk + other fields)
-            elif "codeChunk" in result.payload:
-                # Extract code chunk as content
-                content = result.payload["codeChunk"]
-                # Use other fields as metadata
-                metadata = {k: v for k, v in result.payload.items() if k != "codeChunk"}
-                entries.append(Entry(content=content, metadata=metadata, score=score))
-            # Generic fallback: try to find any text-like field
+            except Exception as e:
+                if not is_not_found_error(e):
+                    raise
+                # The search itself reports the missing collection
+                return None
+            if not records:
+                return None
+            metadata.payload_format = self.payload_formats.detect(records[0].payload or {}).name
+            logger.info(
+                f"Collection '{collection_name}' uses the '{metadata.payload_format}' payload format"
+            )
+        return self.payload_formats.get(metadata.payload_format)
+
+    def _payload_selector(
+        self, payload_format: PayloadFormat | None
+    ) -> models.WithPayloadInterface:
+        """
+        Get the payload fields fetched by searches in a collection: the configured ones, or the
+        fields displayed by any known format. The format is detected from a single point, while
+        collections may mix formats, e.g. entries stored by this server and chunks of a watched
+        repository, so the fields of the other formats are fetched too.
+        """
+        if self._payload_include:
+            return models.PayloadSelectorInclude(include=self._payload_include)
+        if self._payload_exclude:
+            return models.PayloadSelectorExclude(exclude=self._payload_exclude)
+        if payload_format is None or payload_format.fields is None:
+            return True
+        return models.PayloadSelectorInclude(include=self.payload_formats.projected_fields())
+
+    def _parse_points(
+        self, points: list[models.ScoredPoint], payload_format: PayloadFormat | None
+    ) -> list[Entry]:
+        """
+        Convert the points found by Qdrant into entries.
+        :param points: The points returned by a query.
+        :param payload_format: The payload format of the collection. Points in another format,
+                               e.g. in collections shared by several tools, are detected one by one.
+        :return: The entries, in the same order.
+        """
+        fields = []
+        for point in points:
+            payload = point.payload or {}
+            if payload_format is not None and payload_format.matches(payload):
+                content, metadata = payload_format.extract(payload)
             else:
-                # Look for common text fields
-                text_fields = ["text", "content", "body", "description"]
-                content = None
-                for field in text_fields:
-                    if field in result.payload:
-                        content = result.payload[field]
-                        break
-                
-                if content is None:
-                    # Use entire payload as string if no text field found
-                    content = str(result.payload)
-                    metadata = None
-                else:
-                    metadata = {k: v for k, v in result.payload.items() if k != field}
-                
-                entries.append(Entry(content=content, metadata=metadata, score=score))
-        
-        return entries
+                content, metadata = self.payload_formats.detect(payload).extract(payload)
+            fields.append(
+                {"content": content, "metadata": metadata, "score": point.score, "id": point.id}
+            )
+        # Validating all the entries at once is much cheaper than creating them one by one
+        return _ENTRY_LIST.validate_python(fields)
 
-    async def _ensure_collection_exists(self, collection_name: str):
+    async def _ensure_collection_exists(self, collection_name: str) -> CollectionMetadata:
         """
         Ensure that the collection exists, creating it if necessary.
         :param collection_name: The name of the collection to ensure exists.
+        :return: The metadata of the collection.
         """
-        collection_exists = await self._client.collection_exists(collection_name)
-        if not collection_exists:
-            # Create the collection with the appropriate vector size
-            vector_size = self._embedding_provider.get_vector_size()
+        metadata = await self._collections.get(collection_name)
+        if metadata.exists:
+            return metadata
 
-            # Use the vector name as defined in the embedding provider
-            vector_name = self._embedding_provider.get_vector_name()
+        # Create the collection with the appropriate vector size
+        vector_size = self._embedding_provider.get_vector_size()
+
+        # Use the vector name as defined in the embedding provider
+        vector_name = self._embedding_provider.get_vector_name()
+        vector_params = models.VectorParams(
+            size=vector_size,
+            distance=models.Distance.COSINE,
+            **self._vector_options,
+        )
+        sparse_vectors: dict[str, models.SparseVectorParams] = {}
+        if self._sparse_embedding_provider is not None:
+            sparse_vectors[self._sparse_embedding_provider.get_vector_name()] = (
+                models.SparseVectorParams(
+                    modifier=self._sparse_embedding_provider.get_modifier()
+                )
+            )
+        try:
             await self._client.create_collection(
                 collection_name=collection_name,
-                vectors_config={
-                    vector_name: models.VectorParams(
-                        size=vector_size,
-                        distance=models.Distance.COSINE,
-                    )
-                },
+                vectors_config={vector_name: vector_params},
+                sparse_vectors_config=sparse_vectors or None,
             )
+        except Exception:
+            # Someone else may have created the collection since its metadata was cached
+            metadata = await self._collections.refresh(collection_name)
+            if metadata.exists:
+                return metadata
+            raise
 
-            # Create payload indexes if configured
+        # Create payload indexes if configured
 
-            if self._field_indexes:
-                for field_name, field_type in self._field_indexes.items():
-                    await self._client.create_payload_index(
-                        collection_name=collection_name,
-                        field_name=field_name,
-                        field_schema=field_type,
-                    )
+        if self._field_indexes:
+            for field_name, field_type in self._field_indexes.items():
+                await self._client.create_payload_index(
+                    collection_name=collection_name,
+                    field_name=field_name,
+                    field_schema=field_type,
+                )
+
+        metadata = CollectionMetadata(
+            exists=True,
+            uses_unnamed_vectors=False,
+            vectors={vector_name: vector_params},
+            sparse_vectors=sparse_vectors,
+            payload_indexes=dict(self._field_indexes or {}),
+            payload_format=self._store_payload_format.name,
+        )
+        self._collections.register(collection_name, metadata)
+        return metadata
@@ -0,0 +1,113 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from pydantic import BaseModel
+
+SearchKey = tuple[Hashable, ...]
+
+
+def _dump(value: BaseModel | None) -> str | None:
+    return value.model_dump_json(exclude_none=True) if value is not None else None
+
+
+class SearchResultCache:
+    """
+    Caches the results of searches, keyed on everything that influences them. The cache is
+    bounded and evicts the least recently used searches first.
+
+    Writes through the connector invalidate a collection by bumping its generation, which is
+    part of the key: older results are never returned again and age out of the LRU. A search
+    running concurrently with a write keeps the generation it started with, so it cannot
+    cache results under the new generation. Entries also expire after `ttl` seconds, to pick
+    up writes from other processes.
+    :param max_size: The maximum number of cached searches.
+    :param ttl: Time to live of cached results in seconds. If not provided, entries never expire.
+    """
+
+    def __init__(self, max_size: int = 256, ttl: float | None = 30.0):
+        if max_size < 1:
+            raise ValueError(f"Cache size must be positive, got {max_size}")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._generations: dict[str, int] = {}
+        self._cache: OrderedDict[SearchKey, tuple[float, list[Any]]] = OrderedDict()
+
+    def make_key(
+        self,
+        collection_name: str,
+        query: str,
+        *,
+        limit: int,
+        offset: int = 0,
+        query_filter: BaseModel | None,
+        score_threshold: float | None,
+        search_params: BaseModel | None,
+        mmr_lambda: float | None = None,
+    ) -> SearchKey:
+        """
+        Build the cache key of a search. Queries only differing by whitespace share a key.
+        """
+        return (
+            collection_name,
+            self._generations.get(collection_name, 0),
+            " ".join(query.split()),
+            limit,
+            offset,
+            _dump(query_filter),
+            score_threshold,
+            _dump(search_params),
+            mmr_lambda,
+        )
+
+    def get(self, key: SearchKey) -> list[Any] | None:
+        """
+        Get the cached results of a search.
+        :param key: The key of the search.
+        :return: A copy of the cached results, or None if they are not cached or expired.
+        """
+        cached = self._cache.get(key)
+        if cached is not None:
+            created_at, results = cached
+            if self.ttl is None or time.monotonic() - created_at < self.ttl:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return list(results)
+            del self._cache[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: SearchKey, results: list[Any]):
+        """
+        Cache the results of a search.
+        :param key: The key of the search, built before the search started.
+        :param results: The results to cache.
+        """
+        self._cache[key] = (time.monotonic(), list(results))
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    def invalidate(self, collection_name: str):
+        """
+        Stop returning the cached results of a collection, e.g. after a write into it.
+        :param collection_name: The name of the collection.
+        """
+        self._generations[collection_name] = self._generations.get(collection_name, 0) + 1
+
+    def cache_info(self) -> dict[str, float]:
+        """Get the hit and miss counters, the hit rate and the current size of the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._cache),
+            "max_size": self.max_size,
+        }
+
+    def clear(self):
+        """Drop all the cached results."""
+        self._cache.clear()
@@ -1,12 +1,18 @@
 from mcp_server_qdrant.mcp_server import QdrantMCPServer
 from mcp_server_qdrant.settings import (
     EmbeddingProviderSettings,
+    IndexerSettings,
     QdrantSettings,
+    ServerSettings,
     ToolSettings,
 )
 
+server_settings = ServerSettings()
 mcp = QdrantMCPServer(
     tool_settings=ToolSettings(),
     qdrant_settings=QdrantSettings(),
     embedding_provider_settings=EmbeddingProviderSettings(),
+    lazy_startup=server_settings.lazy_startup,
+    warmup=server_settings.warmup,
+    indexer_settings=IndexerSettings(),
 )
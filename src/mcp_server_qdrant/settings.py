@@ -1,32 +1,58 @@
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Literal
+import logging
 import os
 from pathlib import Path
 
+import httpx
 from pydantic import BaseModel, Field, model_validator
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
 from mcp_server_qdrant.embeddings.types import EmbeddingProviderType
 
+if TYPE_CHECKING:
+    # Imported where needed, to keep the Qdrant client out of the server startup
+    from qdrant_client import models
+
+logger = logging.getLogger(__name__)
+
 # Load .env file from project root
 env_path = Path(__file__).parent.parent.parent / ".env"
 if env_path.exists():
     load_dotenv(env_path)
-    print(f"[Settings] Loaded environment from {env_path}")
+    # Never print: stdout is the protocol channel of the stdio transport
+    logger.info(f"Loaded environment from {env_path}")
 else:
     # Try to load from current working directory
     load_dotenv()
-    print("[Settings] No .env file found in project root, using system environment variables")
+    logger.info("No .env file found in project root, using system environment variables")
 
 DEFAULT_TOOL_STORE_DESCRIPTION = (
     "Keep the memory for later use, when you are asked to remember something."
 )
+DEFAULT_TOOL_STORE_BATCH_DESCRIPTION = (
+    "Keep many memories for later use at once. Prefer this tool over repeated calls "
+    "to the store tool when there are several pieces of information to remember."
+)
 DEFAULT_TOOL_FIND_DESCRIPTION = (
     "Look up memories in Qdrant. Use this tool when you need to: \n"
     " - Find memories by their content \n"
     " - Access memories for further analysis \n"
     " - Get some personal information about the user"
 )
+DEFAULT_TOOL_FIND_MANY_DESCRIPTION = (
+    "Look up memories in Qdrant for several queries at once. Prefer this tool over "
+    "repeated calls to the find tool when you have multiple related questions. "
+    "Results are grouped per query."
+)
+DEFAULT_TOOL_DELETE_DESCRIPTION = (
+    "Delete memories from Qdrant which are wrong or outdated, selected by the IDs shown "
+    "by the find tool, by a filter, or both."
+)
+DEFAULT_TOOL_UPDATE_METADATA_DESCRIPTION = (
+    "Set metadata fields of memories in Qdrant, selected by the IDs shown by the find tool, "
+    "by a filter, or both. Other fields are kept, and the memories are not stored again."
+)
 
 METADATA_PATH = "metadata"
 
@@ -40,10 +66,31 @@ class ToolSettings(BaseSettings):
         default=DEFAULT_TOOL_STORE_DESCRIPTION,
         validation_alias="TOOL_STORE_DESCRIPTION",
     )
+    tool_store_batch_description: str = Field(
+        default=DEFAULT_TOOL_STORE_BATCH_DESCRIPTION,
+        validation_alias="TOOL_STORE_BATCH_DESCRIPTION",
+    )
     tool_find_description: str = Field(
         default=DEFAULT_TOOL_FIND_DESCRIPTION,
         validation_alias="TOOL_FIND_DESCRIPTION",
     )
+    tool_find_many_description: str = Field(
+        default=DEFAULT_TOOL_FIND_MANY_DESCRIPTION,
+        validation_alias="TOOL_FIND_MANY_DESCRIPTION",
+    )
+    tool_delete_description: str = Field(
+        default=DEFAULT_TOOL_DELETE_DESCRIPTION,
+        validation_alias="TOOL_DELETE_DESCRIPTION",
+    )
+    tool_update_metadata_description: str = Field(
+        default=DEFAULT_TOOL_UPDATE_METADATA_DESCRIPTION,
+        validation_alias="TOOL_UPDATE_METADATA_DESCRIPTION",
+    )
+    find_separate_entries: bool = Field(
+        default=False,
+        validation_alias="TOOL_FIND_SEPARATE_ENTRIES",
+        description="Return each entry found by qdrant-find as its own content item, instead of one joined text",
+    )
 
 
 class EmbeddingProviderSettings(BaseSettings):
@@ -59,6 +106,72 @@ class EmbeddingProviderSettings(BaseSettings):
         default="sentence-transformers/all-MiniLM-L6-v2",
         validation_alias="EMBEDDING_MODEL",
     )
+    query_cache_size: int = Field(
+        default=0,
+        ge=0,
+        validation_alias="EMBEDDING_QUERY_CACHE_SIZE",
+        description="Maximum number of cached query embeddings. 0 disables the cache",
+    )
+    query_cache_ttl: float | None = Field(
+        default=None,
+        gt=0,
+        validation_alias="EMBEDDING_QUERY_CACHE_TTL",
+        description="Time to live of cached query embeddings in seconds. If not set, entries never expire",
+    )
+    document_cache_path: str | None = Field(
+        default=None,
+        validation_alias="EMBEDDING_CACHE_PATH",
+        description="Path to a persistent on-disk cache of document embeddings. If not set, the cache is disabled",
+    )
+    document_cache_max_size_mb: float = Field(
+        default=1024.0,
+        gt=0,
+        validation_alias="EMBEDDING_CACHE_MAX_SIZE_MB",
+        description="Maximum size of the on-disk embedding cache in megabytes",
+    )
+    batch_max_size: int = Field(
+        default=0,
+        ge=0,
+        validation_alias="EMBEDDING_BATCH_MAX_SIZE",
+        description="Number of concurrently requested texts merged into one embedding call. 0 disables micro-batching",
+    )
+    batch_max_wait_ms: float = Field(
+        default=5.0,
+        ge=0,
+        validation_alias="EMBEDDING_BATCH_MAX_WAIT_MS",
+        description="Maximum time in milliseconds a text waits for other texts to join its embedding batch",
+    )
+    sparse_model_name: str | None = Field(
+        default=None,
+        validation_alias="EMBEDDING_SPARSE_MODEL",
+        description="FastEmbed sparse model (e.g. Qdrant/bm25) stored alongside the dense vector for hybrid "
+                    "search. If not set, only dense vectors are used",
+    )
+
+    # FastEmbed Settings
+    fastembed_threads: int | None = Field(
+        default=None,
+        gt=0,
+        validation_alias="FASTEMBED_THREADS",
+        description="Number of threads used by each ONNX session. If not set, ONNX Runtime decides",
+    )
+    fastembed_parallel: int | None = Field(
+        default=None,
+        ge=0,
+        validation_alias="FASTEMBED_PARALLEL",
+        description="Number of data-parallel FastEmbed workers for large document batches (0 uses all cores)",
+    )
+    fastembed_executor: Literal["thread", "process"] = Field(
+        default="thread",
+        validation_alias="FASTEMBED_EXECUTOR",
+        description="Run inference in a thread pool sharing one model, or a process pool with one model per worker",
+    )
+    fastembed_executor_workers: int = Field(
+        default=2,
+        gt=0,
+        validation_alias="FASTEMBED_EXECUTOR_WORKERS",
+        description="Number of workers of the FastEmbed inference executor",
+    )
     
     # OpenAI Compatible Settings
     openai_api_key: str | None = Field(
@@ -81,6 +194,35 @@ class EmbeddingProviderSettings(BaseSettings):
         validation_alias="OPENAI_TIMEOUT",
         description="Request timeout in seconds for OpenAI API calls"
     )
+    openai_base64_embeddings: bool = Field(
+        default=False,
+        validation_alias="OPENAI_BASE64_EMBEDDINGS",
+        description="Request base64 encoded embeddings for bulk document embedding, if the service supports it"
+    )
+    openai_max_batch_size: int = Field(
+        default=2048,
+        gt=0,
+        validation_alias="OPENAI_MAX_BATCH_SIZE",
+        description="Maximum number of texts sent in a single embeddings request",
+    )
+    openai_max_batch_tokens: int = Field(
+        default=300_000,
+        gt=0,
+        validation_alias="OPENAI_MAX_BATCH_TOKENS",
+        description="Maximum number of tokens sent in a single embeddings request, estimated at 4 characters per token",
+    )
+    openai_max_concurrency: int = Field(
+        default=4,
+        gt=0,
+        validation_alias="OPENAI_MAX_CONCURRENCY",
+        description="Maximum number of embeddings requests in flight at once",
+    )
+    openai_max_retries: int = Field(
+        default=5,
+        ge=0,
+        validation_alias="OPENAI_MAX_RETRIES",
+        description="Number of retries of embeddings requests failing with a rate limit, server or network error",
+    )
 
 
 class FilterableField(BaseModel):
@@ -117,8 +259,49 @@ class QdrantSettings(BaseSettings):
         default=None, validation_alias="COLLECTION_NAME"
     )
     local_path: str | None = Field(default=None, validation_alias="QDRANT_LOCAL_PATH")
+    prefer_grpc: bool = Field(
+        default=False,
+        validation_alias="QDRANT_PREFER_GRPC",
+        description="Use gRPC instead of REST for requests to the Qdrant server",
+    )
+    grpc_port: int = Field(default=6334, validation_alias="QDRANT_GRPC_PORT")
+    timeout: int | None = Field(
+        default=None,
+        gt=0,
+        validation_alias="QDRANT_TIMEOUT",
+        description="Timeout in seconds of requests to the Qdrant server",
+    )
+    http2: bool = Field(
+        default=False,
+        validation_alias="QDRANT_HTTP2",
+        description="Use HTTP/2 for REST requests. Requires the `h2` package",
+    )
+    max_connections: int | None = Field(
+        default=None,
+        gt=0,
+        validation_alias="QDRANT_MAX_CONNECTIONS",
+        description="Maximum number of concurrent REST connections to the Qdrant server",
+    )
+    max_keepalive_connections: int | None = Field(
+        default=None,
+        ge=0,
+        validation_alias="QDRANT_MAX_KEEPALIVE_CONNECTIONS",
+        description="Maximum number of idle REST connections kept open to the Qdrant server",
+    )
     search_limit: int = Field(default=10, validation_alias="QDRANT_SEARCH_LIMIT")
     read_only: bool = Field(default=False, validation_alias="QDRANT_READ_ONLY")
+    store_batch_size: int = Field(
+        default=64,
+        gt=0,
+        validation_alias="QDRANT_STORE_BATCH_SIZE",
+        description="Number of entries embedded and upserted together by batch store operations",
+    )
+    collection_cache_ttl: float | None = Field(
+        default=60.0,
+        validation_alias="QDRANT_COLLECTION_CACHE_TTL",
+        description="Time to live in seconds of cached collection metadata (existence, vector config, "
+                    "payload indexes). If not set, it is only refreshed when a collection is reported missing",
+    )
     score_threshold: float | None = Field(
         default=None, 
         validation_alias="QDRANT_SCORE_THRESHOLD",
@@ -126,6 +309,136 @@ class QdrantSettings(BaseSettings):
                     "Results with scores below this threshold will be filtered out. "
                     "Default is None (no filtering)."
     )
+    quantization: Literal["none", "scalar", "product", "binary"] = Field(
+        default="none",
+        validation_alias="QDRANT_QUANTIZATION",
+        description="Quantization of the dense vectors of new collections: int8 scalar, product or binary",
+    )
+    quantization_always_ram: bool | None = Field(
+        default=None,
+        validation_alias="QDRANT_QUANTIZATION_ALWAYS_RAM",
+        description="Keep quantized vectors in RAM, even when the original vectors are on disk",
+    )
+    quantization_quantile: float | None = Field(
+        default=None,
+        gt=0.5,
+        le=1,
+        validation_alias="QDRANT_QUANTIZATION_QUANTILE",
+        description="Quantile of the values used to compute the int8 scalar quantization bounds",
+    )
+    product_compression: Literal["x4", "x8", "x16", "x32", "x64"] = Field(
+        default="x16",
+        validation_alias="QDRANT_PRODUCT_COMPRESSION",
+        description="Compression ratio of product quantization",
+    )
+    vectors_on_disk: bool | None = Field(
+        default=None,
+        validation_alias="QDRANT_VECTORS_ON_DISK",
+        description="Store the original dense vectors of new collections on disk instead of RAM",
+    )
+    hnsw_m: int | None = Field(
+        default=None,
+        ge=0,
+        validation_alias="QDRANT_HNSW_M",
+        description="Number of edges per node in the HNSW graph of new collections",
+    )
+    hnsw_ef_construct: int | None = Field(
+        default=None,
+        ge=4,
+        validation_alias="QDRANT_HNSW_EF_CONSTRUCT",
+        description="Number of neighbours considered while building the HNSW graph of new collections",
+    )
+    search_hnsw_ef: int | None = Field(
+        default=None,
+        gt=0,
+        validation_alias="QDRANT_SEARCH_HNSW_EF",
+        description="Size of the beam used by searches in the HNSW graph. Higher is more accurate and slower",
+    )
+    search_rescore: bool | None = Field(
+        default=None,
+        validation_alias="QDRANT_SEARCH_RESCORE",
+        description="Rescore the candidates found with quantized vectors using the original vectors",
+    )
+    search_oversampling: float | None = Field(
+        default=None,
+        ge=1,
+        validation_alias="QDRANT_SEARCH_OVERSAMPLING",
+        description="Fetch this many times more candidates with quantized vectors before rescoring",
+    )
+    payload_include: list[str] | None = Field(
+        default=None,
+        validation_alias="QDRANT_PAYLOAD_INCLUDE",
+        description="Payload fields fetched by searches, as a JSON list. If not set, only the fields "
+                    "displayed for the detected payload format are fetched",
+    )
+    payload_exclude: list[str] | None = Field(
+        default=None,
+        validation_alias="QDRANT_PAYLOAD_EXCLUDE",
+        description="Payload fields never fetched by searches, as a JSON list. Ignored if "
+                    "QDRANT_PAYLOAD_INCLUDE is set",
+    )
+    point_id_mode: Literal["random", "content"] = Field(
+        default="random",
+        validation_alias="QDRANT_POINT_ID_MODE",
+        description="Give stored points random IDs, or IDs derived from their content and some "
+                    "of their metadata, so that storing an entry again replaces it",
+    )
+    point_id_metadata_keys: list[str] = Field(
+        default=["filePath", "startLine"],
+        validation_alias="QDRANT_POINT_ID_METADATA_KEYS",
+        description="Metadata keys distinguishing entries with the same content, as a JSON list. "
+                    "Only used by the content ID mode",
+    )
+    skip_existing: bool = Field(
+        default=False,
+        validation_alias="QDRANT_SKIP_EXISTING",
+        description="Check which content IDs are already stored, and skip embedding their entries. "
+                    "Requires the content ID mode",
+    )
+    search_cache_size: int = Field(
+        default=0,
+        ge=0,
+        validation_alias="QDRANT_SEARCH_CACHE_SIZE",
+        description="Maximum number of searches whose results are cached. 0 disables the cache",
+    )
+    search_cache_ttl: float | None = Field(
+        default=30.0,
+        gt=0,
+        validation_alias="QDRANT_SEARCH_CACHE_TTL",
+        description="Time to live of cached search results in seconds, for writes made by other processes",
+    )
+    hybrid_fusion: Literal["rrf", "dbsf"] = Field(
+        default="rrf",
+        validation_alias="QDRANT_HYBRID_FUSION",
+        description="How dense and sparse results are fused by hybrid search: reciprocal rank fusion "
+                    "or distribution-based score fusion",
+    )
+    hybrid_prefetch_limit: int = Field(
+        default=20,
+        gt=0,
+        validation_alias="QDRANT_HYBRID_PREFETCH_LIMIT",
+        description="Number of candidates fetched by each of the dense and sparse searches before fusion",
+    )
+    mmr_lambda: float | None = Field(
+        default=None,
+        ge=0,
+        le=1,
+        validation_alias="QDRANT_MMR_LAMBDA",
+        description="Trade-off between relevance (1) and diversity (0) of search results, re-ranked "
+                    "with Maximal Marginal Relevance. If not set, results are not re-ranked",
+    )
+    mmr_candidates_factor: int = Field(
+        default=4,
+        ge=1,
+        validation_alias="QDRANT_MMR_CANDIDATES_FACTOR",
+        description="Number of candidates fetched per returned entry for MMR re-ranking",
+    )
+    mmr_method: Literal["numpy", "qdrant"] = Field(
+        default="numpy",
+        validation_alias="QDRANT_MMR_METHOD",
+        description="Re-rank the candidates in the server process with NumPy, or with the MMR query "
+                    "of Qdrant 1.15+. Hybrid searches are always re-ranked in the server process",
+    )
 
     filterable_fields: list[FilterableField] | None = Field(default=None)
 
@@ -133,6 +446,79 @@ class QdrantSettings(BaseSettings):
         default=False, validation_alias="QDRANT_ALLOW_ARBITRARY_FILTER"
     )
 
+    def client_options(self) -> dict[str, Any]:
+        """
+        Transport options passed to the Qdrant client. Only the options differing
+        from the client defaults are included.
+        """
+        options: dict[str, Any] = {}
+        if self.prefer_grpc:
+            options["prefer_grpc"] = True
+            options["grpc_port"] = self.grpc_port
+        if self.timeout is not None:
+            options["timeout"] = self.timeout
+        if self.http2:
+            options["http2"] = True
+        if self.max_connections is not None or self.max_keepalive_connections is not None:
+            options["limits"] = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+            )
+        return options
+
+    def vector_options(self) -> dict[str, Any]:
+        """
+        Storage, HNSW and quantization options of the dense vector of new collections,
+        passed to `VectorParams`. Only the configured options are included.
+        """
+        from qdrant_client import models
+
+        options: dict[str, Any] = {}
+        if self.vectors_on_disk is not None:
+            options["on_disk"] = self.vectors_on_disk
+        if self.hnsw_m is not None or self.hnsw_ef_construct is not None:
+            options["hnsw_config"] = models.HnswConfigDiff(
+                m=self.hnsw_m, ef_construct=self.hnsw_ef_construct
+            )
+
+        if self.quantization == "scalar":
+            options["quantization_config"] = models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    quantile=self.quantization_quantile,
+                    always_ram=self.quantization_always_ram,
+                )
+            )
+        elif self.quantization == "product":
+            options["quantization_config"] = models.ProductQuantization(
+                product=models.ProductQuantizationConfig(
+                    compression=models.CompressionRatio(self.product_compression),
+                    always_ram=self.quantization_always_ram,
+                )
+            )
+        elif self.quantization == "binary":
+            options["quantization_config"] = models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(
+                    always_ram=self.quantization_always_ram,
+                )
+            )
+        return options
+
+    def search_params(self) -> "models.SearchParams | None":
+        """
+        Search parameters applied to dense searches, or None if none is configured.
+        """
+        from qdrant_client import models
+
+        quantization = None
+        if self.search_rescore is not None or self.search_oversampling is not None:
+            quantization = models.QuantizationSearchParams(
+                rescore=self.search_rescore, oversampling=self.search_oversampling
+            )
+        if self.search_hnsw_ef is None and quantization is None:
+            return None
+        return models.SearchParams(hnsw_ef=self.search_hnsw_ef, quantization=quantization)
+
     def filterable_fields_dict(self) -> dict[str, FilterableField]:
         if self.filterable_fields is None:
             return {}
@@ -156,6 +542,12 @@ class QdrantSettings(BaseSettings):
                 )
         return self
 
+    @model_validator(mode="after")
+    def check_skip_existing(self) -> "QdrantSettings":
+        if self.skip_existing and self.point_id_mode != "content":
+            raise ValueError("'skip_existing' requires the 'content' point ID mode.")
+        return self
+
 
 class ServerSettings(BaseSettings):
     """
@@ -177,6 +569,138 @@ class ServerSettings(BaseSettings):
         validation_alias="QDRANT_DATA_PATH",
         description="Docker Qdrant data volume path"
     )
+    lazy_startup: bool = Field(
+        default=False,
+        validation_alias="LAZY_STARTUP",
+        description="Answer the MCP handshake immediately and load the embedding model and "
+                    "Qdrant client in the background. Tool calls wait until they are ready",
+    )
+    warmup: bool = Field(
+        default=False,
+        validation_alias="WARMUP",
+        description="Run dummy embeddings and a trivial Qdrant query when the server starts, "
+                    "so that the first tool call is as fast as the following ones",
+    )
+
+
+DEFAULT_INDEX_EXTENSIONS = [
+    ".py", ".pyi", ".js", ".jsx", ".ts", ".tsx", ".java", ".kt", ".scala", ".go", ".rs",
+    ".c", ".h", ".cc", ".cpp", ".hpp", ".cs", ".rb", ".php", ".swift", ".m", ".sh",
+    ".sql", ".md", ".rst", ".txt", ".toml", ".yaml", ".yml", ".json",
+]
+DEFAULT_INDEX_EXCLUDE_DIRS = [
+    "node_modules", "__pycache__", "venv", "env", "build", "dist", "target", "vendor",
+]
+
+
+class IndexerSettings(BaseSettings):
+    """
+    Configuration for the codebase indexer.
+    """
+
+    chunk_lines: int = Field(
+        default=60,
+        gt=0,
+        validation_alias="INDEX_CHUNK_LINES",
+        description="Number of lines of each indexed chunk",
+    )
+    chunk_overlap: int = Field(
+        default=10,
+        ge=0,
+        validation_alias="INDEX_CHUNK_OVERLAP",
+        description="Number of lines shared by consecutive chunks of a file",
+    )
+    workers: int = Field(
+        default=4,
+        gt=0,
+        validation_alias="INDEX_WORKERS",
+        description="Number of files read, embedded and upserted in parallel",
+    )
+    batch_size: int = Field(
+        default=64,
+        gt=0,
+        validation_alias="INDEX_BATCH_SIZE",
+        description="Number of chunks a worker gathers from consecutive files before storing them",
+    )
+    manifest_path: str | None = Field(
+        default=None,
+        validation_alias="INDEX_MANIFEST_PATH",
+        description="Path of the manifest of indexed file hashes. Defaults to "
+                    ".mcp-server-qdrant-index.json in the indexed directory",
+    )
+    max_file_size_kb: int = Field(
+        default=512,
+        gt=0,
+        validation_alias="INDEX_MAX_FILE_SIZE_KB",
+        description="Files larger than this are not indexed",
+    )
+    extensions: list[str] = Field(
+        default=DEFAULT_INDEX_EXTENSIONS,
+        validation_alias="INDEX_EXTENSIONS",
+        description="Extensions of the indexed files, as a JSON list",
+    )
+    exclude_dirs: list[str] = Field(
+        default=DEFAULT_INDEX_EXCLUDE_DIRS,
+        validation_alias="INDEX_EXCLUDE_DIRS",
+        description="Directory names never walked into, as a JSON list. Hidden directories are "
+                    "always skipped",
+    )
+
+    watch_path: str | None = Field(
+        default=None,
+        validation_alias="INDEX_WATCH_PATH",
+        description="Directory the MCP server indexes into the default collection at start, "
+                    "then keeps in sync with the changes of its files",
+    )
+    watch_debounce_ms: int = Field(
+        default=1600,
+        gt=0,
+        validation_alias="INDEX_WATCH_DEBOUNCE_MS",
+        description="Maximum time in milliseconds file changes are gathered before being indexed",
+    )
+    watch_batch_files: int = Field(
+        default=20,
+        gt=0,
+        validation_alias="INDEX_WATCH_BATCH_FILES",
+        description="Maximum number of changed files indexed at once",
+    )
+    watch_max_pending: int = Field(
+        default=2000,
+        gt=0,
+        validation_alias="INDEX_WATCH_MAX_PENDING",
+        description="Number of pending changed files beyond which the repository is rescanned instead",
+    )
+    watch_pause_ms: float = Field(
+        default=50.0,
+        ge=0,
+        validation_alias="INDEX_WATCH_PAUSE_MS",
+        description="Time in milliseconds to wait between two batches of changed files",
+    )
+    watch_max_search_wait_ms: float = Field(
+        default=2000.0,
+        ge=0,
+        validation_alias="INDEX_WATCH_MAX_SEARCH_WAIT_MS",
+        description="Maximum time in milliseconds a batch of changed files waits for running "
+                    "searches to complete",
+    )
+
+    def watch_options(self) -> dict[str, Any]:
+        """
+        Options of `CodebaseIndexer.watch` batching and throttling the indexing of changes.
+        """
+        return {
+            "debounce_ms": self.watch_debounce_ms,
+            "batch_files": self.watch_batch_files,
+            "max_pending": self.watch_max_pending,
+            "pause": self.watch_pause_ms / 1000,
+            "max_foreground_wait": self.watch_max_search_wait_ms / 1000,
+        }
+
+    @model_validator(mode="after")
+    def check_chunk_overlap(self) -> "IndexerSettings":
+        if self.chunk_overlap >= self.chunk_lines:
+            raise ValueError("'chunk_overlap' must be smaller than 'chunk_lines'.")
+        return self
 
 
 class LoggingSettings(BaseSettings):
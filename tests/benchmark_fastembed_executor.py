@@ -0,0 +1,56 @@
+"""
+Benchmark of FastEmbed query throughput with different inference executors.
+
+Measures queries/sec at 1, 4 and 16 concurrent clients for a thread pool with
+1 and 4 workers, and a process pool with 4 workers.
+
+Usage:
+    uv run python tests/benchmark_fastembed_executor.py --queries 400
+"""
+import argparse
+import asyncio
+import time
+
+from mcp_server_qdrant.embeddings.fastembed import FastEmbedProvider
+
+MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+CONCURRENCY_LEVELS = (1, 4, 16)
+CONFIGURATIONS = (
+    {"executor_type": "thread", "executor_workers": 1},
+    {"executor_type": "thread", "executor_workers": 4, "threads": 1},
+    {"executor_type": "process", "executor_workers": 4, "threads": 1},
+)
+
+
+async def measure(provider: FastEmbedProvider, clients: int, queries: int) -> float:
+    per_client = max(1, queries // clients)
+
+    async def client(client_id: int):
+        for i in range(per_client):
+            await provider.embed_query(f"how does client {client_id} handle request {i}?")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(c) for c in range(clients)))
+    return per_client * clients / (time.perf_counter() - start)
+
+
+async def run(queries: int):
+    for configuration in CONFIGURATIONS:
+        provider = FastEmbedProvider(MODEL_NAME, **configuration)
+        # Warm up every worker so that model loading is not measured
+        await asyncio.gather(
+            *(provider.embed_query("warm up") for _ in range(configuration["executor_workers"] * 2))
+        )
+        label = ", ".join(f"{key}={value}" for key, value in configuration.items())
+        print(label)
+        for clients in CONCURRENCY_LEVELS:
+            qps = await measure(provider, clients, queries)
+            print(f"  {clients:3d} clients: {qps:8.1f} queries/sec")
+        provider.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark FastEmbed executors")
+    parser.add_argument("--queries", type=int, default=400)
+    args = parser.parse_args()
+    asyncio.run(run(args.queries))
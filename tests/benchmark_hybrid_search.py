@@ -0,0 +1,126 @@
+"""
+Benchmark of hybrid dense + sparse search against dense-only search.
+
+The corpus is the source code of this package, split into one chunk per function and
+method. Each chunk is looked up twice: by its identifier, the way agents search for a
+symbol, and by the first line of its docstring, as a natural language question. A query
+is a hit if its chunk is in the top 10 results.
+
+Runs in-memory with the dense embedding provider configured in the environment and a
+FastEmbed sparse model.
+
+Usage:
+    uv run python tests/benchmark_hybrid_search.py --sparse-model Qdrant/bm25 --fusion rrf
+"""
+import argparse
+import ast
+import asyncio
+import statistics
+import time
+import uuid
+from pathlib import Path
+
+from mcp_server_qdrant.embeddings.factory import create_embedding_provider
+from mcp_server_qdrant.embeddings.fastembed import FastEmbedSparseProvider
+from mcp_server_qdrant.qdrant import Entry, QdrantConnector
+from mcp_server_qdrant.settings import EmbeddingProviderSettings
+
+SOURCE_DIR = Path(__file__).parent.parent / "src" / "mcp_server_qdrant"
+TOP_K = 10
+
+
+def load_corpus() -> tuple[list[Entry], list[tuple[str, str, int]]]:
+    """
+    Split the package into function chunks.
+    :return: The chunks, and the queries as (kind, text, index of the relevant chunk).
+    """
+    entries: list[Entry] = []
+    queries: list[tuple[str, str, int]] = []
+    for path in sorted(SOURCE_DIR.rglob("*.py")):
+        source = path.read_text(encoding="utf-8")
+        for node in ast.walk(ast.parse(source)):
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            if node.name.startswith("__"):
+                continue
+            chunk = ast.get_source_segment(source, node)
+            if not chunk:
+                continue
+            index = len(entries)
+            entries.append(
+                Entry(
+                    content=chunk,
+                    metadata={
+                        "filePath": str(path.relative_to(SOURCE_DIR)),
+                        "startLine": node.lineno,
+                        "endLine": node.end_lineno,
+                    },
+                )
+            )
+            queries.append(("identifier", node.name, index))
+            docstring = ast.get_docstring(node)
+            if docstring and len(docstring.split()) >= 4:
+                queries.append(("docstring", docstring.splitlines()[0], index))
+    return entries, queries
+
+
+async def evaluate(
+    connector: QdrantConnector, queries: list[tuple[str, str, int]], ids: dict[str, int]
+) -> dict[str, tuple[float, list[float]]]:
+    """Run all the queries and get the recall@10 and latencies per kind of query."""
+    hits: dict[str, list[bool]] = {}
+    latencies: dict[str, list[float]] = {}
+    for kind, text, relevant in queries:
+        start = time.perf_counter()
+        results = await connector.search(text, limit=TOP_K)
+        latencies.setdefault(kind, []).append(time.perf_counter() - start)
+        found = [ids.get(entry.content) for entry in results]
+        hits.setdefault(kind, []).append(relevant in found)
+    return {
+        kind: (sum(hits[kind]) / len(hits[kind]), latencies[kind]) for kind in hits
+    }
+
+
+async def run(sparse_model: str, fusion: str, prefetch_limit: int):
+    entries, queries = load_corpus()
+    ids = {entry.content: i for i, entry in enumerate(entries)}
+    embedding_provider = create_embedding_provider(EmbeddingProviderSettings())
+    sparse_provider = FastEmbedSparseProvider(sparse_model)
+
+    connectors = {
+        "dense": QdrantConnector(
+            ":memory:", None, f"bench_dense_{uuid.uuid4().hex}", embedding_provider
+        ),
+        f"hybrid ({fusion})": QdrantConnector(
+            ":memory:",
+            None,
+            f"bench_hybrid_{uuid.uuid4().hex}",
+            embedding_provider,
+            sparse_embedding_provider=sparse_provider,
+            hybrid_fusion=fusion,
+            hybrid_prefetch_limit=prefetch_limit,
+        ),
+    }
+
+    print(f"Corpus: {len(entries)} chunks, {len(queries)} queries, top {TOP_K}")
+    for name, connector in connectors.items():
+        await connector.store_many(entries)
+        # Warm up the models so that loading time is not measured
+        await connector.search("warm up")
+
+        print(f"{name}:")
+        for kind, (recall, latencies) in (await evaluate(connector, queries, ids)).items():
+            p95 = statistics.quantiles(latencies, n=20)[-1]
+            print(
+                f"  {kind:10s} recall@{TOP_K}: {recall:6.1%}  "
+                f"mean: {statistics.mean(latencies) * 1000:6.2f} ms  p95: {p95 * 1000:6.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark hybrid search")
+    parser.add_argument("--sparse-model", default="Qdrant/bm25")
+    parser.add_argument("--fusion", choices=["rrf", "dbsf"], default="rrf")
+    parser.add_argument("--prefetch-limit", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.sparse_model, args.fusion, args.prefetch_limit))
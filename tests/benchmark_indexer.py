@@ -0,0 +1,98 @@
+"""
+Throughput benchmark of the codebase indexer.
+
+Indexes a generated repository into an in-memory Qdrant with 1, 2, 4 and 8 workers,
+using an embedding provider which sleeps like a remote embedding service would, then
+measures an incremental rerun where a few files changed.
+
+Usage:
+    uv run python -m tests.benchmark_indexer --files 400 --lines 200 --latency-ms 20
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from qdrant_client import models
+
+from mcp_server_qdrant.indexer import CodebaseIndexer
+from mcp_server_qdrant.payload_formats import CODE_CHUNK_FORMAT
+from mcp_server_qdrant.qdrant import QdrantConnector
+from tests.fake_embeddings import FakeEmbeddingProvider
+
+
+class SlowEmbeddingProvider(FakeEmbeddingProvider):
+    """Fake provider paying a fixed latency per call, plus a small cost per text."""
+
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+
+    async def embed_documents(self, documents: list[str]) -> list[list[float]]:
+        await asyncio.sleep(self.latency + 0.0002 * len(documents))
+        return await super().embed_documents(documents)
+
+
+def make_repository(root: Path, files: int, lines: int):
+    for i in range(files):
+        path = root / f"package_{i % 20}" / f"module_{i}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            "".join(f"def function_{i}_{j}(value):\n    return value * {j}\n" for j in range(lines // 2))
+        )
+
+
+def make_indexer(root: Path, workers: int, latency: float) -> CodebaseIndexer:
+    connector = QdrantConnector(
+        qdrant_url=":memory:",
+        qdrant_api_key=None,
+        collection_name=f"bench_{uuid.uuid4().hex}",
+        embedding_provider=SlowEmbeddingProvider(latency),
+        field_indexes={"filePath": models.PayloadSchemaType.KEYWORD},
+        store_payload_format=CODE_CHUNK_FORMAT,
+        point_id_mode="content",
+        point_id_metadata_keys=["filePath", "startLine"],
+        skip_existing=True,
+    )
+    return CodebaseIndexer(
+        connector,
+        root,
+        manifest_path=root.parent / f"manifest_{workers}.json",
+        workers=workers,
+    )
+
+
+async def run(files: int, lines: int, latency: float):
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory) / "repository"
+        make_repository(root, files, lines)
+        print(f"Files: {files}, lines per file: {lines}, embedding latency: {latency * 1000:.0f} ms")
+
+        indexer = None
+        for workers in (1, 2, 4, 8):
+            indexer = make_indexer(root, workers, latency)
+            stats = await indexer.index()
+            print(
+                f"  {workers} workers: {stats.files_indexed / stats.seconds:8.1f} files/sec, "
+                f"{stats.chunks / stats.seconds:8.1f} chunks/sec ({stats.seconds:.2f}s)"
+            )
+
+        assert indexer is not None
+        for path in sorted(root.rglob("*.py"))[:5]:
+            path.write_text(path.read_text() + "# changed\n")
+        stats = await indexer.index()
+        print(
+            f"  rerun, {stats.files_indexed} changed files: {stats.seconds:.2f}s "
+            f"({stats.files_unchanged} unchanged files skipped)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the codebase indexer")
+    parser.add_argument("--files", type=int, default=400)
+    parser.add_argument("--lines", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.files, args.lines, args.latency_ms / 1000))
@@ -0,0 +1,61 @@
+"""
+Cost of the MMR re-ranking of search results.
+
+Times `mmr_select` picking 10 results among 20 to 1000 candidates of 384 and 1536
+dimensions, against a variant computing the full pairwise similarity matrix first.
+Vectors are random, so that only the selection is measured, not the search.
+
+Usage:
+    uv run python -m tests.benchmark_mmr --limit 10 --repeat 50
+"""
+import argparse
+import time
+
+import numpy as np
+
+from mcp_server_qdrant.mmr import mmr_select
+
+
+def pairwise_mmr(query: np.ndarray, vectors: np.ndarray, limit: int, lambda_mult: float) -> list[int]:
+    candidates = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    relevance = candidates @ (query / np.linalg.norm(query))
+    similarities = candidates @ candidates.T
+    selected = [int(np.argmax(relevance))]
+    while len(selected) < min(limit, len(candidates)):
+        scores = lambda_mult * relevance - (1 - lambda_mult) * similarities[:, selected].max(axis=1)
+        scores[selected] = -np.inf
+        selected.append(int(np.argmax(scores)))
+    return selected
+
+
+def measure(select, query: np.ndarray, vectors: np.ndarray, limit: int, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        select(query, vectors, limit, 0.5)
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def run(limit: int, repeat: int):
+    rng = np.random.default_rng(0)
+    print(f"Selecting {limit} results, mean of {repeat} runs")
+    for dim in (384, 1536):
+        print(f"  {dim} dimensions:")
+        for count in (20, 40, 100, 200, 500, 1000):
+            query = rng.standard_normal(dim).astype(np.float32)
+            vectors = rng.standard_normal((count, dim)).astype(np.float32)
+            # Vectors as Qdrant returns them, lists of Python floats
+            as_lists = vectors.tolist()
+            assert mmr_select(query, vectors, limit) == pairwise_mmr(query, vectors, limit, 0.5)
+            print(
+                f"    {count:5d} candidates: {measure(mmr_select, query, vectors, limit, repeat):7.3f} ms, "
+                f"from lists {measure(mmr_select, query, as_lists, limit, repeat):7.3f} ms, "
+                f"pairwise {measure(pairwise_mmr, query, vectors, limit, repeat):7.3f} ms"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the MMR re-ranking")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    run(args.limit, args.repeat)
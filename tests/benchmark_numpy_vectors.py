@@ -0,0 +1,71 @@
+"""
+Benchmark of the float32 array path from embedding provider to Qdrant upsert.
+
+Compares, for 10k documents of 1536 dimensions, the former path (nested lists of
+Python floats for the whole input, wrapped in `PointStruct`s) with the array path
+used by `store_many` (a float32 array, converted to a `models.Batch` one upsert
+batch at a time). Vectors are synthetic, so that only the data handling is measured.
+
+Usage:
+    uv run python tests/benchmark_numpy_vectors.py --count 10000 --dim 1536
+"""
+import argparse
+import time
+import tracemalloc
+import uuid
+
+import numpy as np
+from qdrant_client import models
+
+
+def list_path(embeddings: np.ndarray, batch_size: int) -> int:
+    # Providers used to return one list of Python floats per document
+    vectors = [embedding.tolist() for embedding in embeddings]
+    upserted = 0
+    for start in range(0, len(vectors), batch_size):
+        points = [
+            models.PointStruct(
+                id=uuid.uuid4().hex,
+                vector={"vector": vector},
+                payload={"document": f"document {start + i}"},
+            )
+            for i, vector in enumerate(vectors[start : start + batch_size])
+        ]
+        upserted += len(points)
+    return upserted
+
+
+def array_path(embeddings: np.ndarray, batch_size: int) -> int:
+    upserted = 0
+    for start in range(0, len(embeddings), batch_size):
+        chunk = embeddings[start : start + batch_size]
+        batch = models.Batch(
+            ids=[uuid.uuid4().hex for _ in range(len(chunk))],
+            vectors={"vector": chunk.tolist()},
+            payloads=[{"document": f"document {start + i}"} for i in range(len(chunk))],
+        )
+        upserted += len(batch.ids)
+    return upserted
+
+
+def measure(name: str, function, embeddings: np.ndarray, batch_size: int):
+    tracemalloc.start()
+    start = time.perf_counter()
+    function(embeddings, batch_size)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {name:10s} {elapsed:8.2f}s  peak memory {peak / (1024 * 1024):10.1f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the float32 vector path")
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--batch-size", type=int, default=64)
+    args = parser.parse_args()
+
+    embeddings = np.random.default_rng(0).random((args.count, args.dim), dtype=np.float32)
+    print(f"{args.count} documents of {args.dim} dimensions, batches of {args.batch_size}")
+    measure("lists", list_path, embeddings, args.batch_size)
+    measure("array", array_path, embeddings, args.batch_size)
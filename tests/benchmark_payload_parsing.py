@@ -0,0 +1,105 @@
+"""
+Microbenchmark of converting search results into entries.
+
+Compares the previous parsing, which probed the payload format of every point and
+validated each entry, with the payload format adapters, which detect the format once
+per collection and reuse a precompiled extractor.
+
+Usage:
+    uv run python -m tests.benchmark_payload_parsing --points 1000 --repeat 200
+"""
+import argparse
+import statistics
+import time
+
+from qdrant_client import models
+
+from mcp_server_qdrant.qdrant import Entry, QdrantConnector
+from tests.fake_embeddings import FakeEmbeddingProvider
+
+PAYLOADS = {
+    "document": lambda i: {
+        "document": f"Entry number {i} " * 10,
+        "metadata": {"source": "benchmark", "index": i},
+    },
+    "codeChunk": lambda i: {
+        "codeChunk": f"def function_{i}():\n    return {i}\n" * 5,
+        "filePath": f"src/module_{i % 50}.py",
+        "startLine": i,
+        "endLine": i + 10,
+    },
+    "text": lambda i: {"text": f"Some generic text {i} " * 10, "source": "benchmark"},
+}
+
+
+def legacy_parse(points: list[models.ScoredPoint]) -> list[Entry]:
+    """The parsing used before payload format adapters."""
+    entries = []
+    for result in points:
+        score = getattr(result, "score", None)
+        if "document" in result.payload:
+            entries.append(
+                Entry(
+                    content=result.payload["document"],
+                    metadata=result.payload.get("metadata"),
+                    score=score,
+                )
+            )
+        elif "codeChunk" in result.payload:
+            content = result.payload["codeChunk"]
+            metadata = {k: v for k, v in result.payload.items() if k != "codeChunk"}
+            entries.append(Entry(content=content, metadata=metadata, score=score))
+        else:
+            text_fields = ["text", "content", "body", "description"]
+            content = None
+            for field in text_fields:
+                if field in result.payload:
+                    content = result.payload[field]
+                    break
+            if content is None:
+                content = str(result.payload)
+                metadata = None
+            else:
+                metadata = {k: v for k, v in result.payload.items() if k != field}
+            entries.append(Entry(content=content, metadata=metadata, score=score))
+    return entries
+
+
+def measure(parse, points: list[models.ScoredPoint], repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(points)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run(num_points: int, repeat: int):
+    connector = QdrantConnector(":memory:", None, None, FakeEmbeddingProvider())
+    print(f"Parsing {num_points} points, {repeat} times")
+    for name, make_payload in PAYLOADS.items():
+        points = [
+            models.ScoredPoint(id=i, version=0, score=1.0 / (i + 1), payload=make_payload(i))
+            for i in range(num_points)
+        ]
+        payload_format = connector.payload_formats.detect(points[0].payload)
+        assert [entry.content for entry in legacy_parse(points)] == [
+            entry.content for entry in connector._parse_points(points, payload_format)
+        ]
+
+        before = statistics.median(measure(legacy_parse, points, repeat))
+        after = statistics.median(
+            measure(lambda p: connector._parse_points(p, payload_format), points, repeat)
+        )
+        print(
+            f"  {name:10s} before: {before * 1000:7.3f} ms  "
+            f"after: {after * 1000:7.3f} ms  speedup: {before / after:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark payload parsing")
+    parser.add_argument("--points", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    run(args.points, args.repeat)
@@ -0,0 +1,69 @@
+"""
+Benchmark of `QdrantConnector.store_many` against a loop of single `store` calls.
+
+Runs against a local Qdrant (`QDRANT_LOCAL_PATH`, or in-memory if not set) with the
+embedding provider configured in the environment.
+
+Usage:
+    uv run python tests/benchmark_store_many.py --count 2000 --batch-size 64
+"""
+import argparse
+import asyncio
+import os
+import time
+import uuid
+
+from mcp_server_qdrant.embeddings.factory import create_embedding_provider
+from mcp_server_qdrant.qdrant import Entry, QdrantConnector
+from mcp_server_qdrant.settings import EmbeddingProviderSettings
+
+
+def make_entries(count: int) -> list[Entry]:
+    return [
+        Entry(
+            content=f"def function_{i}(value):\n    return value * {i} + {i % 7}",
+            metadata={"filePath": f"src/module_{i % 50}.py", "startLine": i, "endLine": i + 1},
+        )
+        for i in range(count)
+    ]
+
+
+async def run(count: int, batch_size: int):
+    local_path = os.getenv("QDRANT_LOCAL_PATH")
+    embedding_provider = create_embedding_provider(EmbeddingProviderSettings())
+    connector = QdrantConnector(
+        qdrant_url=None if local_path else ":memory:",
+        qdrant_api_key=None,
+        collection_name=None,
+        embedding_provider=embedding_provider,
+        qdrant_local_path=local_path,
+        store_batch_size=batch_size,
+    )
+    entries = make_entries(count)
+
+    # Warm up the model so that loading time is not measured
+    await embedding_provider.embed_documents(["warm up"])
+
+    collection_name = f"bench_single_{uuid.uuid4().hex}"
+    start = time.perf_counter()
+    for entry in entries:
+        await connector.store(entry, collection_name=collection_name)
+    single_elapsed = time.perf_counter() - start
+
+    collection_name = f"bench_batch_{uuid.uuid4().hex}"
+    start = time.perf_counter()
+    await connector.store_many(entries, collection_name=collection_name)
+    batch_elapsed = time.perf_counter() - start
+
+    print(f"Entries: {count}, batch size: {batch_size}")
+    print(f"  store loop: {count / single_elapsed:10.1f} points/sec ({single_elapsed:.2f}s)")
+    print(f"  store_many: {count / batch_elapsed:10.1f} points/sec ({batch_elapsed:.2f}s)")
+    print(f"  speedup:    {single_elapsed / batch_elapsed:10.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batch storing")
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=64)
+    args = parser.parse_args()
+    asyncio.run(run(args.count, args.batch_size))
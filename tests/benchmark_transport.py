@@ -0,0 +1,95 @@
+"""
+Benchmark of `QdrantConnector.search` latency over REST and gRPC.
+
+Requires a running Qdrant server (`QDRANT_URL`, default http://localhost:6333, with
+the gRPC port on `QDRANT_GRPC_PORT`, default 6334). A temporary collection of random
+vectors is created, so that only the transport is measured, and removed afterwards.
+
+Usage:
+    uv run python tests/benchmark_transport.py --points 10000 --queries 500
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import uuid
+
+import numpy as np
+
+from mcp_server_qdrant.embeddings.base import EmbeddingProvider
+from mcp_server_qdrant.qdrant import Entry, QdrantConnector
+
+DIM = 384
+
+
+class RandomEmbeddingProvider(EmbeddingProvider):
+    """Returns random unit vectors, so that no model is involved."""
+
+    def __init__(self):
+        self._rng = np.random.default_rng(0)
+
+    def _vectors(self, count: int) -> np.ndarray:
+        vectors = self._rng.standard_normal((count, DIM)).astype(np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    async def embed_documents(self, documents: list[str]) -> list[list[float]]:
+        return self._vectors(len(documents)).tolist()
+
+    async def embed_documents_array(self, documents: list[str]) -> np.ndarray:
+        return self._vectors(len(documents))
+
+    async def embed_query(self, query: str) -> list[float]:
+        return self._vectors(1)[0].tolist()
+
+    def get_vector_name(self) -> str:
+        return "random"
+
+    def get_vector_size(self) -> int:
+        return DIM
+
+
+async def measure(connector: QdrantConnector, collection_name: str, queries: int) -> list[float]:
+    loop = asyncio.get_running_loop()
+    latencies = []
+    for i in range(queries):
+        start = loop.time()
+        await connector.search(f"query {i}", collection_name=collection_name, limit=10)
+        latencies.append((loop.time() - start) * 1000)
+    return latencies
+
+
+async def run(points: int, queries: int):
+    url = os.getenv("QDRANT_URL", "http://localhost:6333")
+    grpc_port = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+    api_key = os.getenv("QDRANT_API_KEY")
+    collection_name = f"bench_transport_{uuid.uuid4().hex}"
+    provider = RandomEmbeddingProvider()
+
+    rest = QdrantConnector(url, api_key, collection_name, provider)
+    grpc = QdrantConnector(
+        url,
+        api_key,
+        collection_name,
+        provider,
+        client_options={"prefer_grpc": True, "grpc_port": grpc_port},
+    )
+
+    await grpc.store_many([Entry(content=f"point {i}") for i in range(points)])
+    try:
+        for name, connector in (("REST", rest), ("gRPC", grpc)):
+            # Warm up the connection pool
+            await measure(connector, collection_name, 10)
+            latencies = sorted(await measure(connector, collection_name, queries))
+            p50 = statistics.median(latencies)
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            print(f"{name}: p50 {p50:7.2f} ms, p99 {p99:7.2f} ms over {queries} searches")
+    finally:
+        await rest._client.delete_collection(collection_name)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark REST vs gRPC search latency")
+    parser.add_argument("--points", type=int, default=10_000)
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(run(args.points, args.queries))
@@ -0,0 +1,55 @@
+"""
+Fixtures and helpers shared by the tests of the connector and the indexer.
+"""
+import uuid
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from mcp_server_qdrant.indexer import create_index_connector
+from mcp_server_qdrant.qdrant import QdrantConnector
+from mcp_server_qdrant.settings import QdrantSettings
+from tests.fake_embeddings import FakeEmbeddingProvider
+
+
+@pytest.fixture
+def embedding_provider() -> FakeEmbeddingProvider:
+    return FakeEmbeddingProvider()
+
+
+@pytest.fixture
+def make_connector(embedding_provider) -> Callable[..., QdrantConnector]:
+    """
+    Create connectors to new collections of an in-memory Qdrant.
+    The keyword arguments are passed to the connector, which embeds with `embedding_provider`
+    unless another provider is given.
+    """
+
+    def make(**kwargs) -> QdrantConnector:
+        kwargs.setdefault("embedding_provider", embedding_provider)
+        return QdrantConnector(
+            qdrant_url=":memory:",
+            qdrant_api_key=None,
+            collection_name=f"test_collection_{uuid.uuid4().hex}",
+            **kwargs,
+        )
+
+    return make
+
+
+@pytest.fixture
+def connector(embedding_provider) -> QdrantConnector:
+    """A connector storing code chunks, configured like the one of the indexer."""
+    return create_index_connector(
+        f"test_collection_{uuid.uuid4().hex}",
+        qdrant_settings=QdrantSettings(QDRANT_URL=":memory:"),
+        embedding_provider=embedding_provider,
+    )
+
+
+def write(root: Path, path: str, text: str):
+    """Write a file of a test repository, creating its directories."""
+    full_path = root / path
+    full_path.parent.mkdir(parents=True, exist_ok=True)
+    full_path.write_text(text)
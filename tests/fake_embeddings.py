@@ -0,0 +1,85 @@
+"""
+Deterministic embedding providers for tests that should not download a model.
+"""
+import hashlib
+import math
+import re
+
+from qdrant_client import models
+
+from mcp_server_qdrant.embeddings.base import EmbeddingProvider, SparseEmbeddingProvider
+
+
+class FakeEmbeddingProvider(EmbeddingProvider):
+    """
+    Hashes every word of a text into a bag-of-words vector, so that texts sharing
+    words are similar. Counts the calls, which lets tests check batching behaviour.
+    :param vector_size: The size of the produced vectors.
+    """
+
+    def __init__(self, vector_size: int = 64, model_name: str = "fake-model"):
+        self.vector_size = vector_size
+        self.model_name = model_name
+        self.document_calls: list[list[str]] = []
+        self.query_calls: list[str] = []
+        self.query_batch_calls: list[list[str]] = []
+
+    def _embed(self, text: str) -> list[float]:
+        vector = [0.0] * self.vector_size
+        for word in text.lower().split():
+            digest = hashlib.md5(word.encode("utf-8")).digest()
+            vector[int.from_bytes(digest[:4], "little") % self.vector_size] += 1.0
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return [value / norm for value in vector]
+
+    async def embed_documents(self, documents: list[str]) -> list[list[float]]:
+        self.document_calls.append(list(documents))
+        return [self._embed(document) for document in documents]
+
+    async def embed_query(self, query: str) -> list[float]:
+        self.query_calls.append(query)
+        return self._embed(query)
+
+    async def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        self.query_batch_calls.append(list(queries))
+        return [self._embed(query) for query in queries]
+
+    def get_vector_name(self) -> str:
+        return f"fake-{self.model_name}"
+
+    def get_vector_size(self) -> int:
+        return self.vector_size
+
+
+class FakeSparseEmbeddingProvider(SparseEmbeddingProvider):
+    """
+    Hashes every word of a text, including identifiers split at punctuation, into a sparse
+    term-frequency vector, like BM25 does before the IDF weighting applied by Qdrant.
+    """
+
+    def __init__(self, vocabulary_size: int = 2**20):
+        self.vocabulary_size = vocabulary_size
+        self.document_calls: list[list[str]] = []
+        self.query_calls: list[list[str]] = []
+
+    def _embed(self, text: str) -> models.SparseVector:
+        counts: dict[int, float] = {}
+        for word in re.findall(r"\w+", text.lower()):
+            digest = hashlib.md5(word.encode("utf-8")).digest()
+            index = int.from_bytes(digest[:4], "little") % self.vocabulary_size
+            counts[index] = counts.get(index, 0.0) + 1.0
+        return models.SparseVector(indices=list(counts), values=list(counts.values()))
+
+    async def embed_documents(self, documents: list[str]) -> list[models.SparseVector]:
+        self.document_calls.append(list(documents))
+        return [self._embed(document) for document in documents]
+
+    async def embed_queries(self, queries: list[str]) -> list[models.SparseVector]:
+        self.query_calls.append(list(queries))
+        return [self._embed(query) for query in queries]
+
+    def get_vector_name(self) -> str:
+        return "fake-sparse"
+
+    def get_modifier(self) -> models.Modifier | None:
+        return models.Modifier.IDF
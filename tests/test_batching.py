@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+from mcp_server_qdrant.embeddings.batching import BatchingEmbeddingProvider
+from mcp_server_qdrant.embeddings.cached import CachedEmbeddingProvider
+from mcp_server_qdrant.embeddings.factory import create_embedding_provider
+from mcp_server_qdrant.settings import EmbeddingProviderSettings
+from tests.fake_embeddings import FakeEmbeddingProvider
+
+
+class FailingEmbeddingProvider(FakeEmbeddingProvider):
+    async def embed_documents(self, documents: list[str]) -> list[list[float]]:
+        raise RuntimeError("embedding service unavailable")
+
+
+class HangingEmbeddingProvider(FakeEmbeddingProvider):
+    async def embed_documents(self, documents: list[str]) -> list[list[float]]:
+        await asyncio.Event().wait()
+        return []
+
+
+@pytest.mark.asyncio
+class TestBatchingEmbeddingProvider:
+    async def test_concurrent_queries_share_a_batch(self):
+        """Concurrent queries are embedded in one call and each caller gets its own vector."""
+        provider = FakeEmbeddingProvider()
+        batching = BatchingEmbeddingProvider(provider, max_batch_size=32, max_wait_ms=20)
+        queries = [f"query {i}" for i in range(5)]
+
+        results = await asyncio.gather(*(batching.embed_query(q) for q in queries))
+
+        assert provider.query_batch_calls == [queries]
+        assert results == [provider._embed(query) for query in queries]
+        assert batching.query_batcher.batch_size.count == 1
+        assert batching.query_batcher.batch_size.sum == 5
+
+    async def test_full_batch_is_flushed_immediately(self):
+        """Reaching the maximum batch size does not wait for the window to elapse."""
+        provider = FakeEmbeddingProvider()
+        batching = BatchingEmbeddingProvider(provider, max_batch_size=2, max_wait_ms=10_000)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                batching.embed_documents(["a", "b"]),
+                batching.embed_documents(["c"]),
+                batching.embed_documents(["d"]),
+            ),
+            timeout=1.0,
+        )
+
+        assert provider.document_calls == [["a", "b"], ["c", "d"]]
+        assert results[1] == [provider._embed("c")]
+
+    async def test_errors_reach_every_caller(self):
+        batching = BatchingEmbeddingProvider(
+            FailingEmbeddingProvider(), max_batch_size=8, max_wait_ms=5
+        )
+
+        results = await asyncio.gather(
+            batching.embed_documents(["a"]),
+            batching.embed_documents(["b"]),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def test_cancelled_batches_release_their_callers(self):
+        """Cancelling a running batch, e.g. on shutdown, cancels the callers waiting for it."""
+        batching = BatchingEmbeddingProvider(
+            HangingEmbeddingProvider(), max_batch_size=2, max_wait_ms=10_000
+        )
+        callers = asyncio.gather(
+            batching.embed_documents(["a"]),
+            batching.embed_documents(["b"]),
+            return_exceptions=True,
+        )
+        await asyncio.sleep(0.01)
+        for task in batching.document_batcher._tasks:
+            task.cancel()
+
+        results = await asyncio.wait_for(callers, timeout=1.0)
+
+        assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
+    async def test_histograms_are_recorded(self):
+        batching = BatchingEmbeddingProvider(FakeEmbeddingProvider(), max_wait_ms=1)
+
+        await batching.embed_query("query")
+
+        counts = {histogram.name: histogram.count for histogram in batching.histograms()}
+        assert counts["embedding_query_batch_size"] == 1
+        assert counts["embedding_query_queue_seconds"] == 1
+        assert counts["embedding_query_embed_seconds"] == 1
+        assert counts["embedding_document_batch_size"] == 0
+
+
+def test_factory_wraps_batching_inside_query_cache(monkeypatch):
+    monkeypatch.setenv("EMBEDDING_PROVIDER", "openai_compatible")
+    monkeypatch.setenv("EMBEDDING_BATCH_MAX_SIZE", "16")
+    monkeypatch.setenv("EMBEDDING_QUERY_CACHE_SIZE", "8")
+
+    provider = create_embedding_provider(EmbeddingProviderSettings())
+
+    assert isinstance(provider, CachedEmbeddingProvider)
+    assert isinstance(provider.provider, BatchingEmbeddingProvider)
+    assert provider.provider.query_batcher.max_batch_size == 16
+    assert provider.model_name == "sentence-transformers/all-MiniLM-L6-v2"
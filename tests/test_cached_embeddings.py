@@ -0,0 +1,98 @@
+import pytest
+
+from mcp_server_qdrant.embeddings.cached import CachedEmbeddingProvider
+from mcp_server_qdrant.embeddings.factory import create_embedding_provider
+from mcp_server_qdrant.embeddings.openai_compatible import OpenAICompatibleProvider
+from mcp_server_qdrant.embeddings.types import EmbeddingProviderType
+from mcp_server_qdrant.settings import EmbeddingProviderSettings
+from tests.fake_embeddings import FakeEmbeddingProvider
+
+
+@pytest.mark.asyncio
+class TestCachedEmbeddingProvider:
+    async def test_repeated_query_hits_cache(self):
+        """The wrapped provider is only called once for a repeated query."""
+        provider = FakeEmbeddingProvider()
+        cached = CachedEmbeddingProvider(provider, max_size=10)
+
+        first = await cached.embed_query("find me")
+        second = await cached.embed_query("find me")
+
+        assert first == second
+        assert provider.query_calls == ["find me"]
+        assert cached.cache_info() == {"hits": 1, "misses": 1, "size": 1, "max_size": 10}
+
+    async def test_lru_eviction(self):
+        """The least recently used query is evicted first."""
+        provider = FakeEmbeddingProvider()
+        cached = CachedEmbeddingProvider(provider, max_size=2)
+
+        await cached.embed_query("a")
+        await cached.embed_query("b")
+        await cached.embed_query("a")
+        await cached.embed_query("c")  # evicts "b"
+        await cached.embed_query("a")
+        await cached.embed_query("b")
+
+        assert provider.query_calls == ["a", "b", "c", "b"]
+
+    async def test_ttl_expiry(self, monkeypatch):
+        """Entries older than the TTL are embedded again."""
+        now = [100.0]
+        monkeypatch.setattr(
+            "mcp_server_qdrant.embeddings.cached.time.monotonic", lambda: now[0]
+        )
+        provider = FakeEmbeddingProvider()
+        cached = CachedEmbeddingProvider(provider, max_size=10, ttl=5.0)
+
+        await cached.embed_query("query")
+        now[0] += 4.0
+        await cached.embed_query("query")
+        now[0] += 2.0
+        await cached.embed_query("query")
+
+        assert provider.query_calls == ["query", "query"]
+
+    async def test_key_includes_model(self):
+        """Switching the wrapped model never returns vectors of the previous one."""
+        provider = FakeEmbeddingProvider(model_name="first")
+        cached = CachedEmbeddingProvider(provider)
+
+        await cached.embed_query("query")
+        provider.model_name = "second"
+        await cached.embed_query("query")
+
+        assert cached.misses == 2
+
+    async def test_documents_are_not_cached(self):
+        """Document embeddings are passed through to the wrapped provider."""
+        provider = FakeEmbeddingProvider()
+        cached = CachedEmbeddingProvider(provider)
+
+        await cached.embed_documents(["doc"])
+        await cached.embed_documents(["doc"])
+
+        assert provider.document_calls == [["doc"], ["doc"]]
+        assert cached.get_vector_name() == provider.get_vector_name()
+        assert cached.get_vector_size() == provider.get_vector_size()
+
+
+class TestFactoryQueryCache:
+    def test_disabled_by_default(self):
+        settings = EmbeddingProviderSettings(
+            EMBEDDING_PROVIDER=EmbeddingProviderType.OPENAI_COMPATIBLE
+        )
+        provider = create_embedding_provider(settings)
+        assert isinstance(provider, OpenAICompatibleProvider)
+
+    def test_enabled_from_env(self, monkeypatch):
+        monkeypatch.setenv("EMBEDDING_PROVIDER", "openai_compatible")
+        monkeypatch.setenv("EMBEDDING_QUERY_CACHE_SIZE", "128")
+        monkeypatch.setenv("EMBEDDING_QUERY_CACHE_TTL", "60")
+
+        provider = create_embedding_provider(EmbeddingProviderSettings())
+
+        assert isinstance(provider, CachedEmbeddingProvider)
+        assert isinstance(provider.provider, OpenAICompatibleProvider)
+        assert provider.max_size == 128
+        assert provider.ttl == 60.0
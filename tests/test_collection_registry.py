@@ -0,0 +1,186 @@
+import uuid
+
+import grpc
+import pytest
+from qdrant_client import models
+
+from mcp_server_qdrant.collection_registry import is_not_found_error
+from mcp_server_qdrant.qdrant import Entry, QdrantConnector
+from tests.fake_embeddings import FakeEmbeddingProvider
+
+
+class CallCounter:
+    """Counts the calls made to the methods of a Qdrant client."""
+
+    def __init__(self, client, monkeypatch):
+        self.calls: list[str] = []
+        for name in (
+            "collection_exists",
+            "get_collection",
+            "create_collection",
+            "query_points",
+            "upsert",
+        ):
+            original = getattr(client, name)
+
+            async def counted(*args, _name=name, _original=original, **kwargs):
+                self.calls.append(_name)
+                return await _original(*args, **kwargs)
+
+            monkeypatch.setattr(client, name, counted)
+
+
+@pytest.fixture
+def qdrant_connector():
+    return QdrantConnector(
+        qdrant_url=":memory:",
+        qdrant_api_key=None,
+        collection_name=f"test_collection_{uuid.uuid4().hex}",
+        embedding_provider=FakeEmbeddingProvider(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_is_a_single_request(qdrant_connector, monkeypatch):
+    """Once the collection is known, `search` and `store` do not check it again."""
+    await qdrant_connector.store(Entry(content="first entry"))
+    counter = CallCounter(qdrant_connector._client, monkeypatch)
+
+    await qdrant_connector.search("first")
+    await qdrant_connector.search("entry")
+    await qdrant_connector.store(Entry(content="second entry"))
+
+    assert counter.calls == ["query_points", "query_points", "upsert"]
+
+
+@pytest.mark.asyncio
+async def test_metadata_of_existing_collection(qdrant_connector):
+    """The vector configuration of collections created elsewhere is detected once."""
+    client = qdrant_connector._client
+    await client.create_collection(
+        "unnamed", vectors_config=models.VectorParams(size=64, distance=models.Distance.DOT)
+    )
+
+    metadata = await qdrant_connector._collections.get("unnamed")
+
+    assert metadata.exists
+    assert metadata.uses_unnamed_vectors
+    assert metadata.vector_params("ignored").distance == models.Distance.DOT
+    assert await qdrant_connector._uses_unnamed_vectors("unnamed")
+
+
+@pytest.mark.asyncio
+async def test_removed_collection_is_refreshed(qdrant_connector):
+    """A collection deleted behind the connector's back is detected and recreated."""
+    await qdrant_connector.store(Entry(content="before removal"))
+    await qdrant_connector._client.delete_collection(
+        qdrant_connector._default_collection_name
+    )
+
+    assert await qdrant_connector.search("before removal") == []
+
+    await qdrant_connector.store(Entry(content="after removal"))
+    results = await qdrant_connector.search("after removal")
+    assert [result.content for result in results] == ["after removal"]
+
+
+@pytest.mark.asyncio
+async def test_ttl_expiry_refetches(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(
+        "mcp_server_qdrant.collection_registry.time.monotonic", lambda: now[0]
+    )
+    connector = QdrantConnector(
+        qdrant_url=":memory:",
+        qdrant_api_key=None,
+        collection_name="ttl_collection",
+        embedding_provider=FakeEmbeddingProvider(),
+        collection_cache_ttl=10.0,
+    )
+    await connector._client.create_collection(
+        "ttl_collection",
+        vectors_config={
+            "fake-fake-model": models.VectorParams(size=64, distance=models.Distance.COSINE)
+        },
+    )
+    assert (await connector._collections.get("ttl_collection")).exists
+    counter = CallCounter(connector._client, monkeypatch)
+
+    now[0] = 5.0
+    assert (await connector._collections.get("ttl_collection")).exists
+    assert counter.calls == []
+    now[0] = 11.0
+    assert (await connector._collections.get("ttl_collection")).exists
+    assert counter.calls == ["get_collection"]
+
+
+@pytest.mark.asyncio
+async def test_missing_collections_are_not_cached(qdrant_connector, make_connector):
+    """A collection created after a lookup found it missing is seen by the next lookup."""
+    assert await qdrant_connector.search("hello") == []
+    assert await qdrant_connector.search_many(["hello"]) == [[]]
+
+    # Created by another connector, e.g. the one of the indexer
+    other = make_connector()
+    other._client = qdrant_connector._client
+    other._default_collection_name = qdrant_connector._default_collection_name
+    await other.store(Entry(content="hello world"))
+
+    assert [entry.content for entry in await qdrant_connector.search("hello")] == ["hello world"]
+    assert len((await qdrant_connector.search_many(["hello"]))[0]) == 1
+
+
+@pytest.mark.asyncio
+async def test_ttl_expiry_keeps_payload_format(monkeypatch):
+    """The payload format is detected once, not again whenever the cached metadata expires."""
+    now = [0.0]
+    monkeypatch.setattr(
+        "mcp_server_qdrant.collection_registry.time.monotonic", lambda: now[0]
+    )
+    connector = QdrantConnector(
+        qdrant_url=":memory:",
+        qdrant_api_key=None,
+        collection_name="ttl_collection",
+        embedding_provider=FakeEmbeddingProvider(),
+        collection_cache_ttl=10.0,
+    )
+    await connector.store(Entry(content="first entry"))
+    connector._collections.invalidate()
+    await connector.search("first")
+    counter = CallCounter(connector._client, monkeypatch)
+    monkeypatch.setattr(connector._client, "scroll", None)
+
+    now[0] = 11.0
+    results = await connector.search("first")
+
+    assert counter.calls == ["get_collection", "query_points"]
+    assert [result.content for result in results] == ["first entry"]
+    assert (await connector._collections.get("ttl_collection")).payload_format == "document"
+
+
+def grpc_error(code: grpc.StatusCode) -> grpc.aio.AioRpcError:
+    return grpc.aio.AioRpcError(code, grpc.aio.Metadata(), grpc.aio.Metadata(), details="error")
+
+
+def test_grpc_not_found_is_recognised():
+    assert is_not_found_error(grpc_error(grpc.StatusCode.NOT_FOUND))
+    assert not is_not_found_error(grpc_error(grpc.StatusCode.UNAVAILABLE))
+
+
+@pytest.mark.asyncio
+async def test_missing_collection_over_grpc(qdrant_connector, monkeypatch):
+    """With gRPC, a missing collection is reported by a NOT_FOUND status, not a 404."""
+    client = qdrant_connector._client
+    get_collection = client.get_collection
+
+    async def grpc_get_collection(collection_name, *args, **kwargs):
+        if not await client.collection_exists(collection_name):
+            raise grpc_error(grpc.StatusCode.NOT_FOUND)
+        return await get_collection(collection_name, *args, **kwargs)
+
+    monkeypatch.setattr(client, "get_collection", grpc_get_collection)
+
+    assert await qdrant_connector.search("hello") == []
+    assert await qdrant_connector.search_many(["hello"]) == [[]]
+    await qdrant_connector.store(Entry(content="hello world"))
+    assert [entry.content for entry in await qdrant_connector.search("hello")] == ["hello world"]
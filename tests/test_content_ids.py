@@ -0,0 +1,146 @@
+import uuid
+
+import pytest
+
+from mcp_server_qdrant.entry import content_point_id
+from mcp_server_qdrant.qdrant import Entry, QdrantConnector
+from mcp_server_qdrant.settings import QdrantSettings
+
+
+async def count_points(connector: QdrantConnector) -> int:
+    result = await connector._client.count(connector._default_collection_name)
+    return result.count
+
+
+def chunk(content: str, file_path: str = "src/a.py", start_line: int = 1, **metadata) -> Entry:
+    return Entry(
+        content=content,
+        metadata={"filePath": file_path, "startLine": start_line, **metadata},
+    )
+
+
+def test_content_point_id_is_deterministic():
+    keys = ["filePath", "startLine"]
+    entry = chunk("def f(): pass")
+
+    assert content_point_id(entry, keys) == content_point_id(chunk("def f(): pass"), keys)
+    assert uuid.UUID(content_point_id(entry, keys))
+    # Only the selected keys take part in the ID
+    assert content_point_id(entry, keys) == content_point_id(
+        chunk("def f(): pass", endLine=3), keys
+    )
+    assert content_point_id(entry, keys) != content_point_id(chunk("def g(): pass"), keys)
+    assert content_point_id(entry, keys) != content_point_id(chunk("def f(): pass", "src/b.py"), keys)
+    assert content_point_id(entry, keys) != content_point_id(
+        chunk("def f(): pass", start_line=10), keys
+    )
+    # Missing keys are ignored
+    assert content_point_id(Entry(content="x"), keys) == content_point_id(Entry(content="x"))
+
+
+@pytest.mark.asyncio
+async def test_random_ids_duplicate_entries(make_connector):
+    connector = make_connector()
+
+    await connector.store(chunk("def f(): pass"))
+    await connector.store(chunk("def f(): pass"))
+
+    assert await count_points(connector) == 2
+
+
+@pytest.mark.asyncio
+async def test_content_ids_make_stores_idempotent(make_connector, embedding_provider):
+    connector = make_connector(
+        point_id_mode="content",
+        point_id_metadata_keys=["filePath", "startLine"],
+    )
+    entries = [chunk(f"def f{i}(): pass", start_line=i) for i in range(5)]
+
+    await connector.store_many(entries, batch_size=2)
+    await connector.store_many(entries, batch_size=2)
+    await connector.store(entries[0])
+
+    assert await count_points(connector) == 5
+    # Without skipping, every store embeds again
+    assert sum(len(call) for call in embedding_provider.document_calls) == 11
+
+
+@pytest.mark.asyncio
+async def test_same_content_in_a_batch_is_upserted_once(make_connector, embedding_provider):
+    connector = make_connector(point_id_mode="content")
+
+    stored = await connector.store_many(
+        [Entry(content="same", metadata={"version": 1}), Entry(content="same", metadata={"version": 2})]
+    )
+
+    assert stored == 1
+    assert embedding_provider.document_calls == [["same"]]
+    entries = await connector.search("same")
+    assert [entry.metadata for entry in entries] == [{"version": 2}]
+
+
+@pytest.mark.asyncio
+async def test_skip_existing_does_not_embed_unchanged_entries(make_connector, embedding_provider):
+    connector = make_connector(
+        point_id_mode="content",
+        point_id_metadata_keys=["filePath", "startLine"],
+        skip_existing=True,
+    )
+    entries = [chunk(f"def f{i}(): pass", start_line=i) for i in range(4)]
+    assert await connector.store_many(entries) == 4
+    embedding_provider.document_calls.clear()
+
+    changed = chunk("def f4(): pass", start_line=4)
+    # Only the written entries are counted
+    assert await connector.store_many([*entries, changed]) == 1
+    await connector.store(entries[0])
+
+    assert embedding_provider.document_calls == [["def f4(): pass"]]
+    assert await count_points(connector) == 5
+    assert 'mcp_qdrant_store_skipped_total 5' in connector.metrics.render()
+
+
+@pytest.mark.asyncio
+async def test_skip_existing_updates_changed_metadata(make_connector, embedding_provider):
+    connector = make_connector(
+        point_id_mode="content",
+        point_id_metadata_keys=["filePath", "startLine"],
+        skip_existing=True,
+    )
+    await connector.store(chunk("def f(): pass", endLine=1))
+    embedding_provider.document_calls.clear()
+
+    await connector.store(chunk("def f(): pass", endLine=2))
+
+    assert embedding_provider.document_calls == []
+    entries = await connector.search("def f(): pass")
+    assert len(entries) == 1
+    assert entries[0].metadata == {"filePath": "src/a.py", "startLine": 1, "endLine": 2}
+
+
+@pytest.mark.asyncio
+async def test_skip_existing_invalidates_the_search_cache(make_connector):
+    connector = make_connector(
+        point_id_mode="content", skip_existing=True, search_cache_size=16
+    )
+    await connector.store(Entry(content="hello world", metadata={"tag": "old"}))
+    assert (await connector.search("hello world"))[0].metadata == {"tag": "old"}
+
+    # Same content ID, new metadata: the payload is overwritten without embedding
+    await connector.store(Entry(content="hello world", metadata={"tag": "new"}))
+
+    assert (await connector.search("hello world"))[0].metadata == {"tag": "new"}
+
+
+def test_skip_existing_requires_content_ids(make_connector, monkeypatch):
+    with pytest.raises(ValueError):
+        make_connector(skip_existing=True)
+
+    monkeypatch.setenv("QDRANT_SKIP_EXISTING", "true")
+    with pytest.raises(ValueError):
+        QdrantSettings()
+    monkeypatch.setenv("QDRANT_POINT_ID_MODE", "content")
+    monkeypatch.setenv("QDRANT_POINT_ID_METADATA_KEYS", '["filePath"]')
+    settings = QdrantSettings()
+    assert settings.skip_existing
+    assert settings.point_id_metadata_keys == ["filePath"]
@@ -0,0 +1,176 @@
+import uuid
+
+import pytest
+from fastmcp import Client
+from fastmcp.exceptions import ToolError
+from qdrant_client import models
+
+from mcp_server_qdrant.mcp_server import QdrantMCPServer
+from mcp_server_qdrant.payload_formats import CODE_CHUNK_FORMAT
+from mcp_server_qdrant.qdrant import Entry, QdrantConnector
+from mcp_server_qdrant.settings import FilterableField, QdrantSettings, ToolSettings
+from tests.fake_embeddings import FakeEmbeddingProvider
+
+ENTRIES = [
+    Entry(content=f"note {i}", metadata={"topic": "old" if i < 3 else "new", "n": i})
+    for i in range(5)
+]
+
+
+def topic_filter(topic: str) -> models.Filter:
+    return models.Filter(
+        must=[models.FieldCondition(key="metadata.topic", match=models.MatchValue(value=topic))]
+    )
+
+
+@pytest.fixture
+def connector():
+    return QdrantConnector(
+        qdrant_url=":memory:",
+        qdrant_api_key=None,
+        collection_name=f"test_collection_{uuid.uuid4().hex}",
+        embedding_provider=FakeEmbeddingProvider(),
+        search_cache_size=16,
+    )
+
+
+async def stored(connector: QdrantConnector) -> dict[str, dict]:
+    points, _ = await connector.client.scroll(
+        connector._default_collection_name, limit=100, with_payload=True
+    )
+    return {point.payload["document"]: point.payload["metadata"] for point in points}
+
+
+@pytest.mark.asyncio
+async def test_delete_by_filter_and_ids(connector):
+    await connector.store_many(ENTRIES)
+    # Cached, and invalidated by the deletions
+    assert len(await connector.search("note", limit=10)) == 5
+
+    status = await connector.delete(topic_filter("old"), wait=False)
+    assert status in (models.UpdateStatus.ACKNOWLEDGED, models.UpdateStatus.COMPLETED)
+    assert set(await stored(connector)) == {"note 3", "note 4"}
+
+    entries = await connector.search("note 3", limit=10)
+    assert {entry.content for entry in entries} == {"note 3", "note 4"}
+    by_content = {entry.content: entry.id for entry in entries}
+    # The IDs narrow the filter down
+    await connector.delete(topic_filter("old"), point_ids=[by_content["note 3"]])
+    assert set(await stored(connector)) == {"note 3", "note 4"}
+    await connector.delete(point_ids=[by_content["note 3"]])
+    assert set(await stored(connector)) == {"note 4"}
+    assert [entry.content for entry in await connector.search("note", limit=10)] == ["note 4"]
+
+
+@pytest.mark.asyncio
+async def test_selecting_every_point_is_refused(connector):
+    await connector.store_many(ENTRIES)
+
+    with pytest.raises(ValueError):
+        await connector.delete()
+    with pytest.raises(ValueError):
+        await connector.delete(models.Filter(must=[]))
+    with pytest.raises(ValueError):
+        await connector.update_metadata({"topic": "any"})
+    assert len(await stored(connector)) == 5
+
+
+@pytest.mark.asyncio
+async def test_missing_collection_is_a_no_op(connector):
+    assert await connector.delete(topic_filter("old")) is None
+    assert await connector.update_metadata({"topic": "x"}, point_ids=[1]) is None
+
+
+@pytest.mark.asyncio
+async def test_update_metadata_keeps_other_fields(connector):
+    await connector.store_many(ENTRIES + [Entry(content="bare")])
+    bare_id = (await connector.search("bare", limit=1))[0].id
+
+    await connector.update_metadata({"topic": "archived", "reviewed": True}, topic_filter("old"))
+    await connector.update_metadata({"reviewed": False}, point_ids=[bare_id])
+
+    metadata = await stored(connector)
+    assert metadata["note 0"] == {"topic": "archived", "n": 0, "reviewed": True}
+    assert metadata["note 3"] == {"topic": "new", "n": 3}
+    assert metadata["bare"] == {"reviewed": False}
+    entries = await connector.search("note 0", limit=10, query_filter=topic_filter("archived"))
+    assert len(entries) == 3
+
+
+@pytest.mark.asyncio
+async def test_update_metadata_of_top_level_fields():
+    connector = QdrantConnector(
+        qdrant_url=":memory:",
+        qdrant_api_key=None,
+        collection_name=f"test_collection_{uuid.uuid4().hex}",
+        embedding_provider=FakeEmbeddingProvider(),
+        store_payload_format=CODE_CHUNK_FORMAT,
+    )
+    await connector.store(Entry(content="x = 1", metadata={"filePath": "a.py"}))
+    point_id = (await connector.search("x = 1", limit=1))[0].id
+
+    await connector.update_metadata({"owner": "me"}, point_ids=[point_id])
+
+    points, _ = await connector.client.scroll(connector._default_collection_name)
+    assert points[0].payload == {"codeChunk": "x = 1", "filePath": "a.py", "owner": "me"}
+    with pytest.raises(ValueError):
+        await connector.update_metadata({"codeChunk": "y = 2"}, point_ids=[point_id])
+
+
+@pytest.mark.asyncio
+async def test_delete_and_update_tools():
+    server = QdrantMCPServer(
+        tool_settings=ToolSettings(),
+        qdrant_settings=QdrantSettings(
+            QDRANT_URL=":memory:",
+            COLLECTION_NAME=f"test_{uuid.uuid4().hex}",
+            filterable_fields=[
+                FilterableField(
+                    name="topic", description="The topic", field_type="keyword", condition="=="
+                )
+            ],
+        ),
+        embedding_provider=FakeEmbeddingProvider(),
+    )
+    connector = server.qdrant_connector
+    await connector.store_many(ENTRIES)
+
+    async with Client(server) as client:
+        tools = {tool.name: tool for tool in await client.list_tools()}
+        assert "topic" in tools["qdrant-delete"].input_schema["properties"]
+        assert "collection_name" not in tools["qdrant-delete"].input_schema["properties"]
+
+        result = await client.call_tool("qdrant-find", {"query": "note 4"})
+        point_id = next(
+            line.removeprefix("ID: ")
+            for line in result.content[0].text.splitlines()
+            if line.startswith("ID: ")
+        )
+
+        result = await client.call_tool(
+            "qdrant-update-metadata", {"metadata": {"pinned": True}, "point_ids": [point_id]}
+        )
+        assert result.content[0].text.startswith("Updated")
+        result = await client.call_tool("qdrant-delete", {"topic": "old", "wait": False})
+        assert result.content[0].text.startswith("Deleted")
+        with pytest.raises(ToolError):
+            await client.call_tool("qdrant-delete", {})
+
+    metadata = await stored(connector)
+    assert set(metadata) == {"note 3", "note 4"}
+    assert metadata["note 4"]["pinned"] is True
+
+
+@pytest.mark.asyncio
+async def test_read_only_server_has_no_delete_tools():
+    server = QdrantMCPServer(
+        tool_settings=ToolSettings(),
+        qdrant_settings=QdrantSettings(QDRANT_URL=":memory:", QDRANT_READ_ONLY=True),
+        embedding_provider=FakeEmbeddingProvider(),
+    )
+
+    async with Client(server) as client:
+        names = {tool.name for tool in await client.list_tools()}
+
+    assert "qdrant-delete" not in names
+    assert "qdrant-update-metadata" not in names
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from mcp_server_qdrant.embeddings.disk_cache import (
+    DiskCachedEmbeddingProvider,
+    EmbeddingDiskCache,
+    content_hash,
+)
+from tests.fake_embeddings import FakeEmbeddingProvider
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = EmbeddingDiskCache(str(tmp_path / "cache" / "embeddings.sqlite"))
+    yield cache
+    cache.close()
+
+
+class TestEmbeddingDiskCache:
+    def test_round_trip_as_float32(self, cache):
+        """Vectors are stored as float32 blobs and read back in the same order."""
+        key = content_hash("text")
+        cache.put_many("model", {key: [0.5, -1.25, 3.0]})
+
+        found = cache.get_many("model", [key])
+        assert found[key].dtype == np.float32
+        assert found[key].tolist() == [0.5, -1.25, 3.0]
+        assert cache.stats()["size_bytes"] == 3 * 4
+
+    def test_model_is_part_of_the_key(self, cache):
+        key = content_hash("text")
+        cache.put_many("model-a", {key: [1.0]})
+
+        assert cache.get_many("model-b", [key]) == {}
+
+    def test_size_based_eviction(self, tmp_path):
+        """The least recently used vectors are evicted once the size limit is exceeded."""
+        cache = EmbeddingDiskCache(str(tmp_path / "cache.sqlite"), max_size_bytes=2 * 16)
+        first, second, third = (content_hash(text) for text in ("a", "b", "c"))
+
+        cache.put_many("model", {first: [1.0] * 4})
+        cache.put_many("model", {second: [2.0] * 4})
+        cache.get_many("model", [first])  # first is now more recent than second
+        cache.put_many("model", {third: [3.0] * 4})
+
+        assert set(cache.get_many("model", [first, second, third])) == {first, third}
+        cache.close()
+
+    def test_prune_and_persistence(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        cache = EmbeddingDiskCache(path)
+        cache.put_many("model", {content_hash(str(i)): [float(i)] * 4 for i in range(10)})
+        cache.close()
+
+        reopened = EmbeddingDiskCache(path)
+        assert reopened.stats()["count"] == 10
+        assert reopened.prune(max_size_bytes=3 * 16) == 7
+        assert reopened.stats() == {
+            "count": 3,
+            "size_bytes": 3 * 16,
+            "max_size_bytes": reopened.max_size_bytes,
+        }
+        reopened.close()
+
+
+@pytest.mark.asyncio
+class TestDiskCachedEmbeddingProvider:
+    async def test_only_misses_are_embedded(self, cache):
+        """Cached documents are spliced back in order with freshly embedded ones."""
+        provider = FakeEmbeddingProvider()
+        cached_provider = DiskCachedEmbeddingProvider(provider, cache)
+
+        first = await cached_provider.embed_documents(["alpha", "beta"])
+        second = await cached_provider.embed_documents(["gamma", "alpha", "gamma", "beta"])
+
+        assert provider.document_calls == [["alpha", "beta"], ["gamma"]]
+        expected = await provider.embed_documents(["gamma", "alpha", "gamma", "beta"])
+        np.testing.assert_allclose(second, expected, rtol=1e-6)
+        np.testing.assert_allclose(first, [expected[1], expected[3]], rtol=1e-6)
+        assert (cached_provider.hits, cached_provider.misses) == (3, 3)
@@ -61,3 +61,32 @@ class TestFastEmbedProviderIntegration:
         # Check that the vector name follows the expected format
         assert vector_name.startswith("fast-")
         assert "minilm" in vector_name.lower()
+
+    async def test_dedicated_thread_pool(self):
+        """Inference runs in the provider's own sized executor."""
+        provider = FastEmbedProvider(
+            "sentence-transformers/all-MiniLM-L6-v2", threads=1, executor_workers=3
+        )
+        assert provider._executor._max_workers == 3
+
+        embeddings = await provider.embed_queries(["first query", "second query"])
+
+        assert len(embeddings) == 2
+        assert len(embeddings[0]) == provider.get_vector_size()
+        provider.close()
+
+    async def test_process_pool(self):
+        """The process pool returns the same vectors as in-process inference."""
+        provider = FastEmbedProvider(
+            "sentence-transformers/all-MiniLM-L6-v2",
+            executor_workers=1,
+            executor_type="process",
+        )
+        reference = FastEmbedProvider("sentence-transformers/all-MiniLM-L6-v2")
+
+        embedding = await provider.embed_query("This is a test query.")
+        expected = await reference.embed_query("This is a test query.")
+
+        np.testing.assert_array_almost_equal(np.array(embedding), np.array(expected))
+        provider.close()
+        reference.close()
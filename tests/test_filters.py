@@ -0,0 +1,119 @@
+import pytest
+from qdrant_client import models
+
+from mcp_server_qdrant.common.filters import FilterBuilder, compile_field, make_filter
+from mcp_server_qdrant.common.wrap_filters import wrap_filters
+from mcp_server_qdrant.settings import FilterableField
+
+FIELDS = {
+    "color": FilterableField(
+        name="color", description="Color", field_type="keyword", condition="=="
+    ),
+    "excluded": FilterableField(
+        name="excluded", description="Excluded", field_type="keyword", condition="!="
+    ),
+    "tags": FilterableField(
+        name="tags", description="Tags", field_type="keyword", condition="any"
+    ),
+    "min_size": FilterableField(
+        name="min_size", description="Size", field_type="float", condition=">="
+    ),
+    "owner": FilterableField(
+        name="owner", description="Owner", field_type="keyword", condition="==", required=True
+    ),
+}
+
+
+def test_build_filter():
+    builder = FilterBuilder(FIELDS)
+
+    query_filter = builder.build(
+        {"color": "red", "excluded": "blue", "tags": ["a", "b"], "min_size": 1.5, "owner": "me"}
+    )
+
+    assert query_filter == models.Filter(
+        must=[
+            models.FieldCondition(key="metadata.color", match=models.MatchValue(value="red")),
+            models.FieldCondition(key="metadata.tags", match=models.MatchAny(any=["a", "b"])),
+            models.FieldCondition(key="metadata.min_size", range=models.Range(gte=1.5)),
+            models.FieldCondition(key="metadata.owner", match=models.MatchValue(value="me")),
+        ],
+        must_not=[
+            models.FieldCondition(key="metadata.excluded", match=models.MatchValue(value="blue")),
+        ],
+    )
+    assert make_filter(FIELDS, {"color": "red", "owner": "me"}) == builder.build(
+        {"color": "red", "owner": "me"}
+    ).model_dump()
+
+
+def test_build_filter_without_values():
+    builder = FilterBuilder(FIELDS)
+
+    assert builder.build({"color": None}) is None
+
+
+def test_identical_values_are_memoized():
+    builder = FilterBuilder(FIELDS)
+
+    first = builder.build({"tags": ["a", "b"], "owner": "me"})
+    second = builder.build({"tags": ["a", "b"], "owner": "me"})
+    other = builder.build({"tags": ["a", "c"], "owner": "me"})
+
+    assert first is second
+    assert other is not first
+    assert builder.cache_info().hits == 1
+
+
+def test_invalid_values():
+    builder = FilterBuilder(FIELDS)
+
+    with pytest.raises(ValueError, match="not a filterable field"):
+        builder.build({"unknown": 1})
+    with pytest.raises(ValueError, match="is required"):
+        builder.build({"owner": None})
+
+
+def test_invalid_fields_fail_at_compile_time():
+    with pytest.raises(ValueError, match="Only range comparisons"):
+        compile_field(
+            FilterableField(name="f", description="", field_type="float", condition="==")
+        )
+    with pytest.raises(ValueError, match="Invalid condition any for boolean field"):
+        FilterBuilder(
+            {"b": FilterableField(name="b", description="", field_type="boolean", condition="any")}
+        )
+
+
+@pytest.mark.asyncio
+async def test_wrapped_function_gets_filter_object():
+    received = {}
+
+    async def find(query: str, query_filter: dict | None = None) -> str:
+        received["query_filter"] = query_filter
+        return query
+
+    wrapped = wrap_filters(find, FIELDS)
+    await wrapped(query="dress", color="red", owner="me")
+
+    assert isinstance(received["query_filter"], models.Filter)
+    assert [condition.key for condition in received["query_filter"].must] == [
+        "metadata.color",
+        "metadata.owner",
+    ]
+
+
+def test_except_condition():
+    builder = FilterBuilder(
+        {
+            "skip": FilterableField(
+                name="skip", description="Skip", field_type="integer", condition="except"
+            )
+        }
+    )
+
+    query_filter = builder.build({"skip": [1, 2]})
+
+    assert query_filter.must == [
+        models.FieldCondition(key="metadata.skip", match=models.MatchExcept(**{"except": [1, 2]}))
+    ]
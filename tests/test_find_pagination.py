@@ -0,0 +1,73 @@
+import uuid
+
+import pytest
+from fastmcp import Client
+
+from mcp_server_qdrant.mcp_server import QdrantMCPServer
+from mcp_server_qdrant.qdrant import Entry, QdrantConnector
+from mcp_server_qdrant.settings import QdrantSettings, ToolSettings
+from tests.fake_embeddings import FakeEmbeddingProvider, FakeSparseEmbeddingProvider
+
+ENTRIES = [Entry(content=f"hello number {i}") for i in range(5)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("hybrid", [False, True])
+async def test_search_offset(hybrid):
+    """Pages of results are disjoint and cover all the matching entries."""
+    connector = QdrantConnector(
+        qdrant_url=":memory:",
+        qdrant_api_key=None,
+        collection_name=f"test_collection_{uuid.uuid4().hex}",
+        embedding_provider=FakeEmbeddingProvider(),
+        sparse_embedding_provider=FakeSparseEmbeddingProvider() if hybrid else None,
+        hybrid_prefetch_limit=2,
+    )
+    await connector.store_many(ENTRIES)
+
+    pages = [
+        await connector.search("hello", limit=2, offset=offset) for offset in (0, 2, 4)
+    ]
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    contents = [entry.content for page in pages for entry in page]
+    assert sorted(contents) == sorted(entry.content for entry in ENTRIES)
+
+
+async def call_find(separate_entries: bool, offset: int) -> list[str]:
+    server = QdrantMCPServer(
+        tool_settings=ToolSettings(TOOL_FIND_SEPARATE_ENTRIES=separate_entries),
+        qdrant_settings=QdrantSettings(
+            QDRANT_URL=":memory:",
+            COLLECTION_NAME=f"test_{uuid.uuid4().hex}",
+            QDRANT_SEARCH_LIMIT=2,
+        ),
+        embedding_provider=FakeEmbeddingProvider(),
+    )
+    await server.qdrant_connector.store_many(ENTRIES)
+    async with Client(server) as client:
+        result = await client.call_tool("qdrant-find", {"query": "hello", "offset": offset})
+    return [content.text for content in result.content]
+
+
+@pytest.mark.asyncio
+async def test_find_tool_pages():
+    """The find tool tells the offset of the next page, until the last one."""
+    first_page = await call_find(separate_entries=False, offset=0)
+    last_page = await call_find(separate_entries=False, offset=4)
+
+    assert len(first_page) == 2
+    assert first_page[0].count("Code Chunk:") == 2
+    assert "offset=2" in first_page[1]
+    assert len(last_page) == 1
+    assert last_page[0].count("Code Chunk:") == 1
+
+
+@pytest.mark.asyncio
+async def test_find_tool_separate_entries():
+    """Entries can be returned as separate content items after a header."""
+    contents = await call_find(separate_entries=True, offset=2)
+
+    assert contents[0] == "Results for the query 'hello':"
+    assert all(text.count("Code Chunk:") == 1 for text in contents[1:3])
+    assert "offset=4" in contents[3]
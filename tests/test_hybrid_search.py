@@ -0,0 +1,100 @@
+import pytest
+
+from mcp_server_qdrant.qdrant import Entry
+from tests.fake_embeddings import FakeEmbeddingProvider, FakeSparseEmbeddingProvider
+
+
+class ConstantEmbeddingProvider(FakeEmbeddingProvider):
+    """A dense model that cannot tell texts apart, so only the sparse vector ranks them."""
+
+    def _embed(self, text: str) -> list[float]:
+        return [1.0] + [0.0] * (self.vector_size - 1)
+
+
+CHUNKS = [
+    "def parse_payload(point): return point.payload",
+    "def make_indexes(fields): return {}",
+    "class CollectionRegistry: pass",
+    "async def store_many(entries): pass",
+]
+
+
+@pytest.mark.asyncio
+async def test_collection_gets_sparse_vector(make_connector):
+    """New collections are created with the sparse vector and its modifier."""
+    connector = make_connector(sparse_embedding_provider=FakeSparseEmbeddingProvider())
+    await connector.store(Entry(content="hello world"))
+
+    info = await connector._client.get_collection(connector._default_collection_name)
+    assert "fake-sparse" in info.config.params.sparse_vectors
+    points, _ = await connector._client.scroll(
+        connector._default_collection_name, with_vectors=True
+    )
+    assert set(points[0].vector) == {"fake-fake-model", "fake-sparse"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fusion", ["rrf", "dbsf"])
+async def test_hybrid_search_finds_exact_identifiers(make_connector, fusion):
+    """Identifiers missed by the dense model are found through the sparse vector."""
+    sparse_provider = FakeSparseEmbeddingProvider()
+    connector = make_connector(
+        embedding_provider=ConstantEmbeddingProvider(),
+        sparse_embedding_provider=sparse_provider,
+        hybrid_fusion=fusion,
+    )
+    await connector.store_many([Entry(content=chunk) for chunk in CHUNKS])
+
+    entries = await connector.search("make_indexes", limit=1)
+    results = await connector.search_many(["CollectionRegistry", "store_many"], limit=1)
+
+    assert [entry.content for entry in entries] == [CHUNKS[1]]
+    assert [[entry.content for entry in group] for group in results] == [
+        [CHUNKS[2]],
+        [CHUNKS[3]],
+    ]
+    assert sparse_provider.document_calls == [CHUNKS]
+
+
+@pytest.mark.asyncio
+async def test_search_uses_single_fused_request(make_connector, monkeypatch):
+    """Hybrid search prefetches both vectors and fuses them in one query."""
+    connector = make_connector(sparse_embedding_provider=FakeSparseEmbeddingProvider())
+    await connector.store(Entry(content="hello world"))
+
+    calls = []
+    query_points = connector._client.query_points
+
+    async def recording_query_points(*args, **kwargs):
+        calls.append(kwargs)
+        return await query_points(*args, **kwargs)
+
+    monkeypatch.setattr(connector._client, "query_points", recording_query_points)
+    await connector.search("hello", limit=5)
+
+    assert len(calls) == 1
+    assert [prefetch.using for prefetch in calls[0]["prefetch"]] == [
+        "fake-fake-model",
+        "fake-sparse",
+    ]
+    assert all(prefetch.limit == 20 for prefetch in calls[0]["prefetch"])
+
+
+@pytest.mark.asyncio
+async def test_collection_without_sparse_vector_uses_dense_search(make_connector):
+    """Collections created before hybrid search was enabled keep working with dense vectors."""
+    dense_connector = make_connector()
+    await dense_connector.store(Entry(content="hello world"))
+
+    sparse_provider = FakeSparseEmbeddingProvider()
+    hybrid_connector = make_connector(sparse_embedding_provider=sparse_provider)
+    hybrid_connector._client = dense_connector._client
+    hybrid_connector._collections = dense_connector._collections
+    hybrid_connector._default_collection_name = dense_connector._default_collection_name
+
+    await hybrid_connector.store(Entry(content="hello again"))
+    entries = await hybrid_connector.search("hello")
+
+    assert len(entries) == 2
+    assert sparse_provider.document_calls == []
+    assert sparse_provider.query_calls == []
@@ -0,0 +1,188 @@
+import json
+import os
+
+import pytest
+
+from mcp_server_qdrant.indexer import (
+    DEFAULT_MANIFEST_NAME,
+    CodebaseIndexer,
+    chunk_lines,
+    walk_repository,
+)
+from mcp_server_qdrant.qdrant import QdrantConnector
+from tests.conftest import write
+
+
+def numbered_lines(prefix: str, count: int) -> str:
+    return "".join(f"{prefix} line {i}\n" for i in range(1, count + 1))
+
+
+async def indexed_chunks(connector: QdrantConnector) -> dict[tuple[str, int], dict]:
+    points, _ = await connector._client.scroll(
+        connector._default_collection_name, limit=1000, with_payload=True
+    )
+    return {(point.payload["filePath"], point.payload["startLine"]): point.payload for point in points}
+
+
+def embedded_texts(embedding_provider) -> list[str]:
+    return [text for call in embedding_provider.document_calls for text in call]
+
+
+def test_chunk_lines():
+    text = numbered_lines("a", 10)
+
+    chunks = chunk_lines(text, 4, overlap=1)
+
+    assert [(start, end) for start, end, _ in chunks] == [(1, 4), (4, 7), (7, 10)]
+    assert chunks[0][2] == "a line 1\na line 2\na line 3\na line 4\n"
+    assert chunk_lines("\n\n  \n", 4) == []
+    assert chunk_lines("", 4) == []
+    with pytest.raises(ValueError):
+        chunk_lines(text, 4, overlap=4)
+
+
+def test_walk_repository_skips_hidden_excluded_and_large_files(tmp_path):
+    write(tmp_path, "src/app.py", "x = 1\n")
+    write(tmp_path, "src/nested/util.ts", "let x = 1\n")
+    write(tmp_path, "README.md", "# Readme\n")
+    write(tmp_path, "image.png", "not text")
+    write(tmp_path, ".env", "SECRET=1\n")
+    write(tmp_path, ".git/config", "[core]\n")
+    write(tmp_path, "node_modules/lib/index.js", "module.exports = 1\n")
+    write(tmp_path, "src/huge.py", "x = 1\n" * 1000)
+
+    paths = walk_repository(
+        tmp_path,
+        extensions=[".py", ".ts", ".md", ".js"],
+        exclude_dirs=["node_modules"],
+        max_file_size=1000,
+    )
+
+    assert paths == ["README.md", "src/app.py", "src/nested/util.ts"]
+
+
+@pytest.mark.asyncio
+async def test_index_writes_code_chunk_payloads(tmp_path, connector):
+    write(tmp_path, "src/app.py", numbered_lines("app", 5))
+    indexer = CodebaseIndexer(connector, tmp_path, chunk_size=3, chunk_overlap=0)
+
+    stats = await indexer.index()
+
+    assert stats.files_indexed == 1
+    assert stats.chunks == 2
+    chunks = await indexed_chunks(connector)
+    payload = chunks[("src/app.py", 1)]
+    assert payload["codeChunk"] == "app line 1\napp line 2\napp line 3\n"
+    assert payload["endLine"] == 3
+    assert chunks[("src/app.py", 4)]["endLine"] == 5
+    # Searches read the chunks back through the code chunk payload format
+    entries = await connector.search("app line 4")
+    assert entries[0].metadata["filePath"] == "src/app.py"
+    manifest = json.loads((tmp_path / DEFAULT_MANIFEST_NAME).read_text())
+    assert set(manifest["files"]) == {"src/app.py"}
+
+
+@pytest.mark.asyncio
+async def test_reindexing_only_embeds_changed_files(tmp_path, connector, embedding_provider):
+    for name in ("a", "b", "c"):
+        write(tmp_path, f"{name}.py", numbered_lines(name, 6))
+    indexer = CodebaseIndexer(connector, tmp_path, chunk_size=3, chunk_overlap=0, workers=2)
+    await indexer.index()
+    embedding_provider.document_calls.clear()
+
+    stats = await indexer.index()
+
+    assert stats.files_unchanged == 3
+    assert stats.files_indexed == 0
+    assert embedding_provider.document_calls == []
+
+    # Only the changed chunk of the changed file is embedded again
+    write(tmp_path, "b.py", numbered_lines("b", 3) + "b changed line\nb line 5\nb line 6\n")
+    stats = await indexer.index()
+
+    assert stats.files_indexed == 1
+    assert stats.files_unchanged == 2
+    assert stats.chunks == 1
+    assert embedded_texts(embedding_provider) == ["b changed line\nb line 5\nb line 6\n"]
+    chunks = await indexed_chunks(connector)
+    assert len(chunks) == 6
+    assert chunks[("b.py", 4)]["codeChunk"] == "b changed line\nb line 5\nb line 6\n"
+
+
+@pytest.mark.asyncio
+async def test_touched_files_are_not_indexed_again(tmp_path, connector, embedding_provider):
+    write(tmp_path, "a.py", numbered_lines("a", 3))
+    indexer = CodebaseIndexer(connector, tmp_path, chunk_size=3, chunk_overlap=0)
+    await indexer.index()
+    embedding_provider.document_calls.clear()
+
+    os.utime(tmp_path / "a.py", ns=(0, 0))
+    stats = await indexer.index()
+
+    assert stats.files_unchanged == 1
+    assert embedding_provider.document_calls == []
+
+
+@pytest.mark.asyncio
+async def test_shrunk_and_removed_files_lose_their_chunks(tmp_path, connector):
+    write(tmp_path, "long.py", numbered_lines("long", 9))
+    write(tmp_path, "gone.py", numbered_lines("gone", 3))
+    write(tmp_path, "empty.py", numbered_lines("empty", 3))
+    indexer = CodebaseIndexer(connector, tmp_path, chunk_size=3, chunk_overlap=0)
+    await indexer.index()
+
+    write(tmp_path, "long.py", numbered_lines("long", 3))
+    write(tmp_path, "empty.py", "")
+    (tmp_path / "gone.py").unlink()
+    stats = await indexer.index()
+
+    assert stats.files_removed == 1
+    assert set(await indexed_chunks(connector)) == {("long.py", 1)}
+    manifest = json.loads((tmp_path / DEFAULT_MANIFEST_NAME).read_text())
+    assert set(manifest["files"]) == {"long.py", "empty.py"}
+
+
+@pytest.mark.asyncio
+async def test_changed_options_index_every_file(tmp_path, connector, embedding_provider):
+    write(tmp_path, "a.py", numbered_lines("a", 6))
+    await CodebaseIndexer(connector, tmp_path, chunk_size=3, chunk_overlap=0).index()
+    embedding_provider.document_calls.clear()
+
+    stats = await CodebaseIndexer(connector, tmp_path, chunk_size=6, chunk_overlap=0).index()
+
+    assert stats.files_indexed == 1
+    assert embedded_texts(embedding_provider) == [numbered_lines("a", 6)]
+    assert set(await indexed_chunks(connector)) == {("a.py", 1)}
+
+
+@pytest.mark.asyncio
+async def test_failed_files_are_retried(tmp_path, connector, monkeypatch):
+    write(tmp_path, "a.py", numbered_lines("a", 3))
+    indexer = CodebaseIndexer(connector, tmp_path, chunk_size=3, chunk_overlap=0)
+
+    async def failing_store_many(*args, **kwargs):
+        raise RuntimeError("embedding service unavailable")
+
+    monkeypatch.setattr(connector, "store_many", failing_store_many)
+    stats = await indexer.index()
+    assert stats.files_failed == 1
+    monkeypatch.undo()
+
+    stats = await indexer.index()
+
+    assert stats.files_indexed == 1
+    assert set(await indexed_chunks(connector)) == {("a.py", 1)}
+
+
+@pytest.mark.asyncio
+async def test_lost_manifest_replaces_existing_chunks(tmp_path, connector):
+    write(tmp_path, "a.py", numbered_lines("a", 6))
+    indexer = CodebaseIndexer(connector, tmp_path, chunk_size=3, chunk_overlap=0)
+    await indexer.index()
+
+    (tmp_path / DEFAULT_MANIFEST_NAME).unlink()
+    write(tmp_path, "a.py", numbered_lines("a", 3))
+    stats = await indexer.index()
+
+    assert stats.files_indexed == 1
+    assert set(await indexed_chunks(connector)) == {("a.py", 1)}
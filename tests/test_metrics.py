@@ -0,0 +1,146 @@
+import asyncio
+import uuid
+
+import httpx
+import pytest
+
+from mcp_server_qdrant.embeddings.cached import CachedEmbeddingProvider
+from mcp_server_qdrant.mcp_server import QdrantMCPServer
+from mcp_server_qdrant.metrics import Counter, Histogram, MetricsRegistry
+from mcp_server_qdrant.qdrant import Entry, QdrantConnector
+from mcp_server_qdrant.settings import QdrantSettings, ToolSettings
+from tests.fake_embeddings import FakeEmbeddingProvider
+
+
+class TestMetricsRegistry:
+    def test_get_or_create(self):
+        """Metrics with the same name and labels are shared."""
+        registry = MetricsRegistry()
+        first = registry.counter("calls_total", "Calls", tool="a")
+
+        assert registry.counter("calls_total", "Calls", tool="a") is first
+        assert registry.counter("calls_total", "Calls", tool="b") is not first
+        with pytest.raises(ValueError):
+            registry.histogram("calls_total", "Calls", tool="a")
+
+    def test_render(self):
+        """Metrics are rendered in the Prometheus text format, with the namespace prefix."""
+        registry = MetricsRegistry(namespace="test")
+        registry.counter("errors_total", "Errors", operation='say "hi"').inc(2)
+        histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        histogram.observe(0.5)
+        histogram.observe(5)
+
+        text = registry.render()
+
+        assert "# TYPE test_errors_total counter" in text
+        assert 'test_errors_total{operation="say \\"hi\\""} 2' in text
+        assert "# TYPE test_latency_seconds histogram" in text
+        assert 'test_latency_seconds_bucket{le="0.1"} 0' in text
+        assert 'test_latency_seconds_bucket{le="1.0"} 1' in text
+        assert 'test_latency_seconds_bucket{le="+Inf"} 2' in text
+        assert "test_latency_seconds_sum 5.5" in text
+        assert "test_latency_seconds_count 2" in text
+
+    def test_collectors_are_read_on_render(self):
+        """Collected values reflect the state at render time."""
+        registry = MetricsRegistry()
+        state = {"hits": 1}
+        registry.add_collector(
+            lambda: [Counter("hits_total", "Hits", value=state["hits"])]
+        )
+        state["hits"] = 3
+
+        assert "mcp_qdrant_hits_total 3" in registry.render()
+
+    def test_histogram_time(self):
+        """Timed blocks are observed even when they raise."""
+        histogram = Histogram("latency_seconds", "Latency")
+        with pytest.raises(RuntimeError):
+            with histogram.time():
+                raise RuntimeError()
+
+        assert histogram.count == 1
+
+
+@pytest.mark.asyncio
+async def test_connector_records_stages():
+    """Searching and storing record each stage and the number of results."""
+    registry = MetricsRegistry()
+    connector = QdrantConnector(
+        qdrant_url=":memory:",
+        qdrant_api_key=None,
+        collection_name=f"test_collection_{uuid.uuid4().hex}",
+        embedding_provider=FakeEmbeddingProvider(),
+        metrics=registry,
+    )
+
+    await connector.store(Entry(content="The Eiffel Tower is in Paris"))
+    await connector.search("Paris")
+
+    def stage_count(stage: str) -> int:
+        return registry.histogram(
+            "stage_duration_seconds", "", stage=stage
+        ).count
+
+    assert stage_count("embed") == 2
+    assert stage_count("upsert") == 1
+    assert stage_count("query_points") == 1
+    assert stage_count("parse") == 1
+    assert registry.counter("search_results_total", "").value == 1
+
+
+@pytest.mark.asyncio
+async def test_embed_stage_excludes_format_detection(monkeypatch):
+    """Detecting the payload format of a collection is not timed as embedding."""
+    registry = MetricsRegistry()
+    connector = QdrantConnector(
+        qdrant_url=":memory:",
+        qdrant_api_key=None,
+        collection_name=f"test_collection_{uuid.uuid4().hex}",
+        embedding_provider=FakeEmbeddingProvider(),
+        metrics=registry,
+    )
+    await connector.store(Entry(content="The Eiffel Tower is in Paris"))
+    detect = connector._payload_format
+
+    async def slow_detect(*args):
+        await asyncio.sleep(0.2)
+        return await detect(*args)
+
+    monkeypatch.setattr(connector, "_payload_format", slow_detect)
+    embed = registry.histogram("stage_duration_seconds", "", stage="embed")
+    stored_sum = embed.sum
+
+    await connector.search("Paris")
+    await connector.search_many(["Paris", "Tower"])
+
+    assert embed.count == 3
+    assert embed.sum - stored_sum < 0.2
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint():
+    """The server exposes tool, stage and embedding cache metrics on /metrics."""
+    server = QdrantMCPServer(
+        tool_settings=ToolSettings(),
+        qdrant_settings=QdrantSettings(
+            QDRANT_URL=":memory:", COLLECTION_NAME=f"test_{uuid.uuid4().hex}"
+        ),
+        embedding_provider=CachedEmbeddingProvider(FakeEmbeddingProvider()),
+    )
+    await server.qdrant_connector.store(Entry(content="hello world"))
+    await server.qdrant_connector.search("hello")
+    await server.qdrant_connector.search("hello")
+
+    transport = httpx.ASGITransport(app=server.http_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'mcp_qdrant_embedding_cache_hits_total{cache="CachedEmbeddingProvider"} 1'
+        in response.text
+    )
+    assert 'mcp_qdrant_stage_duration_seconds_count{stage="query_points"} 2' in response.text
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from mcp_server_qdrant.mmr import mmr_select
+from mcp_server_qdrant.qdrant import Entry
+from tests.fake_embeddings import FakeSparseEmbeddingProvider
+
+DUPLICATES = [Entry(content=f"load the config file from disk {suffix}") for suffix in "abc"]
+DISTINCT = Entry(content="parse the json config")
+QUERY = "load the config file from disk json"
+
+
+def test_mmr_select_skips_near_duplicates():
+    query = np.array([1.0, 0.0, 0.0])
+    vectors = np.array([[1.0, 0.1, 0.0], [1.0, 0.11, 0.0], [0.8, 0.0, 0.6], [0.0, 0.0, 1.0]])
+
+    assert mmr_select(query, vectors, 4, lambda_mult=1.0) == [0, 1, 2, 3]
+    assert mmr_select(query, vectors, 2, lambda_mult=0.5) == [0, 2]
+    # Only diversity counts after the most relevant candidate
+    assert mmr_select(query, vectors, 2, lambda_mult=0.0) == [0, 3]
+    assert mmr_select(query, vectors, 10) == mmr_select(query, vectors, 4)
+    assert mmr_select(query, vectors[:0], 3) == []
+
+
+@pytest.fixture
+def make_diverse_connector(make_connector):
+    def make(mmr_method: str = "numpy", hybrid: bool = False):
+        return make_connector(
+            sparse_embedding_provider=FakeSparseEmbeddingProvider() if hybrid else None,
+            mmr_lambda=0.3,
+            mmr_method=mmr_method,
+            search_cache_size=16,
+        )
+
+    return make
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mmr_method,hybrid", [("numpy", False), ("qdrant", False), ("numpy", True)])
+async def test_search_diversifies_results(make_diverse_connector, mmr_method, hybrid):
+    connector = make_diverse_connector(mmr_method, hybrid)
+    await connector.store_many(DUPLICATES + [DISTINCT])
+
+    relevant = await connector.search(QUERY, limit=2, mmr_lambda=1.0)
+    diverse = await connector.search(QUERY, limit=2)
+
+    duplicates = {entry.content for entry in DUPLICATES}
+    assert all(entry.content in duplicates for entry in relevant)
+    assert diverse[0].content in duplicates
+    assert diverse[1].content == DISTINCT.content
+    assert all(entry.score is not None and entry.id is not None for entry in diverse)
+
+
+@pytest.mark.asyncio
+async def test_diverse_pages_do_not_overlap(make_diverse_connector):
+    connector = make_diverse_connector()
+    await connector.store_many(DUPLICATES + [DISTINCT])
+
+    pages = [await connector.search(QUERY, limit=2, offset=offset) for offset in (0, 2)]
+
+    contents = [entry.content for page in pages for entry in page]
+    assert sorted(contents) == sorted(entry.content for entry in DUPLICATES + [DISTINCT])
+    assert contents[1] == DISTINCT.content
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mmr_method,hybrid", [("numpy", False), ("qdrant", False), ("numpy", True)])
+async def test_find_pages_are_cut_from_one_ordering(make_diverse_connector, mmr_method, hybrid):
+    """Like qdrant-find, each page asks for one extra entry, telling whether more follow."""
+    connector = make_diverse_connector(mmr_method, hybrid)
+    await connector.store_many(
+        [Entry(content=f"config loader {i % 7} variant {i}") for i in range(60)]
+    )
+    page_size = 5
+
+    pages = [
+        (await connector.search("config loader", limit=page_size + 1, offset=offset))[:page_size]
+        for offset in range(0, 30, page_size)
+    ]
+
+    ids = [entry.id for page in pages for entry in page]
+    assert len(ids) == len(set(ids))
+    # The pool holds 4 candidates per requested entry
+    assert len(ids) == (page_size + 1) * 4
+    assert [len(page) for page in pages] == [5, 5, 5, 5, 4, 0]
+
+
+@pytest.mark.asyncio
+async def test_search_many_diversifies_each_query(make_diverse_connector):
+    connector = make_diverse_connector()
+    await connector.store_many(DUPLICATES + [DISTINCT])
+
+    results = await connector.search_many([QUERY, QUERY], limit=2)
+
+    assert [[entry.content for entry in entries][1] for entries in results] == [
+        DISTINCT.content,
+        DISTINCT.content,
+    ]
@@ -0,0 +1,299 @@
+import asyncio
+import base64
+import json
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import numpy as np
+import pytest
+
+from mcp_server_qdrant.embeddings.openai_compatible import (
+    OpenAICompatibleProvider,
+    parse_retry_after,
+)
+
+
+def make_provider(handler, **kwargs) -> OpenAICompatibleProvider:
+    provider = OpenAICompatibleProvider(
+        model_name="test-model",
+        api_key="test-key",
+        base_url="http://embeddings.test/v1",
+        vector_size=3,
+        **kwargs,
+    )
+    provider.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return provider
+
+
+def embedding_for(text: str) -> list[float]:
+    return [float(len(text)), 0.5, -1.0]
+
+
+def json_handler(requests: list[dict]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append(body)
+        encode = body.get("encoding_format") == "base64"
+        data = []
+        for index, text in enumerate(body["input"]):
+            embedding = embedding_for(text)
+            if encode:
+                embedding = base64.b64encode(
+                    np.asarray(embedding, dtype=np.float32).tobytes()
+                ).decode()
+            data.append({"object": "embedding", "index": index, "embedding": embedding})
+        return httpx.Response(200, json={"object": "list", "data": data})
+
+    return handler
+
+
+@pytest.mark.asyncio
+class TestOpenAICompatibleProvider:
+    async def test_embed_documents(self):
+        requests: list[dict] = []
+        provider = make_provider(json_handler(requests))
+
+        embeddings = await provider.embed_documents(["a", "bbb"])
+
+        assert embeddings == [embedding_for("a"), embedding_for("bbb")]
+        assert requests == [{"model": "test-model", "input": ["a", "bbb"]}]
+
+    async def test_embed_documents_array(self):
+        provider = make_provider(json_handler([]))
+
+        embeddings = await provider.embed_documents_array(["a", "bbb"])
+
+        assert embeddings.dtype == np.float32
+        assert embeddings.shape == (2, 3)
+        np.testing.assert_array_equal(embeddings[1], embedding_for("bbb"))
+
+    async def test_base64_embeddings(self):
+        """Base64 encoded float32 embeddings are decoded without JSON float lists."""
+        requests: list[dict] = []
+        provider = make_provider(json_handler(requests), base64_embeddings=True)
+
+        embeddings = await provider.embed_documents_array(["a", "bbb"])
+
+        assert requests[0]["encoding_format"] == "base64"
+        np.testing.assert_array_equal(
+            embeddings, np.asarray([embedding_for("a"), embedding_for("bbb")], dtype=np.float32)
+        )
+
+    async def test_split_by_items(self):
+        requests: list[dict] = []
+        provider = make_provider(json_handler(requests), max_batch_size=2)
+
+        embeddings = await provider.embed_documents(["a", "bb", "ccc", "dddd", "eeeee"])
+
+        assert [len(request["input"]) for request in requests] == [2, 2, 1]
+        assert embeddings == [embedding_for(text) for text in ["a", "bb", "ccc", "dddd", "eeeee"]]
+
+    async def test_split_by_tokens(self):
+        requests: list[dict] = []
+        provider = make_provider(json_handler(requests), max_batch_tokens=10)
+        texts = ["x" * 20, "y" * 20, "z" * 60, "w"]
+
+        embeddings = await provider.embed_documents(texts)
+
+        # 6 estimated tokens for the short texts, 16 for the long one which goes alone
+        assert [request["input"] for request in requests] == [
+            ["x" * 20],
+            ["y" * 20],
+            ["z" * 60],
+            ["w"],
+        ]
+        assert embeddings == [embedding_for(text) for text in texts]
+
+    async def test_results_are_ordered_by_index(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            texts = json.loads(request.content)["input"]
+            data = [
+                {"index": index, "embedding": embedding_for(text)}
+                for index, text in enumerate(texts)
+            ]
+            return httpx.Response(200, json={"data": list(reversed(data))})
+
+        provider = make_provider(handler)
+
+        embeddings = await provider.embed_documents(["a", "bb", "ccc"])
+
+        assert embeddings == [embedding_for("a"), embedding_for("bb"), embedding_for("ccc")]
+
+    async def test_concurrency_limit(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return json_handler([])(request)
+
+        provider = make_provider(handler, max_batch_size=1, max_concurrency=2)
+
+        embeddings = await provider.embed_documents([str(i) for i in range(6)])
+
+        assert len(embeddings) == 6
+        assert max_in_flight == 2
+
+    async def test_retry_after(self, monkeypatch):
+        delays: list[float] = []
+        real_sleep = asyncio.sleep
+
+        async def record_sleep(delay):
+            delays.append(delay)
+            await real_sleep(0)
+
+        monkeypatch.setattr(asyncio, "sleep", record_sleep)
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "7"}),
+            httpx.Response(503),
+        ]
+        success = json_handler([])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return responses.pop(0) if responses else success(request)
+
+        provider = make_provider(handler, retry_base_delay=0.5)
+
+        embeddings = await provider.embed_documents(["a"])
+
+        assert embeddings == [embedding_for("a")]
+        assert provider.retries == 2
+        # Retry-After is honored, then the backoff is jittered up to 0.5 * 2
+        assert delays[0] == 7.0
+        assert 0 <= delays[1] <= 1.0
+
+    async def test_retry_after_is_capped(self, monkeypatch):
+        delays: list[float] = []
+        real_sleep = asyncio.sleep
+
+        async def record_sleep(delay):
+            delays.append(delay)
+            await real_sleep(0)
+
+        monkeypatch.setattr(asyncio, "sleep", record_sleep)
+        responses = [httpx.Response(429, headers={"Retry-After": "3600"})]
+        success = json_handler([])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return responses.pop(0) if responses else success(request)
+
+        provider = make_provider(handler, retry_max_delay=2.0)
+
+        assert await provider.embed_documents(["a"]) == [embedding_for("a")]
+        assert delays == [2.0]
+
+    async def test_retries_are_limited(self, monkeypatch):
+        attempts = []
+
+        async def no_sleep(delay):
+            pass
+
+        monkeypatch.setattr(asyncio, "sleep", no_sleep)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            return httpx.Response(500)
+
+        provider = make_provider(handler, max_retries=2)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await provider.embed_documents(["a"])
+        assert len(attempts) == 3
+
+    async def test_client_errors_are_not_retried(self):
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            return httpx.Response(400, json={"error": "input too long"})
+
+        provider = make_provider(handler)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await provider.embed_documents(["a"])
+        assert len(attempts) == 1
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    in_a_minute = formatdate(time.time() + 60, usegmt=True)
+    assert 55 <= parse_retry_after(in_a_minute) <= 60
+
+
+class MockEmbeddingsServer(ThreadingHTTPServer):
+    """
+    Local HTTP server answering embeddings requests, after failing the first ones
+    with a rate limit error.
+    """
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.requests: list[dict] = []
+        super().__init__(("127.0.0.1", 0), MockEmbeddingsHandler)
+
+
+class MockEmbeddingsHandler(BaseHTTPRequestHandler):
+    server: MockEmbeddingsServer
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append(body)
+        if self.server.failures > 0:
+            self.server.failures -= 1
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        data = [
+            {"index": index, "embedding": embedding_for(text)}
+            for index, text in enumerate(body["input"])
+        ]
+        content = json.dumps({"data": data}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def mock_server():
+    server = MockEmbeddingsServer(failures=2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_against_local_http_server(mock_server):
+    """Split batches are retried over real HTTP connections and reassembled in order."""
+    provider = OpenAICompatibleProvider(
+        model_name="test-model",
+        base_url=f"http://127.0.0.1:{mock_server.server_address[1]}/v1",
+        vector_size=3,
+        max_batch_size=3,
+    )
+    texts = [f"text {'x' * i}" for i in range(10)]
+
+    async with provider:
+        embeddings = await provider.embed_documents(texts)
+
+    assert embeddings == [embedding_for(text) for text in texts]
+    assert provider.retries == 2
+    # 4 batches, 2 of the requests were rate limited
+    assert len(mock_server.requests) == 6
@@ -0,0 +1,128 @@
+import uuid
+
+import pytest
+from qdrant_client import models
+
+from mcp_server_qdrant.payload_formats import PayloadFormat, PayloadFormatRegistry
+from mcp_server_qdrant.qdrant import Entry, QdrantConnector
+from tests.fake_embeddings import FakeEmbeddingProvider
+
+
+def test_detect_builtin_formats():
+    registry = PayloadFormatRegistry()
+
+    assert registry.detect({"document": "a", "metadata": None}).name == "document"
+    assert registry.detect({"codeChunk": "a", "filePath": "b.py"}).name == "codeChunk"
+    assert registry.detect({"content": "a", "body": "b"}).name == "content"
+    assert registry.detect({"title": "a"}).name == "raw"
+
+
+def test_builtin_extractors():
+    registry = PayloadFormatRegistry()
+
+    assert registry.get("document").extract({"document": "a", "metadata": {"k": 1}}) == (
+        "a",
+        {"k": 1},
+    )
+    assert registry.get("codeChunk").extract({"codeChunk": "a", "filePath": "b.py"}) == (
+        "a",
+        {"filePath": "b.py"},
+    )
+    assert registry.get("text").extract({"text": 42}) == ("42", {})
+    assert registry.get("raw").extract({"title": "a"}) == ("{'title': 'a'}", None)
+
+
+def test_make_payload_inverts_extract():
+    registry = PayloadFormatRegistry()
+
+    for name, metadata in (("document", {"k": 1}), ("codeChunk", {"filePath": "b.py"})):
+        payload_format = registry.get(name)
+        payload = payload_format.make_payload("a", metadata)
+        assert payload_format.matches(payload)
+        assert payload_format.extract(payload) == ("a", metadata)
+    assert registry.get("codeChunk").make_payload("a", None) == {"codeChunk": "a"}
+    with pytest.raises(ValueError):
+        registry.get("raw").make_payload("a", None)
+
+
+def test_registered_formats_take_precedence():
+    registry = PayloadFormatRegistry()
+    registry.register(
+        PayloadFormat(
+            "note",
+            content_field="content",
+            extractor=lambda payload: (payload["content"], {"tags": payload.get("tags")}),
+        )
+    )
+
+    payload_format = registry.detect({"content": "a", "tags": ["x"], "other": 1})
+
+    assert payload_format.name == "note"
+    assert payload_format.extract({"content": "a", "tags": ["x"]}) == ("a", {"tags": ["x"]})
+
+
+@pytest.mark.asyncio
+async def test_search_with_registered_format():
+    """Collections of other indexers are parsed with their registered format."""
+    embedding_provider = FakeEmbeddingProvider()
+    connector = QdrantConnector(
+        qdrant_url=":memory:",
+        qdrant_api_key=None,
+        collection_name=f"test_collection_{uuid.uuid4().hex}",
+        embedding_provider=embedding_provider,
+    )
+    connector.payload_formats.register(
+        PayloadFormat("note", content_field="note", fields=["note", "author"])
+    )
+    collection_name = connector._default_collection_name
+    await connector._client.create_collection(
+        collection_name,
+        vectors_config=models.VectorParams(
+            size=embedding_provider.get_vector_size(), distance=models.Distance.COSINE
+        ),
+    )
+    await connector._client.upsert(
+        collection_name,
+        points=[
+            models.PointStruct(
+                id=i,
+                vector=await embedding_provider.embed_query(payload["note"]),
+                payload=payload,
+            )
+            for i, payload in enumerate(
+                [
+                    {"note": "buy milk", "author": "me", "raw": "x" * 100},
+                    {"note": "call mom", "author": "you", "raw": "y" * 100},
+                ]
+            )
+        ],
+    )
+
+    entries = await connector.search("buy milk", limit=2)
+
+    assert {entry.content for entry in entries} == {"buy milk", "call mom"}
+    assert all(isinstance(entry, Entry) for entry in entries)
+    assert {entry.metadata["author"] for entry in entries} == {"me", "you"}
+    assert all(set(entry.metadata) == {"author"} for entry in entries)
+    metadata = await connector._collections.get(collection_name)
+    assert metadata.payload_format == "note"
+
+
+def test_points_in_another_format_are_detected():
+    connector = QdrantConnector(
+        qdrant_url=":memory:",
+        qdrant_api_key=None,
+        collection_name="unused",
+        embedding_provider=FakeEmbeddingProvider(),
+    )
+    points = [
+        models.ScoredPoint(id=1, version=0, score=0.9, payload={"document": "a", "metadata": None}),
+        models.ScoredPoint(id=2, version=0, score=0.8, payload={"codeChunk": "b", "filePath": "c"}),
+    ]
+
+    entries = connector._parse_points(points, connector.payload_formats.get("document"))
+
+    assert [(entry.content, entry.metadata, entry.score) for entry in entries] == [
+        ("a", None, 0.9),
+        ("b", {"filePath": "c"}, 0.8),
+    ]
@@ -0,0 +1,103 @@
+import uuid
+
+import pytest
+from qdrant_client import models
+
+from mcp_server_qdrant.qdrant import Entry, QdrantConnector
+
+CODE_CHUNK_PAYLOAD = {
+    "codeChunk": "def hello(): pass",
+    "filePath": "src/hello.py",
+    "startLine": 1,
+    "endLine": 1,
+    "segmentHash": "0" * 64,
+    "ast": {"large": "x" * 1000},
+}
+
+
+async def make_external_collection(connector: QdrantConnector, embedding_provider, payload):
+    """Create a collection the way an external indexer would."""
+    collection_name = connector._default_collection_name
+    await connector._client.create_collection(
+        collection_name,
+        vectors_config=models.VectorParams(
+            size=embedding_provider.get_vector_size(), distance=models.Distance.COSINE
+        ),
+    )
+    vector = await embedding_provider.embed_query(payload["codeChunk"])
+    await connector._client.upsert(
+        collection_name,
+        points=[models.PointStruct(id=1, vector=vector, payload=payload)],
+    )
+
+
+@pytest.mark.asyncio
+async def test_code_chunk_payload_is_projected(make_connector, embedding_provider):
+    """Only the displayed fields of code chunks are fetched."""
+    connector = make_connector()
+    await make_external_collection(connector, embedding_provider, CODE_CHUNK_PAYLOAD)
+
+    entries = await connector.search("def hello(): pass")
+
+    assert entries[0].content == "def hello(): pass"
+    assert entries[0].metadata == {"filePath": "src/hello.py", "startLine": 1, "endLine": 1}
+    metadata = await connector._collections.get(connector._default_collection_name)
+    assert metadata.payload_format == "codeChunk"
+
+
+@pytest.mark.asyncio
+async def test_configured_payload_selectors(make_connector, embedding_provider):
+    """Configured include and exclude lists take precedence over the detected format."""
+    include_connector = make_connector(
+        payload_include=["codeChunk", "segmentHash"]
+    )
+    await make_external_collection(include_connector, embedding_provider, CODE_CHUNK_PAYLOAD)
+    exclude_connector = make_connector(payload_exclude=["ast"])
+    await make_external_collection(exclude_connector, embedding_provider, CODE_CHUNK_PAYLOAD)
+
+    included = await include_connector.search("def hello(): pass")
+    excluded = await exclude_connector.search("def hello(): pass")
+
+    assert included[0].metadata == {"segmentHash": "0" * 64}
+    assert set(excluded[0].metadata) == {"filePath", "startLine", "endLine", "segmentHash"}
+
+
+@pytest.mark.asyncio
+async def test_own_collections_skip_detection(make_connector, monkeypatch):
+    """Collections created by the connector are known to use the document format."""
+    connector = make_connector()
+    await connector.store(Entry(content="hello world", metadata={"key": "value"}))
+
+    async def fail_scroll(*args, **kwargs):
+        raise AssertionError("The payload format should be known")
+
+    monkeypatch.setattr(connector._client, "scroll", fail_scroll)
+    entries = await connector.search("hello")
+
+    assert entries[0].metadata == {"key": "value"}
+
+
+@pytest.mark.asyncio
+async def test_mixed_payload_formats(make_connector, embedding_provider):
+    """Points of another format than the detected one keep the fields they display."""
+    connector = make_connector()
+    await connector.store(Entry(content="hello world", metadata={"key": "value"}))
+    vector = await embedding_provider.embed_query(CODE_CHUNK_PAYLOAD["codeChunk"])
+    await connector._client.upsert(
+        connector._default_collection_name,
+        points=[
+            models.PointStruct(
+                id=str(uuid.uuid4()),
+                vector={embedding_provider.get_vector_name(): vector},
+                payload=CODE_CHUNK_PAYLOAD,
+            ),
+        ],
+    )
+
+    entries = await connector.search("hello", limit=2)
+
+    by_content = {entry.content: entry.metadata for entry in entries}
+    assert by_content == {
+        "hello world": {"key": "value"},
+        "def hello(): pass": {"filePath": "src/hello.py", "startLine": 1, "endLine": 1},
+    }
@@ -0,0 +1,56 @@
+import pytest
+from qdrant_client import models
+
+from mcp_server_qdrant.qdrant import Entry
+
+SCALAR_QUANTIZATION = models.ScalarQuantization(
+    scalar=models.ScalarQuantizationConfig(type=models.ScalarType.INT8, always_ram=True)
+)
+
+
+@pytest.mark.asyncio
+async def test_collection_is_created_with_vector_options(make_connector):
+    """Quantization, on-disk storage and HNSW options apply to the dense vector."""
+    connector = make_connector(
+        vector_options={
+            "on_disk": True,
+            "hnsw_config": models.HnswConfigDiff(m=32, ef_construct=200),
+            "quantization_config": SCALAR_QUANTIZATION,
+        }
+    )
+    await connector.store(Entry(content="hello world"))
+
+    info = await connector._client.get_collection(connector._default_collection_name)
+    vector_params = info.config.params.vectors["fake-fake-model"]
+    assert vector_params.on_disk is True
+    assert vector_params.hnsw_config.m == 32
+    assert vector_params.hnsw_config.ef_construct == 200
+    assert vector_params.quantization_config == SCALAR_QUANTIZATION
+
+
+@pytest.mark.asyncio
+@pytest.mark.filterwarnings("ignore:Local mode performs exact")
+async def test_search_params(make_connector, monkeypatch):
+    """The default search parameters are sent with each search, unless overridden."""
+    default_params = models.SearchParams(
+        hnsw_ef=128,
+        quantization=models.QuantizationSearchParams(rescore=True, oversampling=2.0),
+    )
+    connector = make_connector(search_params=default_params)
+    await connector.store(Entry(content="hello world"))
+
+    calls = []
+    query_points = connector._client.query_points
+
+    async def recording_query_points(*args, **kwargs):
+        calls.append(kwargs)
+        return await query_points(*args, **kwargs)
+
+    monkeypatch.setattr(connector._client, "query_points", recording_query_points)
+    override = models.SearchParams(exact=True)
+    entries = await connector.search("hello")
+    await connector.search("hello", search_params=override)
+
+    assert len(entries) == 1
+    assert calls[0]["search_params"] == default_params
+    assert calls[1]["search_params"] == override
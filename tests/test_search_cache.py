@@ -0,0 +1,102 @@
+
+import pytest
+from qdrant_client import models
+
+from mcp_server_qdrant.metrics import MetricsRegistry
+from mcp_server_qdrant.qdrant import Entry
+from mcp_server_qdrant.search_cache import SearchResultCache
+
+
+def make_key(cache: SearchResultCache, query: str = "hello", **kwargs):
+    options = dict(limit=10, query_filter=None, score_threshold=None, search_params=None)
+    options.update(kwargs)
+    return cache.make_key("collection", query, **options)
+
+
+class TestSearchResultCache:
+    def test_key_normalization(self):
+        """Queries differing by whitespace share a key, other parameters do not."""
+        cache = SearchResultCache()
+        keyword_filter = models.Filter(
+            must=[models.FieldCondition(key="a", match=models.MatchValue(value="b"))]
+        )
+
+        assert make_key(cache, "  hello \n world ") == make_key(cache, "hello world")
+        assert make_key(cache, "Hello") != make_key(cache, "hello")
+        assert make_key(cache, limit=5) != make_key(cache)
+        assert make_key(cache, score_threshold=0.5) != make_key(cache)
+        assert make_key(cache, query_filter=keyword_filter) != make_key(cache)
+        assert make_key(cache, query_filter=keyword_filter) == make_key(
+            cache, query_filter=keyword_filter.model_copy(deep=True)
+        )
+
+    def test_lru_eviction(self):
+        """The least recently used searches are evicted first."""
+        cache = SearchResultCache(max_size=2)
+        first, second, third = (make_key(cache, query) for query in ("a", "b", "c"))
+        cache.put(first, [1])
+        cache.put(second, [2])
+        cache.get(first)
+        cache.put(third, [3])
+
+        assert cache.get(first) == [1]
+        assert cache.get(second) is None
+        assert cache.get(third) == [3]
+
+    def test_ttl(self, monkeypatch):
+        """Entries expire after their time to live."""
+        now = 1000.0
+        monkeypatch.setattr("time.monotonic", lambda: now)
+        cache = SearchResultCache(ttl=10)
+        key = make_key(cache)
+        cache.put(key, [1])
+
+        now = 1005.0
+        assert cache.get(key) == [1]
+        now = 1011.0
+        assert cache.get(key) is None
+
+    def test_invalidation_keeps_in_flight_searches_out(self):
+        """Results of a search started before a write are not returned after it."""
+        cache = SearchResultCache()
+        stale_key = make_key(cache)
+        cache.invalidate("collection")
+        cache.put(stale_key, ["stale"])
+
+        assert cache.get(make_key(cache)) is None
+        assert cache.cache_info()["hit_rate"] == 0.0
+
+
+@pytest.fixture
+def metrics():
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def qdrant_connector(make_connector, metrics):
+    return make_connector(search_cache_size=16, metrics=metrics)
+
+
+@pytest.mark.asyncio
+async def test_repeated_search_is_cached(qdrant_connector, embedding_provider, metrics):
+    """Identical searches are answered without embedding or querying again."""
+    await qdrant_connector.store(Entry(content="hello world"))
+
+    first = await qdrant_connector.search("hello")
+    second = await qdrant_connector.search(" hello ")
+
+    assert [entry.content for entry in second] == [entry.content for entry in first]
+    assert embedding_provider.query_calls == ["hello"]
+    assert "mcp_qdrant_search_cache_hits_total 1" in metrics.render()
+
+
+@pytest.mark.asyncio
+async def test_store_invalidates_cache(qdrant_connector, embedding_provider):
+    """Storing into a collection invalidates its cached searches."""
+    await qdrant_connector.store(Entry(content="hello world"))
+    assert len(await qdrant_connector.search("hello")) == 1
+
+    await qdrant_connector.store_many([Entry(content="hello again")])
+
+    assert len(await qdrant_connector.search("hello")) == 2
+    assert len(embedding_provider.query_calls) == 2
@@ -0,0 +1,97 @@
+
+import pytest
+from qdrant_client import models
+
+from mcp_server_qdrant.qdrant import Entry
+
+
+@pytest.fixture
+async def qdrant_connector(make_connector):
+    connector = make_connector()
+    await connector.store_many(
+        [
+            Entry(content="The Eiffel Tower is in Paris", metadata={"topic": "landmarks"}),
+            Entry(content="The Louvre museum is in Paris", metadata={"topic": "museums"}),
+            Entry(content="Python is a programming language", metadata={"topic": "code"}),
+        ]
+    )
+    return connector
+
+
+@pytest.mark.asyncio
+async def test_search_many_single_round_trip(qdrant_connector, embedding_provider, monkeypatch):
+    """All the queries are embedded together and sent in one batch request."""
+    calls = []
+    query_batch_points = qdrant_connector._client.query_batch_points
+
+    async def counting_query_batch_points(*args, **kwargs):
+        calls.append(kwargs)
+        return await query_batch_points(*args, **kwargs)
+
+    monkeypatch.setattr(
+        qdrant_connector._client, "query_batch_points", counting_query_batch_points
+    )
+
+    results = await qdrant_connector.search_many(
+        ["Eiffel Tower", "programming language"], limit=1
+    )
+
+    assert embedding_provider.query_batch_calls == [["Eiffel Tower", "programming language"]]
+    assert embedding_provider.query_calls == []
+    assert len(calls) == 1
+    assert [[entry.content for entry in entries] for entries in results] == [
+        ["The Eiffel Tower is in Paris"],
+        ["Python is a programming language"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_many_per_query_filters(qdrant_connector):
+    """Each query is run with its own filter."""
+    results = await qdrant_connector.search_many(
+        ["Paris", "Paris"],
+        query_filters=[
+            None,
+            models.Filter(
+                must=[
+                    models.FieldCondition(
+                        key="metadata.topic", match=models.MatchValue(value="museums")
+                    )
+                ]
+            ),
+        ],
+    )
+
+    assert len(results[0]) == 3
+    assert [entry.content for entry in results[1]] == ["The Louvre museum is in Paris"]
+
+
+@pytest.mark.asyncio
+async def test_search_many_deduplicate(qdrant_connector):
+    """With deduplication, a point is only returned for the first query that found it."""
+    queries = ["Paris", "Paris museum"]
+
+    results = await qdrant_connector.search_many(queries, limit=2)
+    deduplicated = await qdrant_connector.search_many(queries, limit=2, deduplicate=True)
+
+    first = [entry.content for entry in deduplicated[0]]
+    second = [entry.content for entry in deduplicated[1]]
+    assert first == [entry.content for entry in results[0]]
+    assert set(first) & {entry.content for entry in results[1]}
+    assert not set(first) & set(second)
+
+
+@pytest.mark.asyncio
+async def test_search_many_missing_collection(make_connector, embedding_provider):
+    """Searching a collection that does not exist returns an empty group per query."""
+    connector = make_connector()
+
+    assert await connector.search_many(["a", "b"]) == [[], []]
+    assert embedding_provider.query_batch_calls == []
+
+
+@pytest.mark.asyncio
+async def test_search_many_filters_length_mismatch(qdrant_connector):
+    """The number of filters must match the number of queries."""
+    with pytest.raises(ValueError):
+        await qdrant_connector.search_many(["a", "b"], query_filters=[None])
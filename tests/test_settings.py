@@ -43,6 +43,83 @@ class TestQdrantSettings:
         assert settings.search_limit == 15
         assert settings.read_only is True
 
+    def test_store_batch_size(self, monkeypatch):
+        """Test loading the batch size used by batch store operations."""
+        assert QdrantSettings().store_batch_size == 64
+
+        monkeypatch.setenv("QDRANT_STORE_BATCH_SIZE", "256")
+        assert QdrantSettings().store_batch_size == 256
+
+        monkeypatch.setenv("QDRANT_STORE_BATCH_SIZE", "0")
+        with pytest.raises(ValueError):
+            QdrantSettings()
+
+    def test_hybrid_search(self, monkeypatch):
+        """Test loading the hybrid search fusion settings."""
+        settings = QdrantSettings()
+        assert settings.hybrid_fusion == "rrf"
+        assert settings.hybrid_prefetch_limit == 20
+
+        monkeypatch.setenv("QDRANT_HYBRID_FUSION", "dbsf")
+        monkeypatch.setenv("QDRANT_HYBRID_PREFETCH_LIMIT", "50")
+        settings = QdrantSettings()
+        assert settings.hybrid_fusion == "dbsf"
+        assert settings.hybrid_prefetch_limit == 50
+
+        monkeypatch.setenv("QDRANT_HYBRID_FUSION", "sum")
+        with pytest.raises(ValueError):
+            QdrantSettings()
+
+    def test_vector_options(self, monkeypatch):
+        """Test that storage, HNSW and quantization settings become vector options."""
+        assert QdrantSettings().vector_options() == {}
+        assert QdrantSettings().search_params() is None
+
+        monkeypatch.setenv("QDRANT_QUANTIZATION", "scalar")
+        monkeypatch.setenv("QDRANT_QUANTIZATION_ALWAYS_RAM", "true")
+        monkeypatch.setenv("QDRANT_VECTORS_ON_DISK", "true")
+        monkeypatch.setenv("QDRANT_HNSW_M", "32")
+        monkeypatch.setenv("QDRANT_SEARCH_HNSW_EF", "128")
+        monkeypatch.setenv("QDRANT_SEARCH_RESCORE", "true")
+        monkeypatch.setenv("QDRANT_SEARCH_OVERSAMPLING", "2.0")
+        settings = QdrantSettings()
+
+        options = settings.vector_options()
+        assert options["on_disk"] is True
+        assert options["hnsw_config"].m == 32
+        assert options["hnsw_config"].ef_construct is None
+        assert options["quantization_config"].scalar.type == "int8"
+        assert options["quantization_config"].scalar.always_ram is True
+        search_params = settings.search_params()
+        assert search_params.hnsw_ef == 128
+        assert search_params.quantization.rescore is True
+        assert search_params.quantization.oversampling == 2.0
+
+        monkeypatch.setenv("QDRANT_QUANTIZATION", "product")
+        monkeypatch.setenv("QDRANT_PRODUCT_COMPRESSION", "x32")
+        product = QdrantSettings().vector_options()["quantization_config"].product
+        assert product.compression == "x32"
+
+        monkeypatch.setenv("QDRANT_QUANTIZATION", "binary")
+        binary = QdrantSettings().vector_options()["quantization_config"].binary
+        assert binary.always_ram is True
+
+    def test_transport_options(self, monkeypatch):
+        """Test that transport settings become Qdrant client options."""
+        assert QdrantSettings().client_options() == {}
+
+        monkeypatch.setenv("QDRANT_PREFER_GRPC", "true")
+        monkeypatch.setenv("QDRANT_GRPC_PORT", "16334")
+        monkeypatch.setenv("QDRANT_TIMEOUT", "5")
+        monkeypatch.setenv("QDRANT_MAX_CONNECTIONS", "32")
+        options = QdrantSettings().client_options()
+
+        assert options["prefer_grpc"] is True
+        assert options["grpc_port"] == 16334
+        assert options["timeout"] == 5
+        assert options["limits"].max_connections == 32
+        assert options["limits"].max_keepalive_connections is None
+
     def test_local_path_config(self, monkeypatch):
         """Test loading local path configuration from environment variables."""
         monkeypatch.setenv("QDRANT_LOCAL_PATH", "/path/to/local/qdrant")
@@ -78,6 +155,27 @@ class TestEmbeddingProviderSettings:
         assert settings.provider_type == EmbeddingProviderType.FASTEMBED
         assert settings.model_name == "custom_model"
 
+    def test_fastembed_executor(self, monkeypatch):
+        """Test loading the FastEmbed inference executor configuration."""
+        settings = EmbeddingProviderSettings()
+        assert settings.fastembed_executor == "thread"
+        assert settings.fastembed_executor_workers == 2
+        assert settings.fastembed_threads is None
+
+        monkeypatch.setenv("FASTEMBED_EXECUTOR", "process")
+        monkeypatch.setenv("FASTEMBED_EXECUTOR_WORKERS", "4")
+        monkeypatch.setenv("FASTEMBED_THREADS", "1")
+        monkeypatch.setenv("FASTEMBED_PARALLEL", "0")
+        settings = EmbeddingProviderSettings()
+        assert settings.fastembed_executor == "process"
+        assert settings.fastembed_executor_workers == 4
+        assert settings.fastembed_threads == 1
+        assert settings.fastembed_parallel == 0
+
+        monkeypatch.setenv("FASTEMBED_EXECUTOR", "fibers")
+        with pytest.raises(ValueError):
+            EmbeddingProviderSettings()
+
 
 class TestToolSettings:
     def test_default_values(self):
@@ -0,0 +1,130 @@
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
+
+import pytest
+from fastmcp import Client
+from fastmcp.exceptions import ToolError
+
+from mcp_server_qdrant.mcp_server import QdrantMCPServer
+from mcp_server_qdrant.settings import QdrantSettings, ToolSettings
+from tests.fake_embeddings import FakeEmbeddingProvider
+
+# Modules that take most of the startup time, and are only needed once tools are called
+HEAVY_MODULES = ("qdrant_client", "fastembed", "onnxruntime")
+
+logger = logging.getLogger(__name__)
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Import a module in a fresh interpreter and get the cumulative import time of each module, in us."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_server_import_time():
+    """Importing the server does not import the Qdrant client nor the embedding libraries."""
+    times = import_times("mcp_server_qdrant.mcp_server")
+
+    heavy = [name for name in times if name.split(".")[0] in HEAVY_MODULES]
+    assert heavy == []
+    slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)[:5]
+    # Shown with `pytest --log-cli-level=INFO`
+    logger.info(
+        f"Import of mcp_server_qdrant.mcp_server: {times['mcp_server_qdrant.mcp_server'] / 1e6:.2f} s, "
+        f"slowest: {', '.join(f'{name} {us / 1e6:.2f} s' for name, us in slowest)}"
+    )
+
+
+def test_lazy_server_startup_time():
+    """With lazy startup, the server is created before the embedding model is loaded."""
+    script = (
+        "import time; start = time.perf_counter()\n"
+        "from mcp_server_qdrant.server import mcp\n"
+        "print(time.perf_counter() - start, mcp.ready)\n"
+    )
+    env = {
+        **os.environ,
+        "LAZY_STARTUP": "true",
+        "QDRANT_URL": ":memory:",
+        "COLLECTION_NAME": "startup",
+        # A model that cannot be loaded: startup must not depend on it
+        "EMBEDDING_MODEL": "missing/model-that-does-not-exist",
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True
+    )
+
+    elapsed, ready = result.stdout.split()
+    assert ready == "False"
+    logger.info(f"Lazy server created in {float(elapsed):.2f} s")
+
+
+class BlockingServer(QdrantMCPServer):
+    """Server whose background initialization waits for a signal."""
+
+    def __init__(self, *args, fail: bool = False, **kwargs):
+        self.proceed = threading.Event()
+        self.fail = fail
+        super().__init__(*args, **kwargs)
+
+    def _initialize_backend(self):
+        self.proceed.wait(timeout=10)
+        if self.fail:
+            raise RuntimeError("Model could not be loaded")
+        super()._initialize_backend()
+
+
+def make_server(**kwargs) -> BlockingServer:
+    return BlockingServer(
+        tool_settings=ToolSettings(),
+        qdrant_settings=QdrantSettings(
+            QDRANT_URL=":memory:", COLLECTION_NAME=f"test_{uuid.uuid4().hex}"
+        ),
+        embedding_provider=FakeEmbeddingProvider(),
+        lazy_startup=True,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_tools_wait_until_ready():
+    server = make_server()
+
+    async with Client(server) as client:
+        # The handshake completed while the backend is still loading
+        assert not server.ready
+        threading.Timer(0.2, server.proceed.set).start()
+        started = time.perf_counter()
+        result = await client.call_tool("qdrant-store", {"information": "hello"})
+
+    assert time.perf_counter() - started >= 0.1
+    assert server.ready
+    assert "Remembered" in result.content[0].text
+
+
+@pytest.mark.asyncio
+async def test_initialization_errors_are_reported_by_tools():
+    server = make_server(fail=True)
+    server.proceed.set()
+
+    async with Client(server) as client:
+        with pytest.raises(ToolError, match="Model could not be loaded"):
+            await client.call_tool("qdrant-find", {"query": "hello"})
+
+    assert not server.ready
@@ -0,0 +1,93 @@
+
+import uuid
+
+import pytest
+from fastmcp import Client
+
+from mcp_server_qdrant.mcp_server import QdrantMCPServer
+from mcp_server_qdrant.qdrant import Entry
+from mcp_server_qdrant.settings import QdrantSettings, ToolSettings
+from tests.fake_embeddings import FakeEmbeddingProvider
+
+
+@pytest.fixture
+def qdrant_connector(make_connector):
+    return make_connector(store_batch_size=4)
+
+
+@pytest.mark.asyncio
+async def test_store_many_embeds_in_batches(qdrant_connector, embedding_provider):
+    """Entries are embedded in batches of the configured size and all of them are stored."""
+    entries = [
+        Entry(content=f"document number {i}", metadata={"index": i}) for i in range(10)
+    ]
+
+    stored = await qdrant_connector.store_many(entries)
+
+    assert stored == 10
+    assert [len(call) for call in embedding_provider.document_calls] == [4, 4, 2]
+    info = await qdrant_connector._client.get_collection(
+        qdrant_connector._default_collection_name
+    )
+    assert info.points_count == 10
+
+
+@pytest.mark.asyncio
+async def test_store_many_batch_size_override(qdrant_connector, embedding_provider):
+    """An explicit batch size takes precedence over the connector default."""
+    entries = [Entry(content=f"document number {i}") for i in range(5)]
+
+    await qdrant_connector.store_many(entries, batch_size=5)
+
+    assert [len(call) for call in embedding_provider.document_calls] == [5]
+
+
+@pytest.mark.asyncio
+async def test_store_many_results_are_searchable(qdrant_connector):
+    """Entries stored in bulk are found with their metadata."""
+    await qdrant_connector.store_many(
+        [
+            Entry(content="The Eiffel Tower is in Paris", metadata={"topic": "landmarks"}),
+            Entry(content="Python is a programming language", metadata={"topic": "code"}),
+        ]
+    )
+
+    results = await qdrant_connector.search("Eiffel Tower", limit=1)
+
+    assert len(results) == 1
+    assert results[0].content == "The Eiffel Tower is in Paris"
+    assert results[0].metadata == {"topic": "landmarks"}
+
+
+@pytest.mark.asyncio
+async def test_store_many_empty(qdrant_connector, embedding_provider):
+    """Storing nothing does not touch the provider nor create the collection."""
+    assert await qdrant_connector.store_many([]) == 0
+    assert embedding_provider.document_calls == []
+    assert not await qdrant_connector._client.collection_exists(
+        qdrant_connector._default_collection_name
+    )
+
+
+@pytest.mark.asyncio
+async def test_store_batch_tool_counts_written_entries():
+    """Entries found unchanged are reported apart from the stored ones."""
+    server = QdrantMCPServer(
+        tool_settings=ToolSettings(),
+        qdrant_settings=QdrantSettings(
+            QDRANT_URL=":memory:",
+            COLLECTION_NAME=f"test_{uuid.uuid4().hex}",
+            QDRANT_POINT_ID_MODE="content",
+            QDRANT_SKIP_EXISTING=True,
+        ),
+        embedding_provider=FakeEmbeddingProvider(),
+    )
+
+    async with Client(server) as client:
+        first = await client.call_tool("qdrant-store-batch", {"information": ["a", "b"]})
+        second = await client.call_tool("qdrant-store-batch", {"information": ["a", "b", "c"]})
+
+    assert first.content[0].text.startswith("Remembered 2 entries")
+    assert "skipped" not in first.content[0].text
+    assert second.content[0].text.startswith("Remembered 1 entries")
+    assert second.content[0].text.endswith("(2 unchanged or duplicate entries skipped)")
@@ -0,0 +1,95 @@
+import asyncio
+import uuid
+
+import pytest
+from fastmcp import Client
+
+from mcp_server_qdrant.embeddings.batching import BatchingEmbeddingProvider
+from mcp_server_qdrant.embeddings.cached import CachedEmbeddingProvider
+from mcp_server_qdrant.mcp_server import QdrantMCPServer
+from mcp_server_qdrant.qdrant import Entry
+from mcp_server_qdrant.settings import QdrantSettings, ToolSettings
+from tests.fake_embeddings import FakeEmbeddingProvider, FakeSparseEmbeddingProvider
+
+
+def make_server(embedding_provider=None, **kwargs) -> QdrantMCPServer:
+    return QdrantMCPServer(
+        tool_settings=ToolSettings(),
+        qdrant_settings=QdrantSettings(
+            QDRANT_URL=":memory:", COLLECTION_NAME=f"test_{uuid.uuid4().hex}"
+        ),
+        embedding_provider=embedding_provider or FakeEmbeddingProvider(),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_warm_up_steps():
+    provider = FakeEmbeddingProvider()
+    server = make_server(provider, sparse_embedding_provider=FakeSparseEmbeddingProvider())
+    await server.qdrant_connector.store(Entry(content="hello world"))
+
+    timings = await server.warm_up()
+
+    assert set(timings) == {"embed_query", "embed_documents", "embed_sparse", "qdrant"}
+    assert provider.query_calls == ["warm up"]
+    metadata = await server.qdrant_connector._collections.get(
+        server.qdrant_settings.collection_name
+    )
+    assert metadata.payload_format == "document"
+    assert 'mcp_qdrant_warmup_duration_seconds_count{step="qdrant"} 1' in server.metrics.render()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_bypasses_caches_and_batching():
+    """The dummy texts are embedded by the wrapped model, neither cached nor counted."""
+    provider = FakeEmbeddingProvider()
+    cached = CachedEmbeddingProvider(BatchingEmbeddingProvider(provider))
+    server = make_server(cached)
+
+    await server.warm_up()
+
+    assert provider.query_calls == ["warm up"]
+    assert cached.cache_info()["size"] == 0
+    assert cached.hits == cached.misses == 0
+    assert all(histogram.count == 0 for histogram in cached.provider.histograms())
+
+
+@pytest.mark.asyncio
+async def test_warm_up_failures_are_not_raised():
+    class FailingProvider(FakeEmbeddingProvider):
+        async def embed_query(self, query: str) -> list[float]:
+            raise ConnectionError("Embedding API is unreachable")
+
+    server = make_server(FailingProvider())
+
+    timings = await server.warm_up()
+
+    assert set(timings) == {"embed_documents", "qdrant"}
+
+
+@pytest.mark.asyncio
+async def test_warm_up_runs_when_server_starts():
+    provider = FakeEmbeddingProvider()
+    server = make_server(provider, warmup=True)
+
+    async with Client(server) as client:
+        await client.list_tools()
+        for _ in range(100):
+            if provider.query_calls:
+                break
+            await asyncio.sleep(0.01)
+
+    assert provider.query_calls == ["warm up"]
+
+
+@pytest.mark.asyncio
+async def test_no_warm_up_by_default():
+    provider = FakeEmbeddingProvider()
+    server = make_server(provider)
+
+    async with Client(server) as client:
+        await client.list_tools()
+        await asyncio.sleep(0.05)
+
+    assert provider.query_calls == []
@@ -0,0 +1,230 @@
+import asyncio
+import shutil
+import time
+import uuid
+
+import pytest
+from fastmcp import Client
+from qdrant_client import models
+
+from mcp_server_qdrant.common.activity import ForegroundActivity
+from mcp_server_qdrant.indexer import (
+    CodebaseIndexer,
+    PendingChanges,
+    is_indexable,
+)
+from mcp_server_qdrant.mcp_server import QdrantMCPServer
+from mcp_server_qdrant.settings import IndexerSettings, QdrantSettings, ToolSettings
+from tests.conftest import write
+from tests.fake_embeddings import FakeEmbeddingProvider
+
+
+async def indexed_paths(connector) -> dict[str, int]:
+    if not await connector.collection_exists():
+        return {}
+    points, _ = await connector.client.scroll(
+        connector._default_collection_name, limit=1000, with_payload=True
+    )
+    counts: dict[str, int] = {}
+    for point in points:
+        counts[point.payload["filePath"]] = counts.get(point.payload["filePath"], 0) + 1
+    return counts
+
+
+async def eventually(check, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            result = await check()
+            if result:
+                return result
+        except AssertionError:
+            if time.monotonic() > deadline:
+                raise
+        if time.monotonic() > deadline:
+            raise AssertionError("Condition not met in time")
+        await asyncio.sleep(0.05)
+
+
+def test_is_indexable():
+    assert is_indexable("src/app.py", [".py"], ["node_modules"])
+    assert is_indexable("Makefile")
+    assert not is_indexable("src/app.js", [".py"])
+    assert not is_indexable(".git/config")
+    assert not is_indexable("src/.hidden.py")
+    assert not is_indexable("node_modules/lib/index.py", [".py"], ["node_modules"])
+
+
+def test_pending_changes_coalesce_and_overflow():
+    pending = PendingChanges(max_size=3)
+
+    pending.add(["a.py", "b.py"])
+    pending.add(["a.py"])
+    assert pending.paths == {"a.py", "b.py"}
+    taken = pending.take(1)
+    assert len(taken) == 1
+    assert pending.paths == {"a.py", "b.py"} - set(taken)
+
+    pending.add(["c.py", "d.py", "e.py"])
+    assert pending.rescan
+    assert pending.paths == set()
+    # Once a rescan is requested, further paths are covered by it
+    pending.add(["f.py"])
+    assert pending.paths == set()
+    assert pending
+
+
+@pytest.mark.asyncio
+async def test_foreground_activity_waits_for_requests():
+    foreground = ForegroundActivity()
+    assert await foreground.wait_idle()
+
+    with foreground.track():
+        assert not await foreground.wait_idle(max_wait=0.01)
+
+        async def finish_soon():
+            await asyncio.sleep(0.05)
+
+        waiter = asyncio.create_task(foreground.wait_idle(max_wait=5))
+        await finish_soon()
+        assert not waiter.done()
+    assert await waiter
+    assert foreground.active == 0
+
+
+@pytest.mark.asyncio
+async def test_sync_indexes_changed_and_removed_files(tmp_path, connector, embedding_provider):
+    write(tmp_path, "a.py", "a = 1\n")
+    write(tmp_path, "b.py", "b = 1\n")
+    indexer = CodebaseIndexer(
+        connector, tmp_path, chunk_size=3, chunk_overlap=0, extensions=[".py"]
+    )
+    await indexer.index()
+    embedding_provider.document_calls.clear()
+
+    write(tmp_path, "a.py", "a = 2\n")
+    (tmp_path / "b.py").unlink()
+    write(tmp_path, "notes.bin", "ignored")
+    stats = await indexer.sync(["a.py", "b.py", "notes.bin", "never_existed.py"])
+
+    assert stats.files_indexed == 1
+    assert stats.files_removed == 1
+    assert embedding_provider.document_calls == [["a = 2\n"]]
+    assert await indexed_paths(connector) == {"a.py": 1}
+
+
+@pytest.mark.asyncio
+async def test_watch_syncs_file_changes(tmp_path, connector):
+    pytest.importorskip("watchfiles")
+    write(tmp_path, "a.py", "a = 1\n")
+    indexer = CodebaseIndexer(
+        connector, tmp_path, chunk_size=3, chunk_overlap=0, extensions=[".py"]
+    )
+    stop_event = asyncio.Event()
+    task = asyncio.create_task(indexer.watch(debounce_ms=100, pause=0, stop_event=stop_event))
+    try:
+        await eventually(lambda: _has(connector, "a.py"))
+
+        write(tmp_path, "src/b.py", "b = 1\n")
+        write(tmp_path, "skipped.bin", "not indexed")
+        await eventually(lambda: _has(connector, "src/b.py"))
+
+        (tmp_path / "a.py").unlink()
+        await eventually(lambda: _lacks(connector, "a.py"))
+        assert await indexed_paths(connector) == {"src/b.py": 1}
+
+        # Removing a directory removes the chunks of its files
+        shutil.rmtree(tmp_path / "src")
+        await eventually(lambda: _lacks(connector, "src/b.py"))
+    finally:
+        stop_event.set()
+        await asyncio.wait_for(task, timeout=10)
+
+
+async def _has(connector, path: str) -> bool:
+    return path in await indexed_paths(connector)
+
+
+async def _lacks(connector, path: str) -> bool:
+    return path not in await indexed_paths(connector)
+
+
+@pytest.mark.asyncio
+async def test_watch_gives_way_to_searches(tmp_path, connector):
+    pytest.importorskip("watchfiles")
+    write(tmp_path, "a.py", "a = 1\n")
+    indexer = CodebaseIndexer(connector, tmp_path, chunk_size=3, chunk_overlap=0)
+    foreground = ForegroundActivity()
+    stop_event = asyncio.Event()
+    syncs = []
+    task = asyncio.create_task(
+        indexer.watch(
+            debounce_ms=50,
+            pause=0,
+            foreground=foreground,
+            max_foreground_wait=30,
+            stop_event=stop_event,
+            on_sync=syncs.append,
+        )
+    )
+    try:
+        await eventually(lambda: _has(connector, "a.py"))
+        with foreground.track():
+            write(tmp_path, "b.py", "b = 1\n")
+            # The change is detected, but not indexed while a search runs
+            await asyncio.sleep(1.0)
+            assert len(syncs) == 1
+        await eventually(lambda: _has(connector, "b.py"))
+    finally:
+        stop_event.set()
+        await asyncio.wait_for(task, timeout=10)
+
+
+@pytest.mark.asyncio
+async def test_server_watches_directory(tmp_path, monkeypatch):
+    pytest.importorskip("watchfiles")
+    write(tmp_path, "hello.py", "def hello():\n    return 'world'\n")
+    collection_name = f"test_{uuid.uuid4().hex}"
+    server = QdrantMCPServer(
+        tool_settings=ToolSettings(),
+        qdrant_settings=QdrantSettings(
+            QDRANT_URL=":memory:", COLLECTION_NAME=collection_name, QDRANT_SEARCH_CACHE_SIZE=16
+        ),
+        embedding_provider=FakeEmbeddingProvider(),
+        indexer_settings=IndexerSettings(
+            INDEX_WATCH_PATH=str(tmp_path), INDEX_WATCH_DEBOUNCE_MS=50
+        ),
+    )
+
+    invalidated = []
+    registry = server.qdrant_connector._collections
+    invalidate = registry.invalidate
+
+    def recording_invalidate(collection_name=None):
+        invalidated.append(collection_name)
+        invalidate(collection_name)
+
+    monkeypatch.setattr(registry, "invalidate", recording_invalidate)
+
+    async with Client(server) as client:
+
+        async def found(path: str):
+            result = await client.call_tool("qdrant-find", {"query": "return"})
+            return path in result.content[0].text
+
+        assert await eventually(lambda: found("hello.py"))
+        write(tmp_path, "bye.py", "def bye():\n    return 'moon'\n")
+        # The cached search results are invalidated once the file is indexed
+        assert await eventually(lambda: found("bye.py"))
+
+    points, _ = await server.qdrant_connector.client.scroll(
+        collection_name,
+        scroll_filter=models.Filter(
+            must=[models.FieldCondition(key="filePath", match=models.MatchValue(value="bye.py"))]
+        ),
+    )
+    assert len(points) == 1
+    # The server does not keep the collection metadata from before the syncs
+    assert collection_name in invalidated
+    # The indexing is not recorded among the stages of the tool calls
+    assert server.metrics.histogram("stage_duration_seconds", "", stage="upsert").count == 0